@@ -0,0 +1,45 @@
+import random
+
+from str8ts_solver.solver import solve
+from tests import samples
+
+SAMPLES = {
+    "sample_1": samples.SAMPLE_1,
+    "sample_2": samples.SAMPLE_2,
+    "sample_3": samples.SAMPLE_3,
+    "no_solution": samples.NO_SOLUTION,
+    "sample_3_by_2": samples.SAMPLE_3_BY_2,
+}
+
+Puzzle = tuple[tuple[int, int], set[tuple[int, int]], dict[tuple[int, int], int]]
+
+
+def _random_filled_grid(
+    rng: random.Random, size: tuple[int, int], blocked_ratio: float
+) -> tuple[set[tuple[int, int]], dict[tuple[int, int], int]]:
+    cells = [(x_pos, y_pos) for x_pos in range(size[0]) for y_pos in range(size[1])]
+    while True:
+        blocked = {_ for _ in cells if rng.random() < blocked_ratio}
+        free = [_ for _ in cells if _ not in blocked]
+        seeds = {
+            _: rng.randint(1, max(size)) for _ in rng.sample(free, len(free) // 20)
+        }
+        solved = solve(size, blocked, seeds)
+        if solved is not None:
+            return blocked, solved
+
+
+def random_puzzle(
+    size: tuple[int, int],
+    seed: int,
+    blocked_ratio: float = 0.2,
+    clue_ratio: float = 0.3,
+) -> Puzzle:
+    rng = random.Random(seed)  # nosec B311
+    blocked, solved = _random_filled_grid(rng, size, blocked_ratio)
+    known = {_: solved[_] for _ in sorted(solved) if rng.random() < clue_ratio}
+    return size, blocked, known
+
+
+def random_corpus(size: tuple[int, int], count: int, seed: int = 0) -> list[Puzzle]:
+    return [random_puzzle(size, seed + _) for _ in range(count)]
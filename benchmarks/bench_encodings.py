@@ -0,0 +1,54 @@
+"""
+compares the z3 encodings (int, bitvec, onehot) of the solver
+
+usage: python -m benchmarks.bench_encodings
+"""
+
+import argparse
+import statistics
+import time
+
+from str8ts_solver.solver import solve
+
+from . import _corpus
+
+_ENCODINGS = ("int", "bitvec", "onehot")
+
+
+def _time_solve(puzzle: _corpus.Puzzle, encoding: str, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        solve(*puzzle, encoding=encoding)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _gen_corpora(sizes: list[int], count: int):
+    for name, sample in _corpus.SAMPLES.items():
+        yield name, [(sample.size, sample.blocked, sample.known)]
+    for size in sizes:
+        yield f"random_{size}x{size}", _corpus.random_corpus((size, size), count)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[9, 12, 16])
+    parser.add_argument("--count", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    print(f"{'corpus':<16}" + "".join(f"{_:>12}" for _ in _ENCODINGS))
+    for name, corpus in _gen_corpora(args.sizes, args.count):
+        row = [
+            sum(_time_solve(_, encoding, args.repeat) for _ in corpus) / len(corpus)
+            for encoding in _ENCODINGS
+        ]
+        print(f"{name:<16}" + "".join(f"{1000 * _:>10.2f}ms" for _ in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+measures the throughput of str8ts_solver.generator
+
+usage: python -m benchmarks.bench_generator
+"""
+
+import argparse
+import time
+
+from str8ts_solver.generator import generate_many
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[6, 9, 12])
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    for size in args.sizes:
+        start = time.perf_counter()
+        puzzles = list(
+            generate_many((size, size), args.count, args.seed, workers=args.workers)
+        )
+        duration = time.perf_counter() - start
+        clues = sum(len(_.known) for _ in puzzles) / len(puzzles)
+        print(
+            f"{size}x{size}: {len(puzzles) / duration:.2f} puzzles/s,"
+            f" {clues:.1f} clues on average"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+measures where the time inside solve goes: building the z3 model,
+solver.check(), reading the model back and validating the solution
+
+usage: python -m benchmarks.bench_phases --output phases.json
+"""
+
+import argparse
+import json
+import math
+import time
+
+import z3  # type: ignore
+
+from str8ts_solver import _check_solution as cs
+from str8ts_solver import _z3_solver as zs
+from str8ts_solver.generator import generate
+
+from . import _corpus
+
+_PHASES = ("create_solver", "check", "read_solution", "is_solution_valid")
+
+_DIFFICULTIES = {"easy": 0.45, "medium": 0.3, "hard": 0.0}
+
+
+def _time_phases(puzzle: _corpus.Puzzle, encoding: str) -> dict[str, float]:
+    size, blocked, known = puzzle
+    times = dict.fromkeys(_PHASES, 0.0)
+    start = time.perf_counter()
+    z3_encoding, unknowns, solver = zs.create_solver(size, blocked, known, encoding)
+    times["create_solver"] = time.perf_counter() - start
+    start = time.perf_counter()
+    is_sat = solver.check() == z3.sat
+    times["check"] = time.perf_counter() - start
+    if is_sat:
+        start = time.perf_counter()
+        solved = zs.read_solution(z3_encoding, unknowns, solver)
+        times["read_solution"] = time.perf_counter() - start
+        start = time.perf_counter()
+        cs.is_solution_valid(size, blocked, known, solved)
+        times["is_solution_valid"] = time.perf_counter() - start
+    return times
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def _summarize(values: list[float]) -> dict[str, float]:
+    return {
+        "median": _percentile(values, 0.5),
+        "p95": _percentile(values, 0.95),
+        "p99": _percentile(values, 0.99),
+        "total": sum(values),
+    }
+
+
+def _generated_corpus(
+    size: int, difficulty: str, count: int, seed: int
+) -> list[_corpus.Puzzle]:
+    min_clues = int(_DIFFICULTIES[difficulty] * size * size)
+    res = []
+    for _ in range(count):
+        puzzle = generate((size, size), seed + _, min_clues=min_clues)
+        res.append((puzzle.size, puzzle.blocked, puzzle.known))
+    return res
+
+
+def _gen_corpora(args: argparse.Namespace):
+    yield "samples", [(_.size, _.blocked, _.known) for _ in _corpus.SAMPLES.values()]
+    for size in args.sizes:
+        for difficulty in args.difficulties:
+            yield f"{size}x{size}_{difficulty}", _generated_corpus(
+                size, difficulty, args.count, args.seed
+            )
+
+
+def _run_corpus(corpus: list[_corpus.Puzzle], encoding: str) -> dict:
+    measured = [_time_phases(_, encoding) for _ in corpus]
+    totals = [sum(_.values()) for _ in measured]
+    return {
+        "count": len(corpus),
+        "puzzles_per_second": len(corpus) / sum(totals),
+        "phases": {
+            phase: _summarize([_[phase] for _ in measured]) for phase in _PHASES
+        },
+        "solve": _summarize(totals),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[6, 9])
+    parser.add_argument(
+        "--difficulties",
+        nargs="*",
+        choices=sorted(_DIFFICULTIES),
+        default=list(_DIFFICULTIES),
+    )
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--encoding", default="int")
+    parser.add_argument("--output", default=None, help="path of the JSON report")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    report = {"encoding": args.encoding, "corpora": {}}
+    print(f"{'corpus':<16}{'puzzles/s':>10}" + "".join(f"{_:>20}" for _ in _PHASES))
+    for name, corpus in _gen_corpora(args):
+        result = _run_corpus(corpus, args.encoding)
+        report["corpora"][name] = result
+        print(
+            f"{name:<16}{result['puzzles_per_second']:>10.1f}"
+            + "".join(
+                f"{1000 * result['phases'][_]['median']:>9.2f}"
+                f"/{1000 * result['phases'][_]['p99']:>8.2f}ms"
+                for _ in _PHASES
+            )
+        )
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
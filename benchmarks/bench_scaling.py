@@ -0,0 +1,118 @@
+"""
+measures how the solve time and the z3 memory grow with the grid size,
+up to 25x25, on puzzles which are solvable by construction:
+the cells of the cyclic square (x + y) % n + 1 holding n are blocked
+(so every row and column splits into straights), further cells are blocked
+at random and a random part of the remaining values is kept as clues.
+Every solve runs in a fresh process, so the reported z3 peak memory
+belongs to that puzzle alone.
+
+usage: python -m benchmarks.bench_scaling --output scaling.json
+"""
+
+import argparse
+import concurrent.futures
+import json
+import random
+
+from str8ts_solver.solver import solve_detailed
+
+from . import _corpus
+
+_PHASES = ("precheck", "create_solver", "check", "read_solution", "is_solution_valid")
+
+_BAR_WIDTH = 40
+
+
+def _solvable_puzzle(
+    size: int, blocked_ratio: float, clue_ratio: float, seed: int
+) -> _corpus.Puzzle:
+    rng = random.Random(seed + size)  # nosec B311
+    solved = {
+        (x_pos, y_pos): (x_pos + y_pos) % size + 1
+        for x_pos in range(size)
+        for y_pos in range(size)
+    }
+    blocked = {
+        pos
+        for pos, value in solved.items()
+        if value == size or rng.random() < blocked_ratio
+    }
+    known = {
+        pos: value
+        for pos, value in solved.items()
+        if pos not in blocked and rng.random() < clue_ratio
+    }
+    return (size, size), blocked, known
+
+
+def _measure(puzzle: _corpus.Puzzle, encoding: str, timeout_ms: int) -> dict:
+    result = solve_detailed(*puzzle, encoding=encoding, timeout_ms=timeout_ms)
+    if result.status not in ("sat", "unknown"):
+        raise RuntimeError(f"Solvable puzzle reported as {result.status}")
+    return {
+        "status": result.status,
+        "phases": {_: result.timings.get(_, 0.0) for _ in _PHASES},
+        "total": sum(result.timings.values()),
+        "memory_mb": result.memory,
+        "num_constraints": result.num_constraints,
+        "num_variables": result.num_variables,
+    }
+
+
+def _bar(value: float, limit: float) -> str:
+    return "#" * round(_BAR_WIDTH * value / limit) if limit else ""
+
+
+def _print_plot(title: str, rows: list[tuple[str, float]], unit: str) -> None:
+    limit = max((_[1] for _ in rows), default=0.0)
+    print(title)
+    for label, value in rows:
+        print(f"{label:>16} {value:>10.1f}{unit} {_bar(value, limit)}")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[6, 9, 12, 16, 20, 25])
+    parser.add_argument("--encodings", nargs="*", default=["auto", "int"])
+    parser.add_argument("--blocked-ratio", type=float, default=0.1)
+    parser.add_argument("--clue-ratio", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout-ms", type=int, default=60_000)
+    parser.add_argument("--output", default=None, help="path of the JSON report")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    report: dict[str, dict] = {_: {} for _ in args.encodings}
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=1, max_tasks_per_child=1
+    ) as executor:
+        for size in args.sizes:
+            puzzle = _solvable_puzzle(
+                size, args.blocked_ratio, args.clue_ratio, args.seed
+            )
+            for encoding in args.encodings:
+                report[encoding][str(size)] = executor.submit(
+                    _measure, puzzle, encoding, args.timeout_ms
+                ).result()
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    for encoding, measured in report.items():
+        labels = [f"{_}x{_} {measured[_]['status']}" for _ in measured]
+        _print_plot(
+            f"{encoding}: time",
+            list(zip(labels, (1000 * _["total"] for _ in measured.values()))),
+            "ms",
+        )
+        _print_plot(
+            f"{encoding}: z3 peak memory",
+            list(zip(labels, (_["memory_mb"] for _ in measured.values()))),
+            "MB",
+        )
+
+
+if __name__ == "__main__":
+    main()
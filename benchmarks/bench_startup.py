@@ -0,0 +1,65 @@
+"""
+measures the import time of the entry points of str8ts_solver
+and fails if the rendering or validation ones import z3
+
+usage: python -m benchmarks.bench_startup
+"""
+
+import argparse
+import subprocess  # nosec B404
+import sys
+
+_ENTRY_POINTS = {
+    "str8ts_solver": False,
+    "str8ts_solver.output_utils": False,
+    "str8ts_solver._check_solution": False,
+    "str8ts_solver.text_format": False,
+    "str8ts_solver.cli": False,
+    "str8ts_solver.solver": False,
+    "str8ts_solver._z3_solver": True,
+    "str8ts_solver.generator": True,
+}
+
+
+def _parse_row(line: str) -> tuple[str, int]:
+    _, cumulative, name = line.removeprefix("import time:").split("|")
+    return name.strip(), int(cumulative)
+
+
+def _measure(module: str) -> tuple[float, bool]:
+    res = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    rows = dict(
+        _parse_row(_)
+        for _ in res.stderr.splitlines()
+        if _.startswith("import time:") and "cumulative" not in _
+    )
+    return rows[module] / 1000, "z3" in rows
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    failed = []
+    for module, may_import_z3 in _ENTRY_POINTS.items():
+        measured = [_measure(module) for _ in range(args.repeat)]
+        imports_z3 = any(_[1] for _ in measured)
+        note = " (imports z3)" if imports_z3 else ""
+        print(f"{module:<32}{min(_[0] for _ in measured):>8.1f}ms{note}")
+        if imports_z3 and not may_import_z3:
+            failed.append(module)
+    if failed:
+        sys.exit(f"z3 is imported by: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 
 set -euo pipefail
 
-declare -ar DIRS=("str8ts_solver/" "tests/" "examples/")
+declare -ar DIRS=("str8ts_solver/" "tests/" "examples/" "benchmarks/")
 
 uv run bandit -c bandit.yml -r "${DIRS[@]}"
 uv run black --check "${DIRS[@]}"
@@ -0,0 +1,113 @@
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from ._check_solution import is_grid_valid, is_solution_valid
+    from .async_solver import solve_async, solve_many_async
+    from .canonical import CanonicalCache, canonicalize
+    from .generator import GeneratedPuzzle, generate, generate_many
+    from .grid import Grid, Puzzle
+    from .output_utils import puzzle_to_string, to_string
+    from .partial_validation import PartialGridValidator
+    from .rating import Rating, rate, rate_many
+    from .session import Session
+    from .solution_store import SolutionStore
+    from .solver import (
+        BatchResult,
+        SolverCache,
+        SolveResult,
+        SolveTimeoutError,
+        count_solutions,
+        has_unique_solution,
+        iter_solutions,
+        solve,
+        solve_detailed,
+        solve_many,
+        solve_puzzle,
+    )
+    from .steps import Step, StepEngine
+    from .text_format import iter_puzzles, write_solutions
+
+_EXPORTS = {
+    "is_grid_valid": "_check_solution",
+    "is_solution_valid": "_check_solution",
+    "solve_async": "async_solver",
+    "solve_many_async": "async_solver",
+    "CanonicalCache": "canonical",
+    "canonicalize": "canonical",
+    "GeneratedPuzzle": "generator",
+    "generate": "generator",
+    "generate_many": "generator",
+    "Grid": "grid",
+    "Puzzle": "grid",
+    "puzzle_to_string": "output_utils",
+    "to_string": "output_utils",
+    "PartialGridValidator": "partial_validation",
+    "Session": "session",
+    "Rating": "rating",
+    "rate": "rating",
+    "rate_many": "rating",
+    "SolutionStore": "solution_store",
+    "BatchResult": "solver",
+    "SolverCache": "solver",
+    "SolveResult": "solver",
+    "SolveTimeoutError": "solver",
+    "count_solutions": "solver",
+    "has_unique_solution": "solver",
+    "iter_solutions": "solver",
+    "solve": "solver",
+    "solve_detailed": "solver",
+    "solve_many": "solver",
+    "solve_puzzle": "solver",
+    "Step": "steps",
+    "StepEngine": "steps",
+    "iter_puzzles": "text_format",
+    "write_solutions": "text_format",
+}
+
+__all__ = [
+    "BatchResult",
+    "CanonicalCache",
+    "GeneratedPuzzle",
+    "Grid",
+    "PartialGridValidator",
+    "Puzzle",
+    "Rating",
+    "Session",
+    "SolutionStore",
+    "SolveResult",
+    "SolveTimeoutError",
+    "SolverCache",
+    "Step",
+    "StepEngine",
+    "canonicalize",
+    "count_solutions",
+    "generate",
+    "generate_many",
+    "has_unique_solution",
+    "is_grid_valid",
+    "is_solution_valid",
+    "iter_puzzles",
+    "iter_solutions",
+    "puzzle_to_string",
+    "rate",
+    "rate_many",
+    "solve",
+    "solve_async",
+    "solve_detailed",
+    "solve_many",
+    "solve_many_async",
+    "solve_puzzle",
+    "to_string",
+    "write_solutions",
+]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
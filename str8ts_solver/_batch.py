@@ -0,0 +1,59 @@
+import collections
+import concurrent.futures
+import itertools
+import os
+import typing
+
+
+def _run_chunk(func, chunk, options: dict[str, typing.Any]) -> list:
+    return [func(item_num, item, options) for item_num, item in chunk]
+
+
+def _gen_chunks(items, chunksize: int):
+    numbered = enumerate(items)
+    while chunk := list(itertools.islice(numbered, chunksize)):
+        yield chunk
+
+
+def _gen_ordered(executor, func, chunks, max_pending: int, options):
+    pending: collections.deque = collections.deque()
+    for chunk in chunks:
+        pending.append(executor.submit(_run_chunk, func, chunk, options))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def _gen_unordered(executor, func, chunks, max_pending: int, options):
+    pending = set()
+    for chunk in chunks:
+        pending.add(executor.submit(_run_chunk, func, chunk, options))
+        if len(pending) >= max_pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for _ in done:
+                yield from _.result()
+    for _ in concurrent.futures.as_completed(pending):
+        yield from _.result()
+
+
+def map_items(  # pylint: disable=too-many-arguments
+    func,
+    items: typing.Iterable,
+    options: dict[str, typing.Any],
+    *,
+    workers: int | None,
+    chunksize: int,
+    ordered: bool,
+) -> typing.Iterator:
+    workers = workers or os.cpu_count() or 1
+    gen_results = _gen_ordered if ordered else _gen_unordered
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield from gen_results(
+            executor, func, _gen_chunks(items, chunksize), 2 * workers, options
+        )
+    finally:
+        executor.shutdown(cancel_futures=True)
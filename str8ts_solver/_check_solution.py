@@ -1,7 +1,8 @@
 import itertools
+import typing
 
-from . import _active_cells_utils as au
-from . import _str8ts_utils as su
+from . import _layout_index as li
+from . import grid as gr
 
 
 def _non_blocked_known_are_same_as_in_solved(
@@ -18,84 +19,77 @@ def _is_valid_str8ts_block(values: list[int]) -> bool:
 
 
 def _elements_in_blocks_are_distinct_and_consecutive(
-    size: tuple[int, int],
-    solved: dict[tuple[int, int], int],
+    index: li.LayoutIndex, solved: dict[tuple[int, int], int]
 ) -> bool:
     return all(
         _is_valid_str8ts_block([solved[_] for _ in cur_block])
-        for cur_block in itertools.chain(
-            su.gen_horizontal_blocks(size, solved), su.gen_vertical_blocks(size, solved)
-        )
+        for cur_block in index.compartments
     )
 
 
-def _elements_in_row_are_distinct(
-    row_num: int,
-    row_len: int,
-    blocked: set[tuple[int, int]],
+def _elements_in_every_line_are_distinct(
+    lines: tuple[tuple[tuple[int, int], ...], ...],
     solved: dict[tuple[int, int], int],
 ) -> bool:
-    values = [solved[_] for _ in au.gen_positions_in_row(row_num, row_len, blocked)]
-    return len(set(values)) == len(values)
+    for line in lines:
+        values = [solved[_] for _ in line]
+        if len(set(values)) != len(values):
+            return False
+    return True
 
 
-def _elements_in_every_row_are_distinct(
-    size: tuple[int, int],
-    blocked: set[tuple[int, int]],
+def _line_values(
+    lines: tuple[tuple[tuple[int, int], ...], ...],
     solved: dict[tuple[int, int], int],
-) -> bool:
-    return all(
-        _elements_in_row_are_distinct(_, size[0], blocked, solved)
-        for _ in range(size[1])
-    )
+) -> list[set[int]]:
+    return [{solved[_] for _ in line} for line in lines]
 
 
-def _elements_in_column_are_distinct(
-    col_num: int,
-    col_len: int,
-    blocked: set[tuple[int, int]],
-    solved: dict[tuple[int, int], int],
-) -> bool:
-    values = [solved[_] for _ in au.gen_positions_in_col(col_num, col_len, blocked)]
-    return len(set(values)) == len(values)
-
-
-def _elements_in_every_column_are_distinct(
-    size: tuple[int, int],
+def _solved_are_different_than_known_blocked(
+    index: li.LayoutIndex,
     blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
     solved: dict[tuple[int, int], int],
 ) -> bool:
+    blocked_clues = [(_, known[_]) for _ in blocked if _ in known]
+    if not blocked_clues:
+        return True
+    row_values = _line_values(index.rows, solved)
+    col_values = _line_values(index.cols, solved)
     return all(
-        _elements_in_column_are_distinct(_, size[1], blocked, solved)
-        for _ in range(size[0])
+        value not in row_values[y_pos] and value not in col_values[x_pos]
+        for (x_pos, y_pos), value in blocked_clues
     )
 
 
-def _solved_are_different_than_known_blocked(
-    size: tuple[int, int],
+def _all_values_are_in_range(size: tuple[int, int], solved: dict[tuple[int, int], int]):
+    return all(0 < _ <= max(size) for _ in solved.values())
+
+
+def _exactly_unknowns_are_solved(
+    index: li.LayoutIndex,
     blocked: set[tuple[int, int]],
-    known: dict[tuple[int, int], int],
     solved: dict[tuple[int, int], int],
 ) -> bool:
-    return all(
-        all(
-            solved[_] != known[blocked_pos]
-            for _ in au.gen_position_in_this_col_row(blocked_pos, size, blocked)
-        )
-        for blocked_pos in blocked & set(known)
-    )
+    return all(_ in solved for _ in index.cells) and blocked.isdisjoint(solved)
 
 
-def _all_values_are_in_range(size: tuple[int, int], solved: dict[tuple[int, int], int]):
-    return all(0 < _ <= max(size) for _ in solved.values())
+def _is_position_valid(pos: tuple[int, int], size: tuple[int, int]) -> bool:
+    return all(0 <= _p < _s for _p, _s in zip(pos, size, strict=True))
 
 
-def _all_unknowns_are_solved(
+def is_input_valid(
     size: tuple[int, int],
     blocked: set[tuple[int, int]],
-    solved: dict[tuple[int, int], int],
+    known: dict[tuple[int, int], int],
 ) -> bool:
-    return all(_ in solved for _ in su.gen_unknowns_positions(size, blocked))
+    if min(size) <= 0:
+        return False
+    if not all(_is_position_valid(_, size) for _ in itertools.chain(blocked, known)):
+        return False
+    if not all(0 < _ <= max(size) for _ in known.values()):
+        return False
+    return True
 
 
 def is_solution_valid(
@@ -104,12 +98,64 @@ def is_solution_valid(
     known: dict[tuple[int, int], int],
     solved: dict[tuple[int, int], int],
 ) -> bool:
+    index = li.get_layout_index(size, blocked)
     return (
         _non_blocked_known_are_same_as_in_solved(known, solved)
         and _all_values_are_in_range(size, solved)
-        and _all_unknowns_are_solved(size, blocked, solved)
-        and _solved_are_different_than_known_blocked(size, blocked, known, solved)
-        and _elements_in_blocks_are_distinct_and_consecutive(size, solved)
-        and _elements_in_every_column_are_distinct(size, blocked, solved)
-        and _elements_in_every_row_are_distinct(size, blocked, solved)
+        and _exactly_unknowns_are_solved(index, blocked, solved)
+        and _solved_are_different_than_known_blocked(index, blocked, known, solved)
+        and _elements_in_blocks_are_distinct_and_consecutive(index, solved)
+        and _elements_in_every_line_are_distinct(index.cols, solved)
+        and _elements_in_every_line_are_distinct(index.rows, solved)
+    )
+
+
+def _gen_compartments(
+    puzzle: gr.Puzzle, grid: gr.Grid, indices: range
+) -> typing.Iterator[list[int]]:
+    cur_compartment: list[int] = []
+    for _ in indices:
+        if puzzle.cells[_] & gr.BLOCKED:
+            if cur_compartment:
+                yield cur_compartment
+            cur_compartment = []
+        else:
+            cur_compartment.append(grid.values[_])
+    if cur_compartment:
+        yield cur_compartment
+
+
+def _is_line_valid(puzzle: gr.Puzzle, grid: gr.Grid, indices: range) -> bool:
+    compartments = list(_gen_compartments(puzzle, grid, indices))
+    values_mask = 0
+    for _ in itertools.chain.from_iterable(compartments):
+        values_mask |= 1 << _
+    allowed_mask = ((1 << max(puzzle.size)) - 1) << 1
+    return (
+        values_mask.bit_count() == sum(len(_) for _ in compartments)
+        and values_mask & ~allowed_mask == 0
+        and values_mask & puzzle.blocked_clues_mask(indices) == 0
+        and all(max(_) - min(_) + 1 == len(_) for _ in compartments)
+    )
+
+
+def _grid_matches_puzzle(puzzle: gr.Puzzle, grid: gr.Grid) -> bool:
+    return all(
+        value == 0 if cell & gr.BLOCKED else (cell & gr.VALUE_MASK) in (0, value)
+        for cell, value in zip(puzzle.cells, grid.values, strict=True)
+    )
+
+
+def is_grid_valid(puzzle: gr.Puzzle, grid: gr.Grid) -> bool:
+    return (
+        puzzle.size == grid.size
+        and _grid_matches_puzzle(puzzle, grid)
+        and all(
+            _is_line_valid(puzzle, grid, puzzle.row_indices(_))
+            for _ in range(puzzle.height)
+        )
+        and all(
+            _is_line_valid(puzzle, grid, puzzle.col_indices(_))
+            for _ in range(puzzle.width)
+        )
     )
@@ -0,0 +1,63 @@
+import functools
+import typing
+
+from . import _active_cells_utils as au
+from . import _str8ts_utils as su
+
+_Positions = tuple[tuple[int, int], ...]
+
+
+class LayoutIndex(typing.NamedTuple):
+    size: tuple[int, int]
+    cells: _Positions
+    rows: tuple[_Positions, ...]
+    cols: tuple[_Positions, ...]
+    horizontal: tuple[_Positions, ...]
+    vertical: tuple[_Positions, ...]
+    compartments_of: dict[tuple[int, int], tuple[int, ...]]
+
+    @property
+    def compartments(self) -> tuple[_Positions, ...]:
+        return self.horizontal + self.vertical
+
+    def peers(self, pos: tuple[int, int]) -> _Positions:
+        return self.rows[pos[1]] + self.cols[pos[0]]
+
+
+def _to_compartments_of(
+    cells: _Positions, compartments: tuple[_Positions, ...]
+) -> dict[tuple[int, int], tuple[int, ...]]:
+    res: dict[tuple[int, int], list[int]] = {_: [] for _ in cells}
+    for num, compartment in enumerate(compartments):
+        for _ in compartment:
+            res[_].append(num)
+    return {pos: tuple(nums) for pos, nums in res.items()}
+
+
+@functools.lru_cache(maxsize=256)
+def _make_layout_index(
+    size: tuple[int, int], blocked: frozenset[tuple[int, int]]
+) -> LayoutIndex:
+    cells = tuple(su.gen_unknowns_positions(size, blocked))
+    cell_set = frozenset(cells)
+    horizontal = tuple(map(tuple, su.gen_horizontal_blocks(size, cell_set)))
+    vertical = tuple(map(tuple, su.gen_vertical_blocks(size, cell_set)))
+    return LayoutIndex(
+        size=size,
+        cells=cells,
+        rows=tuple(
+            tuple(au.gen_positions_in_row(_, size[0], blocked)) for _ in range(size[1])
+        ),
+        cols=tuple(
+            tuple(au.gen_positions_in_col(_, size[1], blocked)) for _ in range(size[0])
+        ),
+        horizontal=horizontal,
+        vertical=vertical,
+        compartments_of=_to_compartments_of(cells, horizontal + vertical),
+    )
+
+
+def get_layout_index(
+    size: tuple[int, int], blocked: typing.AbstractSet[tuple[int, int]]
+) -> LayoutIndex:
+    return _make_layout_index((size[0], size[1]), frozenset(blocked))
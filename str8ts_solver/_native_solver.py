@@ -0,0 +1,64 @@
+import time
+
+from . import _propagation as pr
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+def _select_cell(domains: list[int]) -> int | None:
+    best_cell = None
+    best_count = 0
+    for cell, domain in enumerate(domains):
+        count = domain.bit_count()
+        if count > 1 and (best_cell is None or count < best_count):
+            best_cell = cell
+            best_count = count
+            if count == 2:
+                break
+    return best_cell
+
+
+def _search(
+    layout: pr.Layout, domains: list[int], deadline: float | None
+) -> list[int] | None:
+    if deadline is not None and time.monotonic() > deadline:
+        raise SearchTimeout
+    try:
+        pr.propagate(layout, domains)
+    except pr.Contradiction:
+        return None
+    cell = _select_cell(domains)
+    if cell is None:
+        return domains
+    for value in pr.gen_values(domains[cell]):
+        new_domains = domains.copy()
+        new_domains[cell] = 1 << value
+        res = _search(layout, new_domains, deadline)
+        if res is not None:
+            return res
+    return None
+
+
+def solve(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+    timeout_ms: int | None = None,
+) -> dict[tuple[int, int], int] | None:
+    deadline = None
+    if timeout_ms is not None:
+        deadline = time.monotonic() + timeout_ms / 1000
+    layout = pr.make_layout(size, blocked)
+    try:
+        domains = pr.initial_domains(layout, size, blocked, known)
+    except pr.Contradiction:
+        return None
+    res = _search(layout, domains, deadline)
+    if res is None:
+        return None
+    return {
+        pos: domain.bit_length() - 1
+        for pos, domain in zip(layout.cells, res, strict=True)
+    }
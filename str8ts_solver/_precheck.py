@@ -0,0 +1,60 @@
+import bisect
+import collections
+
+_Clue = tuple[int, int, int]
+
+
+def _to_walls(blocked: list[tuple[int, int]]) -> dict[int, list[int]]:
+    res = collections.defaultdict(list)
+    for line, pos in sorted(blocked):
+        res[line].append(pos)
+    return res
+
+
+def _find_compartment(walls: list[int], length: int, pos: int) -> tuple[int, int]:
+    num = bisect.bisect(walls, pos)
+    start = walls[num - 1] + 1 if num else 0
+    end = walls[num] if num < len(walls) else length
+    return num, end - start
+
+
+def _find_in_lines(
+    length: int,
+    blocked: list[tuple[int, int]],
+    blocked_clues: set[tuple[int, int]],
+    clues: list[_Clue],
+) -> str | None:
+    walls = _to_walls(blocked)
+    seen: set[tuple[int, int]] = set()
+    spans: dict[tuple[int, int], tuple[int, int]] = {}
+    for line, pos, value in clues:
+        if (line, value) in seen:
+            return "duplicate"
+        if (line, value) in blocked_clues:
+            return "blocked_clue"
+        seen.add((line, value))
+        num, compartment_length = _find_compartment(walls[line], length, pos)
+        low, high = spans.get((line, num), (value, value))
+        spans[line, num] = (min(low, value), max(high, value))
+        if max(high, value) - min(low, value) >= compartment_length:
+            return "compartment_span"
+    return None
+
+
+def find_contradiction(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> str | None:
+    clues = [(pos, value) for pos, value in known.items() if pos not in blocked]
+    blocked_clues = [(pos, known[pos]) for pos in blocked if pos in known]
+    for axis, line, pos in (("row", 1, 0), ("column", 0, 1)):
+        reason = _find_in_lines(
+            size[pos],
+            [(_[line], _[pos]) for _ in blocked],
+            {(_[line], value) for _, value in blocked_clues},
+            [(_[line], _[pos], value) for _, value in clues],
+        )
+        if reason is not None:
+            return f"{reason}_in_{axis}"
+    return None
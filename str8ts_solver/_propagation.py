@@ -0,0 +1,229 @@
+import functools
+import typing
+
+from . import _layout_index as li
+
+
+class Contradiction(Exception):
+    pass
+
+
+class Layout(typing.NamedTuple):
+    value_limit: int
+    cells: list[tuple[int, int]]
+    cell_index: dict[tuple[int, int], int]
+    lines: list[list[int]]
+    compartments: list[list[int]]
+    compartment_rests: list[list[int]]
+    line_compartments: list[list[int]]
+    cell_lines: list[list[int]]
+    cell_compartments: list[list[int]]
+    peers: list[list[int]]
+
+
+def _to_indices(index: dict[tuple[int, int], int], positions) -> list[int]:
+    return [index[_] for _ in positions]
+
+
+def _compartment_rest(
+    layout_index: li.LayoutIndex, block: tuple[tuple[int, int], ...]
+) -> typing.Iterator[tuple[int, int]]:
+    if block[0][1] == block[-1][1]:
+        line = layout_index.rows[block[0][1]]
+    else:
+        line = layout_index.cols[block[0][0]]
+    return (_ for _ in line if _ not in block)
+
+
+def _to_cell_groups(num_cells: int, groups: list[list[int]]) -> list[list[int]]:
+    res: list[list[int]] = [[] for _ in range(num_cells)]
+    for num, group in enumerate(groups):
+        for cell in group:
+            res[cell].append(num)
+    return res
+
+
+def _to_line_compartments(
+    lines: list[list[int]],
+    compartments: list[list[int]],
+    cell_lines: list[list[int]],
+) -> list[list[int]]:
+    res: list[list[int]] = [[] for _ in lines]
+    for num, compartment in enumerate(compartments):
+        shared = set(cell_lines[compartment[0]])
+        for cell in compartment[1:]:
+            shared &= set(cell_lines[cell])
+        for _ in sorted(shared):
+            res[_].append(num)
+    return res
+
+
+def _to_peers(num_cells: int, lines: list[list[int]]) -> list[list[int]]:
+    res: list[list[int]] = [[] for _ in range(num_cells)]
+    for line in lines:
+        for cell in line:
+            res[cell].extend(_ for _ in line if _ != cell)
+    return res
+
+
+@functools.lru_cache(maxsize=256)
+def _make_layout(size: tuple[int, int], blocked: frozenset[tuple[int, int]]) -> Layout:
+    layout_index = li.get_layout_index(size, blocked)
+    cells = list(layout_index.cells)
+    index = {pos: num for num, pos in enumerate(cells)}
+    lines = [
+        _to_indices(index, _)
+        for _ in layout_index.rows + layout_index.cols
+        if len(_) > 1
+    ]
+    compartments = [_to_indices(index, _) for _ in layout_index.compartments]
+    cell_lines = _to_cell_groups(len(cells), lines)
+    return Layout(
+        value_limit=max(layout_index.size),
+        cells=cells,
+        cell_index=index,
+        lines=lines,
+        compartments=compartments,
+        compartment_rests=[
+            _to_indices(index, _compartment_rest(layout_index, block))
+            for block in layout_index.compartments
+        ],
+        line_compartments=_to_line_compartments(lines, compartments, cell_lines),
+        cell_lines=cell_lines,
+        cell_compartments=_to_cell_groups(len(cells), compartments),
+        peers=_to_peers(len(cells), lines),
+    )
+
+
+def make_layout(size: tuple[int, int], blocked: set[tuple[int, int]]) -> Layout:
+    return _make_layout((size[0], size[1]), frozenset(blocked))
+
+
+def full_mask(value_limit: int) -> int:
+    return ((1 << value_limit) - 1) << 1
+
+
+def gen_values(mask: int) -> typing.Iterator[int]:
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def initial_domains(
+    layout: Layout,
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> list[int]:
+    domains = [full_mask(layout.value_limit)] * len(layout.cells)
+    for pos, value in known.items():
+        if pos in blocked:
+            for _ in li.get_layout_index(size, blocked).peers(pos):
+                domains[layout.cell_index[_]] &= ~(1 << value)
+    for pos, value in known.items():
+        if pos not in blocked:
+            domains[layout.cell_index[pos]] &= 1 << value
+    if not all(domains):
+        raise Contradiction
+    return domains
+
+
+def _restrict(domains: list[int], cell: int, mask: int) -> bool:
+    old_domain = domains[cell]
+    new_domain = old_domain & mask
+    if new_domain == old_domain:
+        return False
+    if not new_domain:
+        raise Contradiction
+    domains[cell] = new_domain
+    return True
+
+
+def _propagate_singles(domains: list[int], line: list[int]) -> bool:
+    changed = False
+    for cell in line:
+        domain = domains[cell]
+        if domain & (domain - 1) == 0:
+            for _ in line:
+                if _ != cell:
+                    changed |= _restrict(domains, _, ~domain)
+    return changed
+
+
+def straight_ranges(
+    domains: list[int], compartment: list[int], value_limit: int
+) -> tuple[int, int]:
+    range_mask = (1 << len(compartment)) - 1
+    union = 0
+    for _ in compartment:
+        union |= domains[_]
+    possible = 0
+    required = full_mask(value_limit)
+    for start in range(1, value_limit - len(compartment) + 2):
+        cur_range = range_mask << start
+        if union & cur_range == cur_range and all(
+            domains[_] & cur_range for _ in compartment
+        ):
+            possible |= cur_range
+            required &= cur_range
+    if not possible:
+        raise Contradiction
+    return possible, required
+
+
+def _propagate_compartment(
+    domains: list[int], compartment: list[int], rest: list[int], value_limit: int
+) -> tuple[bool, int]:
+    possible, required = straight_ranges(domains, compartment, value_limit)
+    changed = False
+    for _ in compartment:
+        changed |= _restrict(domains, _, possible)
+    for _ in rest:
+        changed |= _restrict(domains, _, ~required)
+    return changed, required
+
+
+def _propagate_hidden_singles(
+    domains: list[int], line: list[int], required: int
+) -> bool:
+    once = twice = 0
+    for cell in line:
+        twice |= once & domains[cell]
+        once |= domains[cell]
+    if required & ~once:
+        raise Contradiction
+    changed = False
+    for value in gen_values(required & ~twice):
+        mask = 1 << value
+        holder = next((_ for _ in line if domains[_] & mask), None)
+        if holder is None:
+            raise Contradiction
+        changed |= _restrict(domains, holder, mask)
+    return changed
+
+
+def _propagate_once(layout: Layout, domains: list[int]) -> bool:
+    changed = False
+    for line in layout.lines:
+        changed |= _propagate_singles(domains, line)
+    required = []
+    for compartment, rest in zip(
+        layout.compartments, layout.compartment_rests, strict=True
+    ):
+        compartment_changed, compartment_required = _propagate_compartment(
+            domains, compartment, rest, layout.value_limit
+        )
+        changed |= compartment_changed
+        required.append(compartment_required)
+    for line, compartments in zip(layout.lines, layout.line_compartments, strict=True):
+        line_required = 0
+        for _ in compartments:
+            line_required |= required[_]
+        changed |= _propagate_hidden_singles(domains, line, line_required)
+    return changed
+
+
+def propagate(layout: Layout, domains: list[int]) -> None:
+    while _propagate_once(layout, domains):
+        pass
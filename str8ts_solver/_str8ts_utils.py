@@ -3,7 +3,7 @@ import typing
 
 
 def gen_unknowns_positions(
-    size: tuple[int, int], blocked: set[tuple[int, int]]
+    size: tuple[int, int], blocked: typing.AbstractSet[tuple[int, int]]
 ) -> typing.Iterable[tuple[int, int]]:
     for _ in itertools.product(range(size[0]), range(size[1])):
         if _ not in blocked:
@@ -0,0 +1,185 @@
+import z3  # type: ignore
+
+from . import _propagation as pr
+
+
+def _is_fixed(domain: int) -> bool:
+    return domain & (domain - 1) == 0
+
+
+def _any(literals, ctx):
+    if not literals:
+        return z3.BoolVal(False, ctx)
+    return z3.Or(literals)
+
+
+class IntEncoding:
+    def __init__(self, value_limit: int, ctx=None) -> None:
+        self.value_limit = value_limit
+        self.ctx = z3.main_ctx() if ctx is None else ctx
+        self.num_variables = 0
+
+    def new_solver(self):
+        return z3.Solver(ctx=self.ctx)
+
+    def constant(self, value: int):
+        return z3.IntVal(value, self.ctx)
+
+    def variable(self, name: str):
+        self.num_variables += 1
+        return z3.Int(name, self.ctx)
+
+    def less_equal(self, left, right):
+        return left <= right
+
+    def less(self, left, right):
+        return left < right
+
+    def define(self, pos: tuple[int, int], domain: int):
+        if _is_fixed(domain):
+            return self.constant(domain.bit_length() - 1)
+        return self.variable(f"u_{pos[0]}_{pos[1]}")
+
+    def equals(self, cell, value: int):
+        return cell == value
+
+    def restrict(self, cell, domain: int) -> list:
+        values = list(pr.gen_values(domain))
+        res = [
+            self.less_equal(self.constant(values[0]), cell),
+            self.less_equal(cell, self.constant(values[-1])),
+        ]
+        if values[-1] - values[0] + 1 != len(values):
+            res.append(z3.Or([self.equals(cell, _) for _ in values]))
+        return res
+
+    def add_domain(self, solver, cell, domain: int) -> None:
+        if not _is_fixed(domain):
+            solver.add(*self.restrict(cell, domain))
+
+    def add_distinct(self, solver, cells: list) -> None:
+        if len(cells) > 1:
+            solver.add(z3.Distinct(*cells))
+
+    def add_straight(self, solver, cells: list, name: str) -> None:
+        cur_limit = self.variable(name)
+        solver.add(self.less(self.constant(0), cur_limit))
+        for _ in cells:
+            solver.add(self.less_equal(cur_limit, _))
+            solver.add(self.less(_, cur_limit + len(cells)))
+        self.add_distinct(solver, cells)
+
+    def value(self, model, cell) -> int:
+        return model.eval(cell).as_long()
+
+
+class BitVecEncoding(IntEncoding):
+    def __init__(self, value_limit: int, ctx=None) -> None:
+        super().__init__(value_limit, ctx)
+        self.width = (2 * value_limit).bit_length() + 1
+
+    def new_solver(self):
+        return z3.SolverFor("QF_BV", ctx=self.ctx)
+
+    def constant(self, value: int):
+        return z3.BitVecVal(value, self.width, self.ctx)
+
+    def variable(self, name: str):
+        self.num_variables += 1
+        return z3.BitVec(name, self.width, self.ctx)
+
+    def less_equal(self, left, right):
+        return z3.ULE(left, right)
+
+    def less(self, left, right):
+        return z3.ULT(left, right)
+
+
+class OneHotEncoding:
+    def __init__(self, value_limit: int, ctx=None) -> None:
+        self.value_limit = value_limit
+        self.ctx = z3.main_ctx() if ctx is None else ctx
+        self.num_variables = 0
+
+    def new_solver(self):
+        return z3.SolverFor("QF_FD", ctx=self.ctx)
+
+    def define(self, pos: tuple[int, int], domain: int) -> dict:
+        res = {
+            _: z3.Bool(f"u_{pos[0]}_{pos[1]}_{_}", self.ctx)
+            for _ in pr.gen_values(domain)
+        }
+        self.num_variables += len(res)
+        return res
+
+    def equals(self, cell: dict, value: int):
+        return cell.get(value, z3.BoolVal(False, self.ctx))
+
+    def restrict(self, cell: dict, domain: int) -> list:
+        return [z3.Not(_[1]) for _ in cell.items() if not domain >> _[0] & 1]
+
+    def add_domain(self, solver, cell: dict, _domain: int) -> None:
+        solver.add(z3.PbEq([(_, 1) for _ in cell.values()], 1))
+
+    def add_distinct(self, solver, cells: list[dict]) -> None:
+        for value in range(1, self.value_limit + 1):
+            literals = [_[value] for _ in cells if value in _]
+            if len(literals) > 1:
+                solver.add(z3.AtMost(*literals, 1))
+
+    def _add_presence(self, solver, cells: list[dict], name: str) -> list:
+        res: list = []
+        for value in range(1, self.value_limit + 1):
+            used = [_[value] for _ in cells if value in _]
+            if not used:
+                res.append(None)
+                continue
+            present = z3.Bool(f"{name}_p{value}", self.ctx)
+            self.num_variables += 1
+            solver.add(present == z3.Or(used))
+            res.append(present)
+        return res
+
+    def _add_start_order(self, solver, cells: list[dict], name: str) -> dict:
+        at_least = {
+            _: z3.Bool(f"{name}_{_}", self.ctx)
+            for _ in range(2, self.value_limit - len(cells) + 2)
+        }
+        self.num_variables += len(at_least)
+        for start, literal in at_least.items():
+            if start + 1 in at_least:
+                solver.add(z3.Implies(at_least[start + 1], literal))
+        return at_least
+
+    def add_straight(self, solver, cells: list[dict], name: str) -> None:
+        at_least = self._add_start_order(solver, cells, name)
+        presence = self._add_presence(solver, cells, name)
+        for value, present in enumerate(presence, 1):
+            low = at_least.get(value - len(cells) + 1)
+            high = at_least.get(value + 1)
+            covered = [] if present is None else [present]
+            if low is not None:
+                covered.append(z3.Not(low))
+            if high is not None:
+                covered.append(high)
+            solver.add(_any(covered, self.ctx))
+            if present is None:
+                continue
+            if low is not None:
+                solver.add(z3.Implies(present, low))
+            if high is not None:
+                solver.add(z3.Implies(present, z3.Not(high)))
+
+    def value(self, model, cell: dict) -> int:
+        return next(
+            value
+            for value, literal in cell.items()
+            if z3.is_true(model.eval(literal, model_completion=True))
+        )
+
+
+ENCODINGS: dict[str, type[IntEncoding] | type[OneHotEncoding]] = {
+    "int": IntEncoding,
+    "bitvec": BitVecEncoding,
+    "onehot": OneHotEncoding,
+}
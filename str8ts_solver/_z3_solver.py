@@ -0,0 +1,211 @@
+import typing
+
+import z3  # type: ignore
+
+from . import _layout_index as li
+from . import _propagation as pr
+from . import _z3_encodings as ze
+
+
+def _reduce_domains(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> dict[tuple[int, int], int] | None:
+    layout = pr.make_layout(size, blocked)
+    try:
+        domains = pr.initial_domains(layout, size, blocked, known)
+        pr.propagate(layout, domains)
+    except pr.Contradiction:
+        return None
+    return dict(zip(layout.cells, domains, strict=True))
+
+
+def _define_unknowns(encoding, domains: dict[tuple[int, int], int]):
+    return {pos: encoding.define(pos, domain) for pos, domain in domains.items()}
+
+
+def _add_basic_constrains(solver, encoding, unknowns, domains) -> None:
+    for pos, unknown in unknowns.items():
+        encoding.add_domain(solver, unknown, domains[pos])
+
+
+def _gen_constrains_from_blocked(
+    encoding,
+    unknowns,
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> typing.Iterator:
+    index = li.get_layout_index(size, blocked)
+    for blocked_pos in blocked:
+        if blocked_pos in known:
+            for _ in index.peers(blocked_pos):
+                yield z3.Not(encoding.equals(unknowns[_], known[blocked_pos]))
+
+
+def _add_all_block_constrains(
+    solver, encoding, unknowns, index: li.LayoutIndex
+) -> None:
+    for block_num, cur_block in enumerate(index.horizontal):
+        encoding.add_straight(
+            solver, [unknowns[_] for _ in cur_block], f"h_{block_num}"
+        )
+
+    for block_num, cur_block in enumerate(index.vertical):
+        encoding.add_straight(
+            solver, [unknowns[_] for _ in cur_block], f"v_{block_num}"
+        )
+
+
+def _add_entries_in_all_lines_are_unique_constrains(
+    solver, encoding, unknowns, lines: tuple[tuple[tuple[int, int], ...], ...]
+):
+    for line in lines:
+        encoding.add_distinct(solver, [unknowns[_] for _ in line])
+
+
+def _add_layout_constrains(
+    solver, encoding, unknowns, size: tuple[int, int], blocked: set[tuple[int, int]]
+) -> None:
+    index = li.get_layout_index(size, blocked)
+    _add_all_block_constrains(solver, encoding, unknowns, index)
+    _add_entries_in_all_lines_are_unique_constrains(
+        solver, encoding, unknowns, index.cols
+    )
+    _add_entries_in_all_lines_are_unique_constrains(
+        solver, encoding, unknowns, index.rows
+    )
+
+
+def create_solver(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+    encoding_name: str = "int",
+    ctx=None,
+):
+    encoding = ze.ENCODINGS[encoding_name](max(size), ctx)
+    solver = encoding.new_solver()
+    domains = _reduce_domains(size, blocked, known)
+    if domains is None:
+        solver.add(z3.BoolVal(False, encoding.ctx))
+        return encoding, {}, solver
+    unknowns = _define_unknowns(encoding, domains)
+    _add_basic_constrains(solver, encoding, unknowns, domains)
+    solver.add(*_gen_constrains_from_blocked(encoding, unknowns, size, blocked, known))
+    _add_layout_constrains(solver, encoding, unknowns, size, blocked)
+
+    return encoding, unknowns, solver
+
+
+def create_template(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    encoding_name: str,
+    ctx=None,
+):
+    encoding = ze.ENCODINGS[encoding_name](max(size), ctx)
+    solver = encoding.new_solver()
+    domains = dict.fromkeys(
+        li.get_layout_index(size, blocked).cells, pr.full_mask(max(size))
+    )
+    unknowns = _define_unknowns(encoding, domains)
+    _add_basic_constrains(solver, encoding, unknowns, domains)
+    _add_layout_constrains(solver, encoding, unknowns, size, blocked)
+    return encoding, unknowns, solver
+
+
+def gen_clue_constrains(
+    encoding,
+    unknowns,
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> typing.Iterator:
+    domains = _reduce_domains(size, blocked, known)
+    if domains is None:
+        yield z3.BoolVal(False, encoding.ctx)
+        return
+    full = pr.full_mask(max(size))
+    for pos, domain in domains.items():
+        if domain != full:
+            yield from encoding.restrict(unknowns[pos], domain)
+    for pos, value in known.items():
+        if pos not in blocked:
+            yield encoding.equals(unknowns[pos], value)
+    yield from _gen_constrains_from_blocked(encoding, unknowns, size, blocked, known)
+
+
+def read_solution(encoding, unknowns, solver) -> dict[tuple[int, int], int]:
+    model = solver.model()
+    return {_: encoding.value(model, unknowns[_]) for _ in unknowns}
+
+
+def statistics(solver) -> dict[str, int | float]:
+    res = solver.statistics()
+    return {_: res.get_key_value(_) for _ in res.keys()}
+
+
+def _is_gauge(name: str) -> bool:
+    return name in ("memory", "time") or "max" in name
+
+
+def statistics_since(solver, before: dict[str, int | float]) -> dict[str, int | float]:
+    return {
+        name: value if _is_gauge(name) else value - before.get(name, 0)
+        for name, value in statistics(solver).items()
+    }
+
+
+def blocking_clause(encoding, unknowns, solved: dict[tuple[int, int], int]):
+    return z3.Or(
+        *[z3.Not(encoding.equals(unknowns[_], solved[_])) for _ in solved],
+        encoding.ctx,
+    )
+
+
+class AssumptionSolver:
+    def __init__(
+        self,
+        size: tuple[int, int],
+        blocked: set[tuple[int, int]],
+        encoding_name: str,
+        ctx=None,
+    ) -> None:
+        self.size = size
+        self.blocked = blocked
+        self.encoding, self.unknowns, self.solver = create_template(
+            size, blocked, encoding_name, ctx
+        )
+        self._literals: dict[tuple[tuple[int, int], int], typing.Any] = {}
+
+    def add_blocked_clues(self, known: dict[tuple[int, int], int]) -> None:
+        self.solver.add(
+            *_gen_constrains_from_blocked(
+                self.encoding, self.unknowns, self.size, self.blocked, known
+            )
+        )
+
+    def exclude(self, solved: dict[tuple[int, int], int]) -> None:
+        self.solver.add(blocking_clause(self.encoding, self.unknowns, solved))
+
+    def literal(self, pos: tuple[int, int], value: int):
+        key = (pos, value)
+        if key not in self._literals:
+            cur_literal = z3.Bool(f"a_{pos[0]}_{pos[1]}_{value}", self.encoding.ctx)
+            self.solver.add(
+                z3.Implies(cur_literal, self.encoding.equals(self.unknowns[pos], value))
+            )
+            self._literals[key] = cur_literal
+        return self._literals[key]
+
+    def check(self, placed: dict[tuple[int, int], int]):
+        return self.solver.check(*[self.literal(*_) for _ in placed.items()])
+
+    def read_solution(self) -> dict[tuple[int, int], int]:
+        return read_solution(self.encoding, self.unknowns, self.solver)
+
+    def core(self) -> list[tuple[tuple[int, int], int]]:
+        names = {str(_) for _ in self.solver.unsat_core()}
+        return [key for key, value in self._literals.items() if str(value) in names]
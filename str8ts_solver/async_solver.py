@@ -0,0 +1,91 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import importlib
+import os
+import threading
+import typing
+
+from . import solver as sl
+
+_INTERRUPT_INTERVAL = 0.01
+
+
+@functools.cache
+def _default_executor() -> concurrent.futures.ThreadPoolExecutor:
+    return concurrent.futures.ThreadPoolExecutor(thread_name_prefix="str8ts_solver")
+
+
+def _new_context():
+    return importlib.import_module("z3").Context()
+
+
+def _interrupt_until_done(ctx, future: concurrent.futures.Future) -> None:
+    while not future.done():
+        ctx.interrupt()
+        concurrent.futures.wait([future], timeout=_INTERRUPT_INTERVAL)
+
+
+def _is_interruptible(executor: concurrent.futures.Executor, backend: str) -> bool:
+    return backend == "z3" and not isinstance(
+        executor, concurrent.futures.ProcessPoolExecutor
+    )
+
+
+async def _run(
+    executor: concurrent.futures.Executor,
+    puzzle: tuple[tuple[int, int], set[tuple[int, int]], dict[tuple[int, int], int]],
+    options: dict[str, typing.Any],
+) -> dict[tuple[int, int], int] | None:
+    ctx = None
+    if _is_interruptible(executor, options.get("backend", "z3")):
+        ctx = _new_context()
+    future = executor.submit(functools.partial(sl.solve, *puzzle, ctx=ctx, **options))
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        if ctx is not None and not future.cancel():
+            threading.Thread(
+                target=_interrupt_until_done, args=(ctx, future), daemon=True
+            ).start()
+        raise
+
+
+async def solve_async(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+    *,
+    executor: concurrent.futures.Executor | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    **options,
+) -> dict[tuple[int, int], int] | None:
+    limiter = contextlib.nullcontext() if semaphore is None else semaphore
+    async with limiter:
+        return await _run(
+            executor or _default_executor(), (size, blocked, known), options
+        )
+
+
+async def solve_many_async(
+    puzzles: typing.Iterable[
+        tuple[tuple[int, int], set[tuple[int, int]], dict[tuple[int, int], int]]
+    ],
+    *,
+    executor: concurrent.futures.Executor | None = None,
+    max_concurrency: int | None = None,
+    **options,
+) -> list[dict[tuple[int, int], int] | None]:
+    semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count() or 1)
+    tasks = [
+        asyncio.ensure_future(
+            solve_async(*_, executor=executor, semaphore=semaphore, **options)
+        )
+        for _ in puzzles
+    ]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for _ in tasks:
+            _.cancel()
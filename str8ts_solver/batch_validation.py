@@ -0,0 +1,130 @@
+import typing
+
+import numpy as np
+
+_MAX_VALUE = 62
+
+
+def _inside_mask(sizes: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+    rows = np.arange(shape[1])[None, :, None] < sizes[:, 1, None, None]
+    cols = np.arange(shape[2])[None, None, :] < sizes[:, 0, None, None]
+    return rows & cols
+
+
+def _rows_are_distinct(active: np.ndarray, solved: np.ndarray) -> np.ndarray:
+    placeholders = -1 - np.arange(solved.shape[2])
+    values = np.sort(np.where(active, solved, placeholders), axis=2)
+    return ~(values[:, :, 1:] == values[:, :, :-1]).any(axis=(1, 2))
+
+
+def _rows_avoid_blocked_clues(
+    active: np.ndarray, blocked: np.ndarray, known: np.ndarray, solved: np.ndarray
+) -> np.ndarray:
+    one = np.int64(1)
+    clue_bits = np.where(
+        blocked & (known > 0), one << np.clip(known, 0, _MAX_VALUE + 1), 0
+    )
+    row_masks = np.bitwise_or.reduce(clue_bits, axis=2)
+    cell_bits = np.where(active, one << solved, 0)
+    return ~((cell_bits & row_masks[:, :, None]) != 0).any(axis=(1, 2))
+
+
+def _rows_are_straight(active: np.ndarray, solved: np.ndarray) -> np.ndarray:
+    num, height, width = solved.shape
+    run_ids = np.cumsum(~active, axis=2)
+    segments = (
+        np.arange(num * height).reshape(num, height, 1) * (width + 1) + run_ids
+    )[active]
+    values = solved[active]
+    lows = np.full(num * height * (width + 1), _MAX_VALUE + 1, dtype=np.int64)
+    highs = np.zeros_like(lows)
+    counts = np.zeros_like(lows)
+    np.minimum.at(lows, segments, values)
+    np.maximum.at(highs, segments, values)
+    np.add.at(counts, segments, 1)
+    invalid = (counts > 0) & (highs - lows + 1 != counts)
+    return ~invalid.reshape(num, height * (width + 1)).any(axis=1)
+
+
+def _rows_are_valid(
+    active: np.ndarray, blocked: np.ndarray, known: np.ndarray, solved: np.ndarray
+) -> np.ndarray:
+    return (
+        _rows_are_distinct(active, solved)
+        & _rows_avoid_blocked_clues(active, blocked, known, solved)
+        & _rows_are_straight(active, solved)
+    )
+
+
+def _values_are_in_range(
+    sizes: np.ndarray, active: np.ndarray, solved: np.ndarray
+) -> np.ndarray:
+    limits = sizes.max(axis=1)[:, None, None]
+    in_range = (solved > 0) & (solved <= limits)
+    return (in_range | ~active).all(axis=(1, 2))
+
+
+def _blocked_are_empty(
+    inside: np.ndarray, blocked: np.ndarray, solved: np.ndarray
+) -> np.ndarray:
+    return ~((solved != 0) & blocked & inside).any(axis=(1, 2))
+
+
+def _known_are_kept(
+    active: np.ndarray, known: np.ndarray, solved: np.ndarray
+) -> np.ndarray:
+    return ((known == solved) | (known == 0) | ~active).all(axis=(1, 2))
+
+
+def validate_batch(
+    sizes: np.ndarray,
+    blocked_masks: np.ndarray,
+    known: np.ndarray,
+    solved: np.ndarray,
+) -> np.ndarray:
+    sizes = np.asarray(sizes, dtype=np.int64)
+    known = np.asarray(known, dtype=np.int64)
+    solved = np.asarray(solved, dtype=np.int64)
+    inside = _inside_mask(sizes, solved.shape)
+    blocked = np.asarray(blocked_masks, dtype=bool) | ~inside
+    if sizes.size and sizes.max() > _MAX_VALUE:
+        raise ValueError(f"Sizes above {_MAX_VALUE} are not supported")
+    active = ~blocked
+    is_empty = _blocked_are_empty(inside, blocked, solved)
+    in_range = _values_are_in_range(sizes, active, solved)
+    solved = np.where(active & in_range[:, None, None], solved, 0)
+    known = np.where(inside, known, 0)
+    transposed = [_.transpose(0, 2, 1) for _ in (active, blocked, known, solved)]
+    return (
+        is_empty
+        & in_range
+        & _known_are_kept(active, known, solved)
+        & _rows_are_valid(active, blocked, known, solved)
+        & _rows_are_valid(*transposed)
+    )
+
+
+def stack(
+    puzzles: typing.Iterable[
+        tuple[
+            tuple[int, int],
+            set[tuple[int, int]],
+            dict[tuple[int, int], int],
+            dict[tuple[int, int], int],
+        ]
+    ],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    puzzles = list(puzzles)
+    sizes = np.array([_[0] for _ in puzzles], dtype=np.int64).reshape(-1, 2)
+    shape = (len(puzzles), *np.max(sizes, axis=0, initial=0)[::-1])
+    blocked_masks = np.zeros(shape, dtype=bool)
+    known_values = np.zeros(shape, dtype=np.int64)
+    solved_values = np.zeros(shape, dtype=np.int64)
+    for num, (_, blocked, known, solved) in enumerate(puzzles):
+        for x_pos, y_pos in blocked:
+            blocked_masks[num, y_pos, x_pos] = True
+        for (x_pos, y_pos), value in known.items():
+            known_values[num, y_pos, x_pos] = value
+        for (x_pos, y_pos), value in solved.items():
+            solved_values[num, y_pos, x_pos] = value
+    return sizes, blocked_masks, known_values, solved_values
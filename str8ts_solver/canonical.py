@@ -0,0 +1,118 @@
+import functools
+import hashlib
+import itertools
+import operator
+import typing
+
+from . import _check_solution as cs
+from . import _lru_cache as lc
+from . import grid as gr
+from . import solver as sl
+
+
+class Transform(typing.NamedTuple):
+    flip_x: bool = False
+    flip_y: bool = False
+    transpose: bool = False
+    reverse: bool = False
+
+    def size(self, size: tuple[int, int]) -> tuple[int, int]:
+        return (size[1], size[0]) if self.transpose else size
+
+    def position(self, size: tuple[int, int], pos: tuple[int, int]) -> tuple[int, int]:
+        x_pos = size[0] - 1 - pos[0] if self.flip_x else pos[0]
+        y_pos = size[1] - 1 - pos[1] if self.flip_y else pos[1]
+        return (y_pos, x_pos) if self.transpose else (x_pos, y_pos)
+
+    def value(self, size: tuple[int, int], value: int) -> int:
+        return max(size) + 1 - value if self.reverse and value else value
+
+
+TRANSFORMS = tuple(Transform(*_) for _ in itertools.product((False, True), repeat=4))
+
+
+class CanonicalForm(typing.NamedTuple):
+    puzzle: gr.Puzzle
+    transform: Transform
+    digest: str
+
+
+@functools.lru_cache(maxsize=256)
+def _permutation(size: tuple[int, int], transform: Transform) -> operator.itemgetter:
+    new_size = transform.size(size)
+    res = [0] * (size[0] * size[1])
+    for y_pos, x_pos in itertools.product(range(size[1]), range(size[0])):
+        new_x, new_y = transform.position(size, (x_pos, y_pos))
+        res[new_y * new_size[0] + new_x] = y_pos * size[0] + x_pos
+    return operator.itemgetter(*res)
+
+
+@functools.lru_cache(maxsize=64)
+def _reverse_table(value_limit: int) -> bytes:
+    return bytes(
+        (_ & gr.BLOCKED)
+        | (value_limit + 1 - _ & gr.VALUE_MASK if _ & gr.VALUE_MASK else 0)
+        for _ in range(256)
+    )
+
+
+def _transform_cells(
+    size: tuple[int, int], cells: bytes, transform: Transform
+) -> bytes:
+    res = bytes(_permutation(size, transform)(cells)) if len(cells) > 1 else cells
+    return res.translate(_reverse_table(max(size))) if transform.reverse else res
+
+
+def _to_puzzle(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> gr.Puzzle:
+    if not cs.is_input_valid(size, blocked, known):
+        raise ValueError("Invalid input")
+    return gr.Puzzle.from_dicts(size, blocked, known)
+
+
+def canonicalize(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> CanonicalForm:
+    puzzle = _to_puzzle(size, blocked, known)
+    new_size, cells, transform = min(
+        (_.size(size), _transform_cells(size, puzzle.cells, _), _) for _ in TRANSFORMS
+    )
+    digest = hashlib.sha256(
+        f"{new_size[0]}x{new_size[1]}:".encode() + cells
+    ).hexdigest()
+    return CanonicalForm(gr.Puzzle(*new_size, cells), transform, digest)
+
+
+def from_canonical(
+    size: tuple[int, int],
+    transform: Transform,
+    solved: dict[tuple[int, int], int],
+) -> dict[tuple[int, int], int]:
+    return {
+        pos: transform.value(size, solved[transform.position(size, pos)])
+        for pos in itertools.product(range(size[0]), range(size[1]))
+        if transform.position(size, pos) in solved
+    }
+
+
+class CanonicalCache(lc.LruCache):
+    def __init__(self, maxsize: int = 1024) -> None:
+        super().__init__(maxsize)
+
+    def solve(
+        self,
+        size: tuple[int, int],
+        blocked: set[tuple[int, int]],
+        known: dict[tuple[int, int], int],
+        **options,
+    ) -> dict[tuple[int, int], int] | None:
+        form = canonicalize(size, blocked, known)
+        solved = self._get_or_create(
+            form.digest, lambda: sl.solve(*form.puzzle.to_dicts(), **options)
+        )
+        return None if solved is None else from_canonical(size, form.transform, solved)
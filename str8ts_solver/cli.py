@@ -0,0 +1,257 @@
+"""
+solves str8ts puzzles read from files or the standard input
+
+Every input line is one puzzle, either in the text format of
+str8ts_solver.text_format (--format compact) or a JSON object
+{"size": [w, h], "blocked": [[x, y], ...], "known": [[x, y, value], ...]}
+(--format jsonl). With --validate every line also has to carry a solution:
+a second compact field, or "solved": [[x, y, value], ...].
+Results are written to the standard output, one line per puzzle.
+Puzzles exceeding --timeout or --rlimit are reported as unknown.
+With --unordered they are written as soon as they are ready, compact lines
+are then prefixed with the number of the puzzle in the input.
+
+usage: python -m str8ts_solver [files ...]
+"""
+
+import argparse
+import collections
+import fileinput
+import itertools
+import json
+import sys
+import time
+import typing
+
+from . import _batch as bt
+from . import _check_solution as cs
+from . import grid as gr
+from . import solver as sl
+from . import text_format as tf
+
+_Record = tuple[
+    tuple[int, int],
+    set[tuple[int, int]],
+    dict[tuple[int, int], int],
+    dict[tuple[int, int], int] | None,
+]
+
+
+class _Outcome(typing.NamedTuple):
+    item_num: int
+    status: str
+    solved: dict[tuple[int, int], int] | None = None
+    unique: bool | None = None
+    error: str | None = None
+
+
+def _parse_compact(line: str) -> _Record:
+    fields = line.split()
+    if not fields or len(fields) > 2:
+        raise ValueError("Invalid input")
+    size, blocked, known = tf.parse_puzzle(fields[0]).to_dicts()
+    solved = None
+    if len(fields) == 2:
+        solution_size, grid = tf.parse_solution(fields[1])
+        if solution_size != size:
+            raise ValueError("Invalid input")
+        solved = {} if grid is None else grid.to_dict()
+    return size, blocked, known, solved
+
+
+def _to_values(entries) -> dict[tuple[int, int], int]:
+    return {(x_pos, y_pos): value for x_pos, y_pos, value in entries}
+
+
+def _to_ints(entry, length: int) -> tuple[int, ...]:
+    if not isinstance(entry, list) or len(entry) != length:
+        raise ValueError("Invalid input")
+    if not all(isinstance(_, int) and not isinstance(_, bool) for _ in entry):
+        raise ValueError("Invalid input")
+    return tuple(entry)
+
+
+def _to_entries(data: dict, key: str, length: int) -> list[tuple[int, ...]]:
+    entries = data.get(key, [])
+    if not isinstance(entries, list):
+        raise ValueError("Invalid input")
+    return [_to_ints(_, length) for _ in entries]
+
+
+def _parse_jsonl(line: str) -> _Record:
+    try:
+        data = json.loads(line)
+        size = _to_ints(data["size"], 2)
+        blocked = {(_[0], _[1]) for _ in _to_entries(data, "blocked", 2)}
+        known = _to_values(_to_entries(data, "known", 3))
+        solved = (
+            _to_values(_to_entries(data, "solved", 3)) if "solved" in data else None
+        )
+    except (LookupError, TypeError, ValueError) as error:
+        raise ValueError("Invalid input") from error
+    return (size[0], size[1]), blocked, known, solved
+
+
+def _format_compact(record: _Record | None, outcome: _Outcome) -> str:
+    if record is None or outcome.error is not None:
+        return f"{outcome.status}: {outcome.error}"
+    if outcome.status in {"valid", "invalid"}:
+        return outcome.status
+    puzzle = gr.Puzzle.from_dicts(*record[:3])
+    grid = None
+    if outcome.solved is not None:
+        grid = gr.Grid.from_dict(puzzle.size, outcome.solved)
+    res = tf.format_solution(puzzle, grid)
+    if outcome.unique is not None:
+        res += " unique" if outcome.unique else " multiple"
+    return res
+
+
+def _format_jsonl(_record: _Record | None, outcome: _Outcome) -> str:
+    res: dict[str, typing.Any] = {"item": outcome.item_num, "status": outcome.status}
+    if outcome.solved is not None:
+        res["solved"] = [[*pos, value] for pos, value in sorted(outcome.solved.items())]
+    if outcome.unique is not None:
+        res["unique"] = outcome.unique
+    if outcome.error is not None:
+        res["error"] = outcome.error
+    return json.dumps(res)
+
+
+_FORMATS = {
+    "compact": (_parse_compact, _format_compact),
+    "jsonl": (_parse_jsonl, _format_jsonl),
+}
+
+
+def _validate(item_num: int, record: _Record) -> _Outcome:
+    size, blocked, known, solved = record
+    if solved is None:
+        raise ValueError("Missing solution")
+    gr.Puzzle.from_dicts(size, blocked, known)
+    if cs.is_solution_valid(size, blocked, known, solved):
+        return _Outcome(item_num, "valid")
+    return _Outcome(item_num, "invalid")
+
+
+def _solve(item_num: int, record: _Record, options: dict[str, typing.Any]) -> _Outcome:
+    size, blocked, known, _ = record
+    unique = None
+    if options["unique"] is None:
+        solved = sl.solve(size, blocked, known, **options["solve"])
+    else:
+        solutions = list(
+            itertools.islice(
+                sl.iter_solutions(size, blocked, known, **options["unique"]), 2
+            )
+        )
+        solved = solutions[0] if solutions else None
+        unique = len(solutions) == 1
+    if solved is None:
+        return _Outcome(item_num, "unsolvable")
+    return _Outcome(item_num, "solved", solved, unique)
+
+
+def _process(
+    item_num: int, record: _Record, options: dict[str, typing.Any]
+) -> _Outcome:
+    if options["validate"]:
+        return _validate(item_num, record)
+    return _solve(item_num, record, options)
+
+
+def _process_line(
+    item_num: int, line: str, options: dict[str, typing.Any]
+) -> tuple[str, str]:
+    parse, format_outcome = _FORMATS[options["format"]]
+    record = None
+    try:
+        record = parse(line)
+        outcome = _process(item_num, record, options)
+    except sl.SolveTimeoutError as error:
+        outcome = _Outcome(item_num, "unknown", error=str(error))
+    except ValueError as error:
+        outcome = _Outcome(item_num, "error", error=str(error))
+    res = format_outcome(record, outcome)
+    if options["numbered"]:
+        res = f"{item_num} {res}"
+    return outcome.status, res
+
+
+def _gen_lines(files: list[str]) -> typing.Iterator[str]:
+    with fileinput.input(files) as lines:
+        yield from (_ for _ in lines if _.strip())
+
+
+def _parse_args(args: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m str8ts_solver",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("files", nargs="*", help="input files, - for stdin")
+    parser.add_argument("--format", choices=sorted(_FORMATS), default="compact")
+    parser.add_argument("--jobs", "-j", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=64)
+    parser.add_argument("--unordered", action="store_true")
+    parser.add_argument(
+        "--backend", default="z3", help="z3, or native for grids up to 9x9"
+    )
+    parser.add_argument("--encoding", default="auto")
+    parser.add_argument("--timeout", type=float, default=None, help="in seconds")
+    parser.add_argument(
+        "--rlimit", type=int, default=None, help="z3 resource limit (z3 backend only)"
+    )
+    parser.add_argument("--unique", action="store_true")
+    parser.add_argument("--validate", action="store_true")
+    return parser.parse_args(args)
+
+
+def _get_options(args: argparse.Namespace) -> dict[str, typing.Any]:
+    solve_options: dict[str, typing.Any] = {
+        "backend": args.backend,
+        "encoding": args.encoding,
+    }
+    if args.timeout is not None:
+        solve_options["timeout_ms"] = int(1000 * args.timeout)
+    if args.rlimit is not None:
+        solve_options["rlimit"] = args.rlimit
+    unique_options = None
+    if args.unique:
+        unique_options = {
+            key: value for key, value in solve_options.items() if key != "backend"
+        }
+    return {
+        "format": args.format,
+        "solve": solve_options,
+        "unique": unique_options,
+        "validate": args.validate,
+        "numbered": args.unordered and args.format == "compact",
+    }
+
+
+def _summary(counts: collections.Counter, elapsed: float) -> str:
+    total = sum(counts.values())
+    details = ", ".join(f"{_}: {counts[_]}" for _ in sorted(counts))
+    rate = total / elapsed if elapsed > 0 else 0.0
+    return f"{total} puzzles ({details}) in {elapsed:.2f}s, {rate:.1f} puzzles/s"
+
+
+def main(args: list[str] | None = None) -> int:
+    parsed = _parse_args(args)
+    counts: collections.Counter = collections.Counter()
+    start = time.perf_counter()
+    results = bt.map_items(
+        _process_line,
+        _gen_lines(parsed.files),
+        _get_options(parsed),
+        workers=parsed.jobs,
+        chunksize=parsed.chunksize,
+        ordered=not parsed.unordered,
+    )
+    for status, line in results:
+        counts[status] += 1
+        sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+    print(_summary(counts, time.perf_counter() - start), file=sys.stderr)
+    return 1 if counts["error"] else 0
@@ -0,0 +1,147 @@
+import concurrent.futures
+import functools
+import random
+import typing
+
+import z3  # type: ignore
+
+from . import _check_solution as cs
+from . import _z3_solver as zs
+
+
+class GeneratedPuzzle(typing.NamedTuple):
+    size: tuple[int, int]
+    blocked: set[tuple[int, int]]
+    known: dict[tuple[int, int], int]
+    solved: dict[tuple[int, int], int]
+
+
+def _gen_images(
+    pos: tuple[int, int], size: tuple[int, int], symmetry: str
+) -> typing.Iterator[tuple[int, int]]:
+    x_pos, y_pos = pos
+    yield pos
+    if symmetry == "rotational":
+        yield size[0] - 1 - x_pos, size[1] - 1 - y_pos
+    elif symmetry == "mirror":
+        yield size[0] - 1 - x_pos, y_pos
+    elif symmetry == "diagonal":
+        yield y_pos, x_pos
+
+
+def _random_layout(
+    rng: random.Random, size: tuple[int, int], symmetry: str, blocked_ratio: float
+) -> set[tuple[int, int]]:
+    blocked: set[tuple[int, int]] = set()
+    visited: set[tuple[int, int]] = set()
+    for pos in sorted((x, y) for x in range(size[0]) for y in range(size[1])):
+        if pos not in visited:
+            orbit = set(_gen_images(pos, size, symmetry))
+            visited |= orbit
+            if rng.random() < blocked_ratio:
+                blocked |= orbit
+    return blocked
+
+
+def _random_filled_grid(
+    rng: random.Random, checker: zs.AssumptionSolver
+) -> dict[tuple[int, int], int] | None:
+    checker.solver.set("random_seed", rng.randrange(2**31))
+    checker.solver.set("phase", "random")
+    if checker.check({}) != z3.sat:
+        return None
+    return checker.read_solution()
+
+
+def _random_blocked_clues(
+    rng: random.Random,
+    blocked: set[tuple[int, int]],
+    solved: dict[tuple[int, int], int],
+    value_limit: int,
+    blocked_clue_ratio: float,
+) -> dict[tuple[int, int], int]:
+    res = {}
+    for pos in sorted(blocked):
+        used = {v for p, v in solved.items() if pos[0] == p[0] or pos[1] == p[1]}
+        free = [_ for _ in range(1, value_limit + 1) if _ not in used]
+        if free and rng.random() < blocked_clue_ratio:
+            res[pos] = rng.choice(free)
+    return res
+
+
+def _remove_clues(
+    rng: random.Random,
+    checker: zs.AssumptionSolver,
+    solved: dict[tuple[int, int], int],
+    min_clues: int,
+) -> dict[tuple[int, int], int]:
+    checker.exclude(solved)
+    clues = dict(solved)
+    for pos in rng.sample(sorted(solved), len(solved)):
+        if len(clues) <= min_clues:
+            break
+        value = clues.pop(pos)
+        if checker.check(clues) != z3.unsat:
+            clues[pos] = value
+    return clues
+
+
+def _check_symmetry(size: tuple[int, int], symmetry: str) -> None:
+    if symmetry not in {"none", "rotational", "mirror", "diagonal"}:
+        raise ValueError(f"Unknown symmetry: {symmetry}")
+    if symmetry == "diagonal" and size[0] != size[1]:
+        raise ValueError("Diagonal symmetry requires a square grid")
+
+
+def _random_solved_layout(
+    rng: random.Random,
+    size: tuple[int, int],
+    symmetry: str,
+    blocked_ratio: float,
+    encoding_name: str,
+) -> tuple[zs.AssumptionSolver, dict[tuple[int, int], int]]:
+    while True:
+        blocked = _random_layout(rng, size, symmetry, blocked_ratio)
+        checker = zs.AssumptionSolver(size, blocked, encoding_name, z3.Context())
+        solved = _random_filled_grid(rng, checker)
+        if solved is not None:
+            return checker, solved
+
+
+def generate(  # pylint: disable=too-many-arguments
+    size: tuple[int, int],
+    seed: int | None = None,
+    *,
+    symmetry: str = "rotational",
+    blocked_ratio: float = 0.2,
+    blocked_clue_ratio: float = 0.3,
+    min_clues: int = 0,
+    encoding: str = "onehot",
+) -> GeneratedPuzzle:
+    _check_symmetry(size, symmetry)
+    rng = random.Random(seed)  # nosec B311
+    checker, solved = _random_solved_layout(
+        rng, size, symmetry, blocked_ratio, encoding
+    )
+    blocked_clues = _random_blocked_clues(
+        rng, checker.blocked, solved, max(size), blocked_clue_ratio
+    )
+    checker.add_blocked_clues(blocked_clues)
+    known = _remove_clues(rng, checker, solved, min_clues) | blocked_clues
+    if not cs.is_solution_valid(size, checker.blocked, known, solved):
+        raise RuntimeError("Result is incorrect")
+    return GeneratedPuzzle(size, checker.blocked, known, solved)
+
+
+def generate_many(
+    size: tuple[int, int],
+    count: int,
+    seed: int | None = None,
+    *,
+    workers: int | None = None,
+    **options,
+) -> typing.Iterator[GeneratedPuzzle]:
+    rng = random.Random(seed)  # nosec B311
+    seeds = [rng.randrange(2**63) for _ in range(count)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(functools.partial(generate, size, **options), seeds)
@@ -0,0 +1,151 @@
+import itertools
+
+BLOCKED = 0x80
+VALUE_MASK = 0x7F
+
+
+def _check_buffer(width: int, height: int, buffer: bytes) -> None:
+    if min(width, height) <= 0 or len(buffer) != width * height:
+        raise ValueError("Invalid input")
+
+
+def _row_indices(width: int, y_pos: int) -> range:
+    return range(y_pos * width, (y_pos + 1) * width)
+
+
+def _col_indices(width: int, height: int, x_pos: int) -> range:
+    return range(x_pos, width * height, width)
+
+
+def _values_mask(buffer: bytes, indices: range) -> int:
+    res = 0
+    for _ in indices:
+        res |= 1 << (buffer[_] & VALUE_MASK)
+    return res & ~1
+
+
+class Puzzle:
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(self, width: int, height: int, cells: bytes) -> None:
+        _check_buffer(width, height, cells)
+        self.width = width
+        self.height = height
+        self.cells = bytes(cells)
+
+    @classmethod
+    def from_dicts(
+        cls,
+        size: tuple[int, int],
+        blocked: set[tuple[int, int]],
+        known: dict[tuple[int, int], int],
+    ) -> "Puzzle":
+        width, height = size
+        if not all(
+            0 <= x_pos < width and 0 <= y_pos < height
+            for x_pos, y_pos in itertools.chain(blocked, known)
+        ) or not all(0 < _ <= VALUE_MASK for _ in known.values()):
+            raise ValueError("Invalid input")
+        cells = bytearray(max(width * height, 0))
+        for x_pos, y_pos in blocked:
+            cells[y_pos * width + x_pos] = BLOCKED
+        for (x_pos, y_pos), value in known.items():
+            cells[y_pos * width + x_pos] |= value
+        return cls(width, height, bytes(cells))
+
+    def to_dicts(
+        self,
+    ) -> tuple[tuple[int, int], set[tuple[int, int]], dict[tuple[int, int], int]]:
+        blocked = set()
+        known = {}
+        for num, cell in enumerate(self.cells):
+            pos = (num % self.width, num // self.width)
+            if cell & BLOCKED:
+                blocked.add(pos)
+            if cell & VALUE_MASK:
+                known[pos] = cell & VALUE_MASK
+        return self.size, blocked, known
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.width, self.height
+
+    def is_blocked(self, pos: tuple[int, int]) -> bool:
+        return bool(self.cells[pos[1] * self.width + pos[0]] & BLOCKED)
+
+    def clue(self, pos: tuple[int, int]) -> int:
+        return self.cells[pos[1] * self.width + pos[0]] & VALUE_MASK
+
+    def row_indices(self, y_pos: int) -> range:
+        return _row_indices(self.width, y_pos)
+
+    def col_indices(self, x_pos: int) -> range:
+        return _col_indices(self.width, self.height, x_pos)
+
+    def blocked_clues_mask(self, indices: range) -> int:
+        res = 0
+        for _ in indices:
+            if self.cells[_] & BLOCKED:
+                res |= 1 << (self.cells[_] & VALUE_MASK)
+        return res & ~1
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Puzzle):
+            return NotImplemented
+        return self.size == other.size and self.cells == other.cells
+
+    def __hash__(self) -> int:
+        return hash((self.width, self.height, self.cells))
+
+    def __repr__(self) -> str:
+        return f"Puzzle({self.width}, {self.height}, {self.cells!r})"
+
+
+class Grid:
+    __slots__ = ("width", "height", "values")
+
+    def __init__(self, width: int, height: int, values: bytes) -> None:
+        _check_buffer(width, height, values)
+        self.width = width
+        self.height = height
+        self.values = bytes(values)
+
+    @classmethod
+    def from_dict(
+        cls, size: tuple[int, int], solved: dict[tuple[int, int], int]
+    ) -> "Grid":
+        values = bytearray(max(size[0] * size[1], 0))
+        for (x_pos, y_pos), value in solved.items():
+            values[y_pos * size[0] + x_pos] = value
+        return cls(size[0], size[1], bytes(values))
+
+    def to_dict(self) -> dict[tuple[int, int], int]:
+        return {
+            (num % self.width, num // self.width): value
+            for num, value in enumerate(self.values)
+            if value
+        }
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.width, self.height
+
+    def value(self, pos: tuple[int, int]) -> int:
+        return self.values[pos[1] * self.width + pos[0]]
+
+    def row_mask(self, y_pos: int) -> int:
+        return _values_mask(self.values, _row_indices(self.width, y_pos))
+
+    def col_mask(self, x_pos: int) -> int:
+        return _values_mask(self.values, _col_indices(self.width, self.height, x_pos))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.size == other.size and self.values == other.values
+
+    def __hash__(self) -> int:
+        return hash((self.width, self.height, self.values))
+
+    def __repr__(self) -> str:
+        return f"Grid({self.width}, {self.height}, {self.values!r})"
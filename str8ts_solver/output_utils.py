@@ -1,3 +1,6 @@
+from . import grid as gr
+
+
 def _bottom_row_to_string(
     in_row_num: int, row_size: int, blocked: set[tuple[int, int]]
 ) -> str:
@@ -80,3 +83,30 @@ def to_string(
         res.append(_row_to_string(y_pos, size[0], blocked, known, solved))
         res.append(row_separator)
     return "\n".join(res)
+
+
+def _cell_to_strings(
+    puzzle: gr.Puzzle, grid: gr.Grid | None, num: int
+) -> tuple[str, str, str]:
+    cell = puzzle.cells[num]
+    clue = cell & gr.VALUE_MASK
+    if cell & gr.BLOCKED:
+        return "###", f"#{clue}#" if clue else "###", "###"
+    if clue:
+        return "  !", f" {clue} ", "   "
+    value = grid.values[num] if grid is not None else 0
+    return "   ", f" {value or ' '} ", "   "
+
+
+def _puzzle_row_to_string(puzzle: gr.Puzzle, grid: gr.Grid | None, y_pos: int) -> str:
+    rows = zip(*(_cell_to_strings(puzzle, grid, _) for _ in puzzle.row_indices(y_pos)))
+    return "\n".join("|" + "|".join(_) + "|" for _ in rows)
+
+
+def puzzle_to_string(puzzle: gr.Puzzle, grid: gr.Grid | None = None) -> str:
+    row_separator = _row_separator(puzzle.width)
+    res = [row_separator]
+    for y_pos in range(puzzle.height):
+        res.append(_puzzle_row_to_string(puzzle, grid, y_pos))
+        res.append(row_separator)
+    return "\n".join(res)
@@ -0,0 +1,141 @@
+import collections
+
+from . import _layout_index as li
+
+_Position = tuple[int, int]
+_LineValue = tuple[int, int, int]
+
+
+def _lines(pos: _Position) -> tuple[tuple[int, int], tuple[int, int]]:
+    return (0, pos[1]), (1, pos[0])
+
+
+def _span(mask: int) -> int:
+    return mask.bit_length() - (mask & -mask).bit_length() + 1 if mask else 0
+
+
+class _LineCounts:
+    def __init__(self, blocked: set[_Position], known: dict[_Position, int]) -> None:
+        self.blocked_masks: dict[tuple[int, int], int] = collections.defaultdict(int)
+        for pos in blocked & known.keys():
+            for line in _lines(pos):
+                self.blocked_masks[line] |= 1 << known[pos]
+        self.holders: dict[_LineValue, set[_Position]] = collections.defaultdict(set)
+        self.duplicates: set[_LineValue] = set()
+        self.clashes: set[_Position] = set()
+
+    def add(self, pos: _Position, value: int) -> None:
+        for axis, num in _lines(pos):
+            key = (axis, num, value)
+            self.holders[key].add(pos)
+            if len(self.holders[key]) > 1:
+                self.duplicates.add(key)
+            if self.blocked_masks[axis, num] >> value & 1:
+                self.clashes.add(pos)
+
+    def remove(self, pos: _Position, value: int) -> None:
+        self.clashes.discard(pos)
+        for axis, num in _lines(pos):
+            key = (axis, num, value)
+            self.holders[key].discard(pos)
+            if len(self.holders[key]) < 2:
+                self.duplicates.discard(key)
+
+    def conflicts(self) -> set[_Position]:
+        res = set(self.clashes)
+        for key in self.duplicates:
+            res |= self.holders[key]
+        return res
+
+
+class _CompartmentCounts:
+    def __init__(self, index: li.LayoutIndex, value_limit: int) -> None:
+        self.index = index
+        self.counts = [[0] * (value_limit + 1) for _ in index.compartments]
+        self.masks = [0] * len(index.compartments)
+        self.broken: set[int] = set()
+
+    def _update(self, num: int) -> None:
+        if _span(self.masks[num]) > len(self.index.compartments[num]):
+            self.broken.add(num)
+        else:
+            self.broken.discard(num)
+
+    def add(self, pos: _Position, value: int) -> None:
+        for num in self.index.compartments_of[pos]:
+            self.counts[num][value] += 1
+            self.masks[num] |= 1 << value
+            self._update(num)
+
+    def remove(self, pos: _Position, value: int) -> None:
+        for num in self.index.compartments_of[pos]:
+            self.counts[num][value] -= 1
+            if not self.counts[num][value]:
+                self.masks[num] &= ~(1 << value)
+            self._update(num)
+
+    def conflicts(self, values: dict[_Position, int]) -> set[_Position]:
+        return {
+            _
+            for num in self.broken
+            for _ in self.index.compartments[num]
+            if _ in values
+        }
+
+
+class PartialGridValidator:
+    def __init__(
+        self,
+        size: tuple[int, int],
+        blocked: set[_Position],
+        known: dict[_Position, int],
+    ) -> None:
+        self._index = li.get_layout_index(size, blocked)
+        self.value_limit = max(size)
+        self.clues = {_: known[_] for _ in known if _ not in blocked}
+        self.values: dict[_Position, int] = {}
+        self._lines = _LineCounts(blocked, known)
+        self._compartments = _CompartmentCounts(self._index, self.value_limit)
+        for pos, value in self.clues.items():
+            self._check_entry(pos, value)
+            self._add(pos, value)
+
+    def _check_entry(self, pos: _Position, value: int) -> None:
+        if pos not in self._index.compartments_of:
+            raise ValueError("Position is not an open cell")
+        if not 0 < value <= self.value_limit:
+            raise ValueError("Invalid value")
+
+    def _check_is_not_clue(self, pos: _Position) -> None:
+        if pos in self.clues:
+            raise ValueError("Can not change a clue")
+
+    def _add(self, pos: _Position, value: int) -> None:
+        self.values[pos] = value
+        self._lines.add(pos, value)
+        self._compartments.add(pos, value)
+
+    def _remove(self, pos: _Position) -> None:
+        value = self.values.pop(pos)
+        self._lines.remove(pos, value)
+        self._compartments.remove(pos, value)
+
+    def place(self, pos: _Position, value: int) -> None:
+        self._check_entry(pos, value)
+        self._check_is_not_clue(pos)
+        if pos in self.values:
+            self._remove(pos)
+        self._add(pos, value)
+
+    def erase(self, pos: _Position) -> None:
+        self._check_is_not_clue(pos)
+        if pos in self.values:
+            self._remove(pos)
+
+    def conflicts(self) -> set[_Position]:
+        return self._lines.conflicts() | self._compartments.conflicts(self.values)
+
+    def is_valid(self) -> bool:
+        return not (
+            self._lines.clashes or self._lines.duplicates or self._compartments.broken
+        )
@@ -0,0 +1,93 @@
+import collections
+import typing
+
+from . import _batch as bt
+from . import steps as st
+
+WEIGHTS = {
+    "naked single": 1,
+    "hidden single": 2,
+    "stranded digits": 3,
+    "required digits": 4,
+    "naked pair": 6,
+    "hidden pair": 8,
+}
+
+GUESS_WEIGHT = 50
+
+
+class Rating(typing.NamedTuple):
+    score: int
+    techniques: dict[str, int]
+    depth: int
+
+
+class BatchRating(typing.NamedTuple):
+    item_num: int
+    rating: Rating | None
+    error: str | None
+
+
+def _guess_cell(engine: st.StepEngine) -> tuple[int, int]:
+    counts = [_.bit_count() for _ in engine.domains]
+    cell = min(
+        (_ for _, count in enumerate(counts) if count > 1), key=counts.__getitem__
+    )
+    return engine.layout.cells[cell]
+
+
+def _search(engine: st.StepEngine, counts: collections.Counter) -> int:
+    counts.update(engine.gen_techniques())
+    if engine.is_solved:
+        return 0
+    pos = _guess_cell(engine)
+    for value in engine.candidates(pos):
+        branch = engine.copy()
+        branch_counts: collections.Counter = collections.Counter()
+        try:
+            branch.place(pos, value)
+            depth = _search(branch, branch_counts)
+        except ValueError:
+            continue
+        counts.update(branch_counts)
+        return depth + 1
+    raise ValueError("Puzzle has no solution")
+
+
+def rate(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> Rating:
+    counts: collections.Counter = collections.Counter()
+    depth = _search(st.StepEngine(size, blocked, known), counts)
+    return Rating(
+        score=sum(WEIGHTS[_] * count for _, count in counts.items())
+        + GUESS_WEIGHT * depth,
+        techniques=dict(counts),
+        depth=depth,
+    )
+
+
+def _rate_item(
+    item_num: int,
+    puzzle: tuple[tuple[int, int], set[tuple[int, int]], dict[tuple[int, int], int]],
+    _options: dict[str, typing.Any],
+) -> BatchRating:
+    try:
+        return BatchRating(item_num, rate(*puzzle), None)
+    except ValueError as error:
+        return BatchRating(item_num, None, str(error))
+
+
+def rate_many(
+    puzzles: typing.Iterable[
+        tuple[tuple[int, int], set[tuple[int, int]], dict[tuple[int, int], int]]
+    ],
+    workers: int | None = None,
+    chunksize: int = 64,
+    ordered: bool = True,
+) -> typing.Iterator[BatchRating]:
+    yield from bt.map_items(
+        _rate_item, puzzles, {}, workers=workers, chunksize=chunksize, ordered=ordered
+    )
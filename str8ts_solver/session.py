@@ -0,0 +1,59 @@
+import z3  # type: ignore
+
+from . import _check_solution as cs
+from . import _z3_solver as zs
+
+
+class Session:
+    def __init__(
+        self,
+        size: tuple[int, int],
+        blocked: set[tuple[int, int]],
+        known: dict[tuple[int, int], int],
+        *,
+        encoding: str = "int",
+    ) -> None:
+        if not cs.is_input_valid(size, blocked, known):
+            raise ValueError("Invalid input")
+        self._checker = zs.AssumptionSolver(size, blocked, encoding, z3.Context())
+        self._checker.add_blocked_clues(known)
+        self.clues = {_: known[_] for _ in known if _ not in blocked}
+        self.entries: dict[tuple[int, int], int] = {}
+        self._status: str | None = None
+
+    def _check_entry(self, pos: tuple[int, int]) -> None:
+        if pos not in self._checker.unknowns:
+            raise ValueError("Position is not an open cell")
+        if pos in self.clues:
+            raise ValueError("Can not change a clue")
+
+    def place(self, pos: tuple[int, int], value: int) -> None:
+        self._check_entry(pos)
+        if not 0 < value <= max(self._checker.size):
+            raise ValueError("Invalid value")
+        if self.entries.get(pos) != value:
+            self.entries[pos] = value
+            self._status = None
+
+    def erase(self, pos: tuple[int, int]) -> None:
+        self._check_entry(pos)
+        if self.entries.pop(pos, None) is not None:
+            self._status = None
+
+    def _check(self) -> str:
+        if self._status is None:
+            self._status = str(self._checker.check(self.clues | self.entries))
+        return self._status
+
+    def is_solvable(self) -> bool:
+        return self._check() == "sat"
+
+    def conflicts(self) -> dict[tuple[int, int], int]:
+        if self._check() != "unsat":
+            return {}
+        return dict(self._checker.core())
+
+    def solution(self) -> dict[tuple[int, int], int] | None:
+        if self._check() != "sat":
+            return None
+        return self._checker.read_solution()
@@ -0,0 +1,221 @@
+import itertools
+import json
+import sqlite3
+import time
+import typing
+
+from . import _precheck as pc
+from . import canonical as cn
+from . import grid as gr
+from . import solver as sl
+
+_Puzzle = tuple[tuple[int, int], set[tuple[int, int]], dict[tuple[int, int], int]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    digest TEXT PRIMARY KEY,
+    solution BLOB,
+    used INTEGER NOT NULL
+)
+"""
+
+_USED_INDEX = "CREATE INDEX IF NOT EXISTS solutions_used ON solutions (used)"
+
+_SELECT = (
+    "SELECT digest, solution, used FROM solutions"
+    " WHERE digest IN (SELECT value FROM json_each(?))"
+)
+
+_TOUCH = (
+    "UPDATE solutions SET used = ? WHERE digest IN (SELECT value FROM json_each(?))"
+)
+
+_EVICT = (
+    "DELETE FROM solutions WHERE digest IN"
+    " (SELECT digest FROM solutions ORDER BY used LIMIT ?)"
+)
+
+_EVICTION_SLACK = 0.01
+
+
+def _gen_batches(items: typing.Iterable, batch_size: int) -> typing.Iterator[list]:
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
+
+
+def _from_canonical(
+    form: cn.CanonicalForm,
+    size: tuple[int, int],
+    solved: dict[tuple[int, int], int] | None,
+) -> dict[tuple[int, int], int] | None:
+    return None if solved is None else cn.from_canonical(size, form.transform, solved)
+
+
+def _to_solved(
+    form: cn.CanonicalForm, size: tuple[int, int], solution: bytes | None
+) -> dict[tuple[int, int], int] | None:
+    if solution is None:
+        return None
+    return _from_canonical(form, size, gr.Grid(*form.puzzle.size, solution).to_dict())
+
+
+def _to_solution(
+    form: cn.CanonicalForm, solved: dict[tuple[int, int], int] | None
+) -> bytes | None:
+    return (
+        None if solved is None else gr.Grid.from_dict(form.puzzle.size, solved).values
+    )
+
+
+def _try_canonicalize(puzzle: _Puzzle) -> cn.CanonicalForm | str:
+    try:
+        return cn.canonicalize(*puzzle)
+    except ValueError as error:
+        return str(error)
+
+
+def _to_result(
+    item_num: int, puzzle: _Puzzle, solved: dict[tuple[int, int], int] | None
+) -> sl.BatchResult:
+    if solved is None:
+        return sl.BatchResult(
+            item_num, None, None, "unsat", pc.find_contradiction(*puzzle)
+        )
+    return sl.BatchResult(item_num, solved, None, "sat")
+
+
+class SolutionStore:
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_entries: int | None = None,
+        timeout: float = 30.0,
+        touch_interval: float = 60.0,
+    ) -> None:
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self._unchecked = 0
+        self._connection = sqlite3.connect(path, timeout=timeout)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(_SCHEMA)
+            self._connection.execute(_USED_INDEX)
+
+    def __enter__(self) -> "SolutionStore":
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def get_many(self, digests: typing.Iterable[str]) -> dict[str, bytes | None]:
+        res: dict[str, bytes | None] = {}
+        now = time.time_ns()
+        stale = []
+        for digest, solution, used in self._connection.execute(
+            _SELECT, (json.dumps(list(set(digests))),)
+        ):
+            res[digest] = solution
+            if now - used >= 1e9 * self.touch_interval:
+                stale.append(digest)
+        if stale:
+            with self._connection:
+                self._connection.execute(_TOUCH, (now, json.dumps(stale)))
+        return res
+
+    def _evict(self, max_entries: int) -> None:
+        excess = len(self) - max_entries
+        if excess > 0:
+            self._connection.execute(_EVICT, (excess,))
+        self._unchecked = 0
+
+    def put_many(self, items: typing.Iterable[tuple[str, bytes | None]]) -> None:
+        now = time.time_ns()
+        rows = [(digest, solution, now) for digest, solution in items]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?)", rows
+            )
+            if self.max_entries is None:
+                return
+            self._unchecked += len(rows)
+            if self._unchecked >= max(1, _EVICTION_SLACK * self.max_entries):
+                self._evict(self.max_entries)
+
+    def solve(
+        self,
+        size: tuple[int, int],
+        blocked: set[tuple[int, int]],
+        known: dict[tuple[int, int], int],
+        **options,
+    ) -> dict[tuple[int, int], int] | None:
+        form = cn.canonicalize(size, blocked, known)
+        found = self.get_many([form.digest])
+        if form.digest not in found:
+            solved = sl.solve(*form.puzzle.to_dicts(), **options)
+            found[form.digest] = _to_solution(form, solved)
+            self.put_many(found.items())
+        return _to_solved(form, size, found[form.digest])
+
+    def _solve_missing(
+        self, missing: dict[str, cn.CanonicalForm], options: dict[str, typing.Any]
+    ) -> dict[str, sl.BatchResult]:
+        if not missing:
+            return {}
+        digests = list(missing)
+        results = {
+            digests[_.item_num]: _
+            for _ in sl.solve_many(
+                [_.puzzle.to_dicts() for _ in missing.values()], **options
+            )
+        }
+        self.put_many(
+            (digest, _to_solution(missing[digest], result.solved))
+            for digest, result in results.items()
+            if result.status in ("sat", "unsat")
+        )
+        return results
+
+    def _solve_batch(
+        self, start: int, puzzles: list[_Puzzle], options: dict[str, typing.Any]
+    ) -> typing.Iterator[sl.BatchResult]:
+        forms = dict(enumerate(map(_try_canonicalize, puzzles), start))
+        valid = {_.digest: _ for _ in forms.values() if isinstance(_, cn.CanonicalForm)}
+        found = self.get_many(valid)
+        computed = self._solve_missing(
+            {digest: form for digest, form in valid.items() if digest not in found},
+            options,
+        )
+        for (item_num, form), puzzle in zip(forms.items(), puzzles, strict=True):
+            if isinstance(form, str):
+                yield sl.BatchResult(item_num, None, form, "error")
+            elif form.digest in found:
+                yield _to_result(
+                    item_num, puzzle, _to_solved(form, puzzle[0], found[form.digest])
+                )
+            elif (result := computed[form.digest]).status in ("sat", "unsat"):
+                yield _to_result(
+                    item_num, puzzle, _from_canonical(form, puzzle[0], result.solved)
+                )
+            else:
+                yield result._replace(item_num=item_num)
+
+    def solve_many(
+        self,
+        puzzles: typing.Iterable[_Puzzle],
+        *,
+        batch_size: int = 256,
+        **options,
+    ) -> typing.Iterator[sl.BatchResult]:
+        for num, batch in enumerate(_gen_batches(puzzles, batch_size)):
+            yield from self._solve_batch(num * batch_size, batch, options)
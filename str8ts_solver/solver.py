@@ -1,135 +1,377 @@
+import contextlib
+import importlib
 import itertools
+import time
+import typing
 
-import z3  # type: ignore
-
-from . import _active_cells_utils as au
+from . import _batch as bt
 from . import _check_solution as cs
-from . import _str8ts_utils as su
+from . import _lru_cache as lc
+from . import _native_solver as ns
+from . import _precheck as pc
+from . import grid as gr
 
+_ENCODINGS = ("int", "bitvec", "onehot")
 
-def _define_unknowns(size: tuple[int, int], blocked: set[tuple[int, int]]):
-    return {
-        (x_pos, y_pos): z3.Int(f"u_{x_pos}_{y_pos}")
-        for x_pos, y_pos in su.gen_unknowns_positions(size, blocked)
-    }
+_ONEHOT_ABOVE = 9
 
 
-def _add_basic_constrains(solver, unknowns, known, value_limit) -> None:
-    for pos, unknown in unknowns.items():
-        if pos in known:
-            solver.add(unknown == known[pos])
-        else:
-            solver.add(0 < unknown)
-            solver.add(unknown <= value_limit)
+def _resolve_encoding(encoding: str, size: tuple[int, int]) -> str:
+    if encoding == "auto":
+        return "onehot" if max(size) > _ONEHOT_ABOVE else "int"
+    if encoding not in _ENCODINGS:
+        raise ValueError(f"Unknown encoding: {encoding}")
+    return encoding
 
 
-def _add_constrains_from_blocked(
-    solver,
-    unknowns,
-    size: tuple[int, int],
-    blocked: set[tuple[int, int]],
-    known: dict[tuple[int, int], int],
-) -> None:
-    for blocked_pos in blocked:
-        if blocked_pos in known:
-            for _ in au.gen_position_in_this_col_row(blocked_pos, size, blocked):
-                solver.add(unknowns[_] != known[blocked_pos])
+def _z3_solver():
+    return importlib.import_module("._z3_solver", __package__)
+
+
+_NO_TIMEOUT = 2**32 - 1
+
 
+class _Limits(typing.NamedTuple):
+    timeout_ms: int | None = None
+    rlimit: int | None = None
 
-def _add_distinct(solver, values) -> None:
-    if len(values) > 1:
-        solver.add(z3.Distinct(*values))
+    def apply(self, solver) -> None:
+        solver.set(
+            "timeout", _NO_TIMEOUT if self.timeout_ms is None else self.timeout_ms
+        )
+        solver.set("rlimit", 0 if self.rlimit is None else self.rlimit)
 
+    def reason(self, solver, used: dict[str, int | float]) -> str:
+        if self.rlimit is not None and used.get("rlimit count", 0) >= self.rlimit:
+            return "max. resource limit exceeded"
+        return solver.reason_unknown()
 
-def _add_block_constrain(
-    solver, unknowns, block: list[tuple[int, int]], block_id: str
-) -> None:
-    cur_limit = z3.Int(block_id)
-    solver.add(cur_limit > 0)
-    for _ in block:
-        solver.add(cur_limit <= unknowns[_])
-        solver.add(unknowns[_] < cur_limit + len(block))
-    _add_distinct(solver, [unknowns[_] for _ in block])
 
+class SolveTimeoutError(TimeoutError):
+    pass
 
-def _add_all_block_constrains(solver, unknowns, size: tuple[int, int]) -> None:
-    for block_num, cur_block in enumerate(su.gen_horizontal_blocks(size, unknowns)):
-        _add_block_constrain(solver, unknowns, cur_block, f"h_{block_num}")
 
-    for block_num, cur_block in enumerate(su.gen_vertical_blocks(size, unknowns)):
-        _add_block_constrain(solver, unknowns, cur_block, f"v_{block_num}")
+class SolveResult:
+    __slots__ = (
+        "solved",
+        "status",
+        "reason",
+        "timings",
+        "num_constraints",
+        "num_variables",
+        "statistics",
+    )
 
+    def __init__(self, status: str, timings: dict[str, float]) -> None:
+        self.solved: dict[tuple[int, int], int] | None = None
+        self.status = status
+        self.reason: str | None = None
+        self.timings = timings
+        self.num_constraints = 0
+        self.num_variables = 0
+        self.statistics: dict[str, int | float] = {}
 
-def _add_entries_in_all_rows_are_unique_constrains(
-    solver, unknowns, size: tuple[int, int], blocked: set[tuple[int, int]]
-):
-    for y_pos in range(size[1]):
-        _add_distinct(
-            solver,
-            [unknowns[_] for _ in au.gen_positions_in_row(y_pos, size[0], blocked)],
+    def _sum_statistics(self, *names: str) -> int:
+        return sum(
+            int(value)
+            for name, value in self.statistics.items()
+            if name.removeprefix("sat ").startswith(names)
         )
 
+    @property
+    def conflicts(self) -> int:
+        return self._sum_statistics("conflicts")
+
+    @property
+    def decisions(self) -> int:
+        return self._sum_statistics("decisions")
+
+    @property
+    def propagations(self) -> int:
+        return self._sum_statistics("propagations")
+
+    @property
+    def memory(self) -> float:
+        return self.statistics.get("max memory", 0.0)
 
-def _add_entries_in_all_cols_are_unique_constrains(
-    solver, unknowns, size: tuple[int, int], blocked: set[tuple[int, int]]
-):
-    for x_pos in range(size[0]):
-        _add_distinct(
-            solver,
-            [unknowns[_] for _ in au.gen_positions_in_col(x_pos, size[1], blocked)],
+    def __repr__(self) -> str:
+        return (
+            f"SolveResult(status={self.status!r}, solved={self.solved!r},"
+            f" timings={self.timings!r})"
         )
 
 
-def _create_solver(
+@contextlib.contextmanager
+def _timed(timings: dict[str, float], phase: str) -> typing.Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - start
+
+
+class SolverCache(lc.LruCache):
+    def __init__(self, maxsize: int = 128) -> None:
+        super().__init__(maxsize)
+
+    def get(
+        self, size: tuple[int, int], blocked: set[tuple[int, int]], encoding_name: str
+    ):
+        return self._get_or_create(
+            (encoding_name, size, frozenset(blocked)),
+            lambda: _z3_solver().create_template(size, blocked, encoding_name),
+        )
+
+
+def _check(template, limits: _Limits, timings: dict[str, float]) -> SolveResult:
+    zs = _z3_solver()
+    encoding, unknowns, solver = template
+    limits.apply(solver)
+    before = zs.statistics(solver)
+    with _timed(timings, "check"):
+        result = SolveResult(str(solver.check()), timings)
+    if result.status == "sat":
+        with _timed(timings, "read_solution"):
+            result.solved = zs.read_solution(encoding, unknowns, solver)
+    result.num_constraints = len(solver.assertions())
+    result.num_variables = encoding.num_variables
+    result.statistics = zs.statistics_since(solver, before)
+    if result.status == "unknown":
+        result.reason = limits.reason(solver, result.statistics)
+    return result
+
+
+def _solve_with_template(
+    template, clues: list, limits: _Limits, timings: dict[str, float]
+) -> SolveResult:
+    solver = template[2]
+    solver.push()
+    try:
+        with _timed(timings, "create_solver"):
+            solver.add(*clues)
+        return _check(template, limits, timings)
+    finally:
+        solver.pop()
+
+
+def _solve_z3(  # pylint: disable=too-many-arguments
     size: tuple[int, int],
     blocked: set[tuple[int, int]],
     known: dict[tuple[int, int], int],
-):
-    solver = z3.Solver()
-    unknowns = _define_unknowns(size, blocked)
-    _add_basic_constrains(solver, unknowns, known, max(size))
-    _add_constrains_from_blocked(solver, unknowns, size, blocked, known)
-    _add_all_block_constrains(solver, unknowns, size)
-    _add_entries_in_all_cols_are_unique_constrains(solver, unknowns, size, blocked)
-    _add_entries_in_all_rows_are_unique_constrains(solver, unknowns, size, blocked)
+    *,
+    encoding_name: str,
+    cache: SolverCache | None,
+    limits: _Limits,
+    ctx,
+) -> SolveResult:
+    zs = _z3_solver()
+    timings: dict[str, float] = {}
+    if cache is not None:
+        if ctx is not None:
+            raise ValueError("cache can not be used with ctx")
+        with _timed(timings, "create_solver"):
+            template = cache.get(size, blocked, encoding_name)
+            clues = list(
+                zs.gen_clue_constrains(template[0], template[1], size, blocked, known)
+            )
+        return _solve_with_template(template, clues, limits, timings)
+    with _timed(timings, "create_solver"):
+        template = zs.create_solver(size, blocked, known, encoding_name, ctx)
+    return _check(template, limits, timings)
 
-    return unknowns, solver
 
-
-def _read_solution(unknowns, solver) -> dict[tuple[int, int], int]:
-    model = solver.model()
-    return {_: model[unknowns[_]].as_long() for _ in unknowns}
+def _solve_native(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+    *,
+    limits: _Limits,
+    **_options,
+) -> SolveResult:
+    if limits.rlimit is not None:
+        raise ValueError("rlimit requires the z3 backend")
+    timings: dict[str, float] = {}
+    try:
+        with _timed(timings, "search"):
+            solved = ns.solve(size, blocked, known, limits.timeout_ms)
+    except ns.SearchTimeout:
+        result = SolveResult("unknown", timings)
+        result.reason = "timeout"
+        return result
+    result = SolveResult("unsat" if solved is None else "sat", timings)
+    result.solved = solved
+    return result
 
 
-def _is_position_valid(pos: tuple[int, int], size: tuple[int, int]) -> bool:
-    return all(0 <= _p < _s for _p, _s in zip(pos, size, strict=True))
+_BACKENDS = {"z3": _solve_z3, "native": _solve_native}
 
 
-def _is_input_valid(
+def solve_detailed(  # pylint: disable=too-many-arguments
     size: tuple[int, int],
     blocked: set[tuple[int, int]],
     known: dict[tuple[int, int], int],
-) -> bool:
-    if min(size) <= 0:
-        return False
-    if not all(_is_position_valid(_, size) for _ in itertools.chain(blocked, known)):
-        return False
-    if not all(0 < _ <= max(size) for _ in known.values()):
-        return False
-    return True
+    *,
+    backend: str = "z3",
+    encoding: str = "auto",
+    cache: SolverCache | None = None,
+    timeout_ms: int | None = None,
+    rlimit: int | None = None,
+    ctx=None,
+) -> SolveResult:
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    encoding = _resolve_encoding(encoding, size)
+    if not cs.is_input_valid(size, blocked, known):
+        raise ValueError("Invalid input")
+    timings: dict[str, float] = {}
+    with _timed(timings, "precheck"):
+        reason = pc.find_contradiction(size, blocked, known)
+    if reason is not None:
+        result = SolveResult("unsat", timings)
+        result.reason = reason
+        return result
+    result = _BACKENDS[backend](
+        size,
+        blocked,
+        known,
+        encoding_name=encoding,
+        cache=cache,
+        limits=_Limits(timeout_ms, rlimit),
+        ctx=ctx,
+    )
+    result.timings = timings | result.timings
+    if result.solved is not None:
+        with _timed(result.timings, "is_solution_valid"):
+            is_valid = cs.is_solution_valid(size, blocked, known, result.solved)
+        if not is_valid:
+            raise RuntimeError("Result is incorrect")
+    return result
 
 
-def solve(
+def solve(  # pylint: disable=too-many-arguments
     size: tuple[int, int],
     blocked: set[tuple[int, int]],
     known: dict[tuple[int, int], int],
+    *,
+    backend: str = "z3",
+    encoding: str = "auto",
+    cache: SolverCache | None = None,
+    timeout_ms: int | None = None,
+    rlimit: int | None = None,
+    ctx=None,
 ) -> dict[tuple[int, int], int] | None:
-    if not _is_input_valid(size, blocked, known):
-        raise ValueError("Invalid input")
-    unknowns, solver = _create_solver(size, blocked, known)
-    if solver.check() != z3.sat:
+    result = solve_detailed(
+        size,
+        blocked,
+        known,
+        backend=backend,
+        encoding=encoding,
+        cache=cache,
+        timeout_ms=timeout_ms,
+        rlimit=rlimit,
+        ctx=ctx,
+    )
+    if result.status == "unknown":
+        raise SolveTimeoutError(result.reason)
+    return result.solved
+
+
+def solve_puzzle(puzzle: gr.Puzzle, **options) -> gr.Grid | None:
+    solved = solve(*puzzle.to_dicts(), **options)
+    if solved is None:
         return None
-    solved = _read_solution(unknowns, solver)
-    if not cs.is_solution_valid(size, blocked, known, solved):
-        raise RuntimeError("Result is incorrect")
-    return solved
+    return gr.Grid.from_dict(puzzle.size, solved)
+
+
+def iter_solutions(  # pylint: disable=too-many-arguments
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+    *,
+    encoding: str = "auto",
+    timeout_ms: int | None = None,
+    rlimit: int | None = None,
+) -> typing.Iterator[dict[tuple[int, int], int]]:
+    encoding = _resolve_encoding(encoding, size)
+    if not cs.is_input_valid(size, blocked, known):
+        raise ValueError("Invalid input")
+    if pc.find_contradiction(size, blocked, known) is not None:
+        return
+    zs = _z3_solver()
+    z3_encoding, unknowns, solver = zs.create_solver(size, blocked, known, encoding)
+    limits = _Limits(timeout_ms, rlimit)
+    limits.apply(solver)
+    before = zs.statistics(solver)
+    while (res := str(solver.check())) == "sat":
+        solved = zs.read_solution(z3_encoding, unknowns, solver)
+        yield solved
+        solver.add(zs.blocking_clause(z3_encoding, unknowns, solved))
+        before = zs.statistics(solver)
+    if res == "unknown":
+        raise SolveTimeoutError(
+            limits.reason(solver, zs.statistics_since(solver, before))
+        )
+
+
+def count_solutions(  # pylint: disable=too-many-arguments
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+    limit: int | None = 2,
+    *,
+    encoding: str = "auto",
+    timeout_ms: int | None = None,
+    rlimit: int | None = None,
+) -> int:
+    solutions = iter_solutions(
+        size, blocked, known, encoding=encoding, timeout_ms=timeout_ms, rlimit=rlimit
+    )
+    return sum(1 for _ in itertools.islice(solutions, limit))
+
+
+def has_unique_solution(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+    **options,
+) -> bool:
+    return count_solutions(size, blocked, known, limit=2, **options) == 1
+
+
+class BatchResult(typing.NamedTuple):
+    item_num: int
+    solved: dict[tuple[int, int], int] | None
+    error: str | None
+    status: str
+    reason: str | None = None
+
+
+def _solve_item(
+    item_num: int,
+    puzzle: tuple[tuple[int, int], set[tuple[int, int]], dict[tuple[int, int], int]],
+    options: dict[str, typing.Any],
+) -> BatchResult:
+    try:
+        result = solve_detailed(*puzzle, **options)
+    except ValueError as error:
+        return BatchResult(item_num, None, str(error), "error")
+    return BatchResult(item_num, result.solved, None, result.status, result.reason)
+
+
+def solve_many(
+    puzzles: typing.Iterable[
+        tuple[tuple[int, int], set[tuple[int, int]], dict[tuple[int, int], int]]
+    ],
+    workers: int | None = None,
+    chunksize: int = 16,
+    ordered: bool = True,
+    **options,
+) -> typing.Iterator[BatchResult]:
+    yield from bt.map_items(
+        _solve_item,
+        puzzles,
+        options,
+        workers=workers,
+        chunksize=chunksize,
+        ordered=ordered,
+    )
@@ -0,0 +1,338 @@
+import copy
+import itertools
+import typing
+
+from . import _check_solution as cs
+from . import _propagation as pr
+
+_Position = tuple[int, int]
+
+
+class Step(typing.NamedTuple):
+    technique: str
+    cells: tuple[_Position, ...]
+    values: tuple[int, ...]
+    placement: tuple[_Position, int] | None
+    eliminations: tuple[tuple[_Position, int], ...]
+
+
+def _gen_eliminations(
+    domains: list[int], cells: typing.Iterable[int], mask: int
+) -> typing.Iterator[tuple[int, int]]:
+    for cell in cells:
+        if domains[cell] & mask:
+            for value in pr.gen_values(domains[cell] & mask):
+                yield cell, value
+
+
+class _Move(typing.NamedTuple):
+    technique: str
+    cells: typing.Iterable[int]
+    values: typing.Iterable[int]
+    eliminations: list[tuple[int, int]]
+    placement: tuple[int, int] | None = None
+
+
+class _Unchecked(typing.NamedTuple):
+    cells: set[int]
+    lines: set[int]
+    stranded: set[int]
+    required: set[int]
+
+
+def _first_found(
+    unchecked: set[int], find: typing.Callable[[int], _Move | None]
+) -> _Move | None:
+    for num in sorted(unchecked):
+        res = find(num)
+        if res is not None:
+            return res
+        unchecked.discard(num)
+    return None
+
+
+class StepEngine:
+    def __init__(
+        self,
+        size: tuple[int, int],
+        blocked: set[tuple[int, int]],
+        known: dict[tuple[int, int], int],
+    ) -> None:
+        if not cs.is_input_valid(size, blocked, known):
+            raise ValueError("Invalid input")
+        self.layout = pr.make_layout(size, blocked)
+        try:
+            self.domains = pr.initial_domains(self.layout, size, blocked, known)
+        except pr.Contradiction as error:
+            raise ValueError("Puzzle has no solution") from error
+        self._ranges: list[tuple[int, int] | None] = [None] * len(
+            self.layout.compartments
+        )
+        self._solved: set[int] = set()
+        self._unchecked = _Unchecked(
+            cells=set(range(len(self.layout.cells))),
+            lines=set(range(len(self.layout.lines))),
+            stranded=set(range(len(self.layout.compartments))),
+            required=set(range(len(self.layout.compartments))),
+        )
+        for pos, value in known.items():
+            if pos not in blocked:
+                self._place(self.layout.cell_index[pos], value)
+
+    def _position(self, cell: int) -> _Position:
+        return self.layout.cells[cell]
+
+    def _set_domain(self, cell: int, domain: int) -> None:
+        if not domain:
+            raise ValueError("Puzzle has no solution")
+        self.domains[cell] = domain
+        self._unchecked.cells.add(cell)
+        for _ in self.layout.cell_compartments[cell]:
+            self._ranges[_] = None
+            self._unchecked.stranded.add(_)
+        for _ in self.layout.cell_lines[cell]:
+            self._unchecked.lines.add(_)
+            self._unchecked.required.update(self.layout.line_compartments[_])
+
+    def _place(self, cell: int, value: int) -> None:
+        for peer, peer_value in self._placement_eliminations(cell, value):
+            self._eliminate(peer, peer_value)
+        self._set_domain(cell, 1 << value)
+        self._solved.add(cell)
+
+    def _eliminate(self, cell: int, value: int) -> None:
+        self._set_domain(cell, self.domains[cell] & ~(1 << value))
+
+    def _placement_eliminations(self, cell: int, value: int) -> list[tuple[int, int]]:
+        return list(
+            _gen_eliminations(self.domains, self.layout.peers[cell], 1 << value)
+        )
+
+    def _to_step(self, move: _Move) -> Step:
+        return Step(
+            technique=move.technique,
+            cells=tuple(self._position(_) for _ in move.cells),
+            values=tuple(move.values),
+            placement=(
+                None
+                if move.placement is None
+                else (self._position(move.placement[0]), move.placement[1])
+            ),
+            eliminations=tuple(
+                (self._position(cell), value) for cell, value in move.eliminations
+            ),
+        )
+
+    def _placement_move(self, technique: str, cells: list[int], value: int) -> _Move:
+        return _Move(
+            technique,
+            cells,
+            [value],
+            self._placement_eliminations(cells[0], value),
+            (cells[0], value),
+        )
+
+    def _straight_ranges(self, compartment_num: int) -> tuple[int, int]:
+        res = self._ranges[compartment_num]
+        if res is None:
+            try:
+                res = pr.straight_ranges(
+                    self.domains,
+                    self.layout.compartments[compartment_num],
+                    self.layout.value_limit,
+                )
+            except pr.Contradiction as error:
+                raise ValueError("Puzzle has no solution") from error
+            self._ranges[compartment_num] = res
+        return res
+
+    def _required_in_line(self, line_num: int) -> int:
+        res = 0
+        for _ in self.layout.line_compartments[line_num]:
+            res |= self._straight_ranges(_)[1]
+        return res
+
+    def _cells_with(self, line: list[int], value: int) -> list[int]:
+        return [_ for _ in line if self.domains[_] >> value & 1]
+
+    def _naked_single_at(self, cell: int) -> _Move | None:
+        domain = self.domains[cell]
+        if cell in self._solved or domain.bit_count() != 1:
+            return None
+        return self._placement_move("naked single", [cell], domain.bit_length() - 1)
+
+    def _unique_unsolved_values(self, line: list[int]) -> int:
+        once = twice = solved = 0
+        for cell in line:
+            domain = self.domains[cell]
+            twice |= once & domain
+            once |= domain
+            if cell in self._solved:
+                solved |= domain
+        return once & ~twice & ~solved
+
+    def _hidden_single_in(self, line_num: int) -> _Move | None:
+        line = self.layout.lines[line_num]
+        unique = self._unique_unsolved_values(line)
+        if unique:
+            unique &= self._required_in_line(line_num)
+        for value in pr.gen_values(unique):
+            return self._placement_move(
+                "hidden single", self._cells_with(line, value), value
+            )
+        return None
+
+    def _stranded_digits_in(self, num: int) -> _Move | None:
+        compartment = self.layout.compartments[num]
+        possible = self._straight_ranges(num)[0]
+        eliminations = list(_gen_eliminations(self.domains, compartment, ~possible))
+        if not eliminations:
+            return None
+        return _Move(
+            "stranded digits",
+            compartment,
+            sorted({_[1] for _ in eliminations}),
+            eliminations,
+        )
+
+    def _required_digits_in(self, num: int) -> _Move | None:
+        required = self._straight_ranges(num)[1]
+        eliminations = list(
+            _gen_eliminations(
+                self.domains, self.layout.compartment_rests[num], required
+            )
+        )
+        if not eliminations:
+            return None
+        return _Move(
+            "required digits",
+            self.layout.compartments[num],
+            pr.gen_values(required),
+            eliminations,
+        )
+
+    def _find_naked_pair(self) -> _Move | None:
+        for line in self.layout.lines:
+            pairs = [_ for _ in line if self.domains[_].bit_count() == 2]
+            for first, second in itertools.combinations(pairs, 2):
+                mask = self.domains[first]
+                if self.domains[second] != mask:
+                    continue
+                rest = [_ for _ in line if _ not in (first, second)]
+                eliminations = list(_gen_eliminations(self.domains, rest, mask))
+                if eliminations:
+                    return _Move(
+                        "naked pair", [first, second], pr.gen_values(mask), eliminations
+                    )
+        return None
+
+    def _values_in_two_cells(self, line: list[int]) -> int:
+        once = twice = more = 0
+        for cell in line:
+            domain = self.domains[cell]
+            more |= twice & domain
+            twice |= once & domain
+            once |= domain
+        return twice & ~more
+
+    def _hidden_pair_in(self, line_num: int) -> _Move | None:
+        line = self.layout.lines[line_num]
+        pairs = self._values_in_two_cells(line)
+        if pairs.bit_count() < 2:
+            return None
+        holders = {
+            value: self._cells_with(line, value)
+            for value in pr.gen_values(pairs & self._required_in_line(line_num))
+        }
+        for first, second in itertools.combinations(holders, 2):
+            cells = holders[first]
+            if holders[second] != cells:
+                continue
+            mask = (1 << first) | (1 << second)
+            eliminations = list(_gen_eliminations(self.domains, cells, ~mask))
+            if eliminations:
+                return _Move("hidden pair", cells, [first, second], eliminations)
+        return None
+
+    def _find_hidden_pair(self) -> _Move | None:
+        for line_num in range(len(self.layout.lines)):
+            res = self._hidden_pair_in(line_num)
+            if res is not None:
+                return res
+        return None
+
+    def _next_move(self) -> _Move | None:
+        for unchecked, find in (
+            (self._unchecked.cells, self._naked_single_at),
+            (self._unchecked.lines, self._hidden_single_in),
+            (self._unchecked.stranded, self._stranded_digits_in),
+            (self._unchecked.required, self._required_digits_in),
+        ):
+            res = _first_found(unchecked, find)
+            if res is not None:
+                return res
+        return self._find_naked_pair() or self._find_hidden_pair()
+
+    def next_step(self) -> Step | None:
+        move = self._next_move()
+        return None if move is None else self._to_step(move)
+
+    def _apply(
+        self, eliminations: list[tuple[int, int]], placement: tuple[int, int] | None
+    ) -> None:
+        for cell, value in eliminations:
+            self._eliminate(cell, value)
+        if placement is not None:
+            cell, value = placement
+            self._set_domain(cell, 1 << value)
+            self._solved.add(cell)
+
+    def apply(self, step: Step) -> None:
+        index = self.layout.cell_index
+        self._apply(
+            [(index[pos], value) for pos, value in step.eliminations],
+            (
+                None
+                if step.placement is None
+                else (index[step.placement[0]], step.placement[1])
+            ),
+        )
+
+    def place(self, pos: tuple[int, int], value: int) -> None:
+        cell = self.layout.cell_index[pos]
+        if not self.domains[cell] >> value & 1:
+            raise ValueError("Value is not a candidate")
+        self._place(cell, value)
+
+    def copy(self) -> "StepEngine":
+        res = copy.copy(self)
+        res.__dict__.update(
+            domains=list(self.domains),
+            _ranges=list(self._ranges),
+            _solved=set(self._solved),
+            _unchecked=_Unchecked(*(set(_) for _ in self._unchecked)),
+        )
+        return res
+
+    def candidates(self, pos: tuple[int, int]) -> list[int]:
+        return list(pr.gen_values(self.domains[self.layout.cell_index[pos]]))
+
+    @property
+    def solved(self) -> dict[tuple[int, int], int]:
+        return {
+            self._position(_): self.domains[_].bit_length() - 1 for _ in self._solved
+        }
+
+    @property
+    def is_solved(self) -> bool:
+        return len(self._solved) == len(self.layout.cells)
+
+    def gen_steps(self) -> typing.Iterator[Step]:
+        while (step := self.next_step()) is not None:
+            self.apply(step)
+            yield step
+
+    def gen_techniques(self) -> typing.Iterator[str]:
+        while (move := self._next_move()) is not None:
+            self._apply(move.eliminations, move.placement)
+            yield move.technique
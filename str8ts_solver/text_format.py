@@ -0,0 +1,117 @@
+import functools
+import typing
+
+from . import grid as gr
+
+BLANK = "."
+BLOCKED = "#"
+UNSOLVED = "-"
+CLUES = "123456789ABCDEFGHIJKLMNOPQ"
+BLOCKED_CLUES = "abcdefghijklmnopqrstuvwxyz"
+
+_INVALID = 0xFF
+
+
+def _gen_codes() -> typing.Iterator[tuple[str, int]]:
+    yield BLANK, 0
+    yield BLOCKED, gr.BLOCKED
+    yield from ((char, num) for num, char in enumerate(CLUES, 1))
+    yield from ((char, gr.BLOCKED | num) for num, char in enumerate(BLOCKED_CLUES, 1))
+
+
+@functools.lru_cache(maxsize=None)
+def _decode_table(value_limit: int) -> bytes:
+    res = bytearray([_INVALID] * 256)
+    for char, cell in _gen_codes():
+        if cell & gr.VALUE_MASK <= value_limit:
+            res[ord(char)] = cell
+    return bytes(res)
+
+
+def _encode_table() -> bytes:
+    res = bytearray([_INVALID] * 256)
+    for char, cell in _gen_codes():
+        res[cell] = ord(char)
+    return bytes(res)
+
+
+_ENCODE = _encode_table()
+
+
+def _parse_size(header: str) -> tuple[int, int]:
+    width, separator, height = header.partition("x")
+    if not separator or not width.isdigit() or not height.isdigit():
+        raise ValueError("Invalid input")
+    return int(width), int(height)
+
+
+def parse_puzzle(line: str) -> gr.Puzzle:
+    header, _, body = line.strip().partition(":")
+    width, height = _parse_size(header)
+    value_limit = min(max(width, height), len(CLUES))
+    cells = body.encode("ascii", "replace").translate(_decode_table(value_limit))
+    if _INVALID in cells:
+        raise ValueError("Invalid input")
+    return gr.Puzzle(width, height, cells)
+
+
+def format_puzzle(puzzle: gr.Puzzle) -> str:
+    body = puzzle.cells.translate(_ENCODE)
+    if _INVALID in body:
+        raise ValueError("Invalid input")
+    return f"{puzzle.width}x{puzzle.height}:{body.decode('ascii')}"
+
+
+def format_solution(puzzle: gr.Puzzle, grid: gr.Grid | None) -> str:
+    if grid is None:
+        return f"{puzzle.width}x{puzzle.height}:{UNSOLVED}"
+    if grid.size != puzzle.size:
+        raise ValueError("Invalid input")
+    return format_puzzle(
+        gr.Puzzle(
+            puzzle.width,
+            puzzle.height,
+            bytes(
+                cell if cell & gr.BLOCKED else value
+                for cell, value in zip(puzzle.cells, grid.values, strict=True)
+            ),
+        )
+    )
+
+
+def parse_solution(line: str) -> tuple[tuple[int, int], gr.Grid | None]:
+    header, _, body = line.strip().partition(":")
+    size = _parse_size(header)
+    if body == UNSOLVED:
+        return size, None
+    solved = parse_puzzle(line)
+    return size, gr.Grid(
+        size[0],
+        size[1],
+        bytes(0 if _ & gr.BLOCKED else _ for _ in solved.cells),
+    )
+
+
+def iter_puzzles(fileobj: typing.Iterable[str]) -> typing.Iterator[gr.Puzzle]:
+    for line in fileobj:
+        if line.strip():
+            yield parse_puzzle(line)
+
+
+def write_puzzles(fileobj: typing.TextIO, puzzles: typing.Iterable[gr.Puzzle]) -> int:
+    count = 0
+    for puzzle in puzzles:
+        fileobj.write(format_puzzle(puzzle) + "\n")
+        count += 1
+    return count
+
+
+def write_solutions(
+    fileobj: typing.TextIO,
+    results: typing.Iterable[tuple[gr.Puzzle, gr.Grid | None]],
+) -> int:
+    count = 0
+    for puzzle, grid in results:
+        fileobj.write(format_solution(puzzle, grid) + "\n")
+        count += 1
+    return count
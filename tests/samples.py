@@ -655,3 +655,13 @@ FULLY_BLOCKED = Sample(
 |###|
 +---+""",
 )
+
+ALL_SAMPLES = [
+    SAMPLE_1,
+    SAMPLE_2,
+    SAMPLE_3,
+    NO_SOLUTION,
+    SAMPLE_3_BY_2,
+    FULLY_BLOCKED_COLUMN,
+    FULLY_BLOCKED,
+]
@@ -0,0 +1,111 @@
+import asyncio
+import concurrent.futures
+import time
+
+import pytest
+
+from str8ts_solver import text_format as tf
+from str8ts_solver.async_solver import solve_async, solve_many_async
+
+from . import samples
+
+_SAMPLES = samples.ALL_SAMPLES
+
+# runs for minutes with the int encoding unless z3 is interrupted
+_HARD = tf.parse_puzzle(
+    "16x16:"
+    "...........##..."
+    "..#........##..."
+    ".....#..#...###."
+    ".....##.....####"
+    ".#..........###."
+    "....#..#........"
+    "...####........."
+    "..#####..#.#...."
+    "#...#..#...#...."
+    ".....#.#.#....#."
+    "..#.....#...#..."
+    "#...#....#.#..#."
+    "........#....#.#"
+    "..#..#......#.#."
+    ".....#.........."
+    "....###.....#..."
+).to_dicts()
+
+_CANCEL_DELAY = 1.0
+
+_RELEASE_BOUND = 0.5
+
+
+def _to_puzzle(sample: samples.Sample) -> tuple:
+    return sample.size, sample.blocked, sample.known
+
+
+@pytest.mark.parametrize("backend", ["z3", "native"])
+@pytest.mark.parametrize("sample", _SAMPLES)
+def test_solve_async(sample: samples.Sample, backend: str) -> None:
+    solved = asyncio.run(solve_async(*_to_puzzle(sample), backend=backend))
+    assert solved == sample.solved
+
+
+@pytest.mark.parametrize("encoding", ["int", "onehot"])
+def test_solve_many_async(encoding: str) -> None:
+    puzzles = [_to_puzzle(_) for _ in _SAMPLES]
+    results = asyncio.run(
+        solve_many_async(puzzles, max_concurrency=2, encoding=encoding)
+    )
+    assert results == [_.solved for _ in _SAMPLES]
+
+
+def test_solve_many_async_with_process_executor() -> None:
+    puzzles = [_to_puzzle(_) for _ in _SAMPLES]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        results = asyncio.run(solve_many_async(puzzles, executor=executor))
+    assert results == [_.solved for _ in _SAMPLES]
+
+
+def test_solve_many_async_raises_for_wrong_input() -> None:
+    puzzles = [_to_puzzle(samples.SAMPLE_1), ((3, 4), set(), {(0, 0): 1000})]
+    with pytest.raises(ValueError, match="Invalid input"):
+        asyncio.run(solve_many_async(puzzles))
+
+
+async def _wait_for_worker(executor) -> float:
+    return await asyncio.wrap_future(executor.submit(time.perf_counter))
+
+
+async def _cancel_hard_solve(executor, semaphore: asyncio.Semaphore) -> None:
+    task = asyncio.create_task(
+        solve_async(*_HARD, executor=executor, semaphore=semaphore, encoding="int")
+    )
+    await asyncio.sleep(_CANCEL_DELAY)
+    cancelled = time.perf_counter()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert await _wait_for_worker(executor) - cancelled < _RELEASE_BOUND
+    sample = samples.SAMPLE_3_BY_2
+    solved = await asyncio.wait_for(
+        solve_async(*_to_puzzle(sample), executor=executor, semaphore=semaphore), 10
+    )
+    assert solved == sample.solved
+
+
+async def _cancel_and_exit(executor) -> float:
+    task = asyncio.create_task(solve_async(*_HARD, executor=executor, encoding="int"))
+    await asyncio.sleep(_CANCEL_DELAY)
+    task.cancel()
+    return time.perf_counter()
+
+
+def test_cancellation_outlives_event_loop() -> None:
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    cancelled = asyncio.run(_cancel_and_exit(executor))
+    executor.shutdown(wait=True)
+    assert time.perf_counter() - cancelled < _RELEASE_BOUND
+
+
+def test_cancellation_interrupts_z3() -> None:
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    asyncio.run(_cancel_hard_solve(executor, asyncio.Semaphore(1)))
+    executor.shutdown(wait=True)
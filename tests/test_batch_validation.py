@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from str8ts_solver import _check_solution as cs
+from str8ts_solver.solver import solve
+
+from . import samples
+
+np = pytest.importorskip("numpy")
+bv = pytest.importorskip("str8ts_solver.batch_validation")
+
+
+def _random_solvable_layout(rng: random.Random, size: tuple[int, int]) -> tuple:
+    cells = [(x, y) for x in range(size[0]) for y in range(size[1])]
+    while True:
+        blocked = {_ for _ in cells if rng.random() < 0.3}
+        solved = solve(size, blocked, {}, backend="native")
+        if solved is not None:
+            return blocked, solved
+
+
+def _random_solved_puzzle(rng: random.Random) -> tuple:
+    size = (rng.randint(1, 5), rng.randint(1, 5))
+    blocked, solved = _random_solvable_layout(rng, size)
+    known = {_: solved[_] for _ in solved if rng.random() < 0.3}
+    for pos in blocked:
+        if rng.random() < 0.3:
+            known[pos] = rng.randint(1, max(size))
+    return size, blocked, known, solved
+
+
+def _perturb(rng: random.Random, puzzle: tuple) -> tuple:
+    size, blocked, known, solved = puzzle
+    solved = dict(solved)
+    if solved and rng.random() < 0.7:
+        solved[rng.choice(sorted(solved))] = rng.randint(0, max(size) + 1)
+    if blocked and rng.random() < 0.1:
+        solved[rng.choice(sorted(blocked))] = rng.randint(1, max(size))
+    return size, blocked, known, solved
+
+
+def _check_batch(puzzles: list) -> None:
+    expected = [cs.is_solution_valid(*_) for _ in puzzles]
+    assert bv.validate_batch(*bv.stack(puzzles)).tolist() == expected
+
+
+def test_validate_batch_on_samples() -> None:
+    puzzles = [
+        (_.size, _.blocked, _.known, _.solved)
+        for _ in samples.ALL_SAMPLES
+        if _.solved is not None
+    ]
+    assert bv.validate_batch(*bv.stack(puzzles)).all()
+    rngs = [random.Random(_) for _ in range(len(puzzles))]  # nosec B311
+    _check_batch([_perturb(rng, _) for rng, _ in zip(rngs, puzzles, strict=True)])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_validate_batch_matches_scalar_check(seed: int) -> None:
+    rng = random.Random(seed)  # nosec B311
+    _check_batch([_perturb(rng, _random_solved_puzzle(rng)) for _ in range(100)])
+
+
+def test_validate_batch_with_no_puzzles() -> None:
+    assert bv.validate_batch(*bv.stack([])).shape == (0,)
+
+
+def test_validate_batch_raises_for_too_large_sizes() -> None:
+    with pytest.raises(ValueError, match="not supported"):
+        bv.validate_batch(
+            np.array([[63, 1]]),
+            np.zeros((1, 1, 63), dtype=bool),
+            *[np.zeros((1, 1, 63), dtype=int)] * 2,
+        )
@@ -0,0 +1,102 @@
+import pytest
+
+from str8ts_solver import _check_solution as cs
+from str8ts_solver import canonical as cn
+
+from . import samples
+
+
+def _transformed(
+    sample: samples.Sample, transform: cn.Transform
+) -> tuple[tuple[int, int], set[tuple[int, int]], dict[tuple[int, int], int]]:
+    size = sample.size
+    return (
+        transform.size(size),
+        {transform.position(size, _) for _ in sample.blocked},
+        {
+            transform.position(size, pos): transform.value(size, value)
+            for pos, value in sample.known.items()
+        },
+    )
+
+
+def test_transforms_are_distinct() -> None:
+    assert len(set(cn.TRANSFORMS)) == 16
+    assert cn.TRANSFORMS[0] == cn.Transform()
+
+
+@pytest.mark.parametrize("sample", samples.ALL_SAMPLES)
+def test_canonical_form_is_shared(sample: samples.Sample) -> None:
+    forms = {cn.canonicalize(*_transformed(sample, _)) for _ in cn.TRANSFORMS}
+    assert len({(_.puzzle, _.digest) for _ in forms}) == 1
+
+
+def test_canonical_form_maps_back() -> None:
+    sample = samples.SAMPLE_1
+    form = cn.canonicalize(sample.size, sample.blocked, sample.known)
+    canonical_size, blocked, known = form.puzzle.to_dicts()
+    assert form.transform.size(sample.size) == canonical_size
+    assert cn.from_canonical(sample.size, form.transform, known) == sample.known
+    assert blocked == {form.transform.position(sample.size, _) for _ in sample.blocked}
+
+
+def test_different_puzzles_have_different_digests() -> None:
+    digests = {
+        cn.canonicalize(_.size, _.blocked, _.known).digest for _ in samples.ALL_SAMPLES
+    }
+    assert len(digests) == len(samples.ALL_SAMPLES)
+
+
+@pytest.mark.parametrize(
+    "sample",
+    [samples.SAMPLE_2, samples.SAMPLE_3_BY_2, samples.NO_SOLUTION],
+)
+def test_cache_solves_all_symmetric_copies(sample: samples.Sample) -> None:
+    cache = cn.CanonicalCache()
+    for transform in cn.TRANSFORMS:
+        puzzle = _transformed(sample, transform)
+        solved = cache.solve(*puzzle)
+        if sample.solved is None:
+            assert solved is None
+        else:
+            assert solved is not None
+            assert cs.is_solution_valid(*puzzle, solved)
+    assert (cache.hits, cache.misses) == (len(cn.TRANSFORMS) - 1, 1)
+    assert len(cache) == 1
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = cn.CanonicalCache(maxsize=2)
+    first, second, third = samples.SAMPLE_1, samples.SAMPLE_2, samples.SAMPLE_3
+    for sample in (first, second, first, third, first, second):
+        assert cache.solve(sample.size, sample.blocked, sample.known) == sample.solved
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 4, 2)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_passes_options() -> None:
+    sample = samples.SAMPLE_3_BY_2
+    cache = cn.CanonicalCache()
+    assert (
+        cache.solve(sample.size, sample.blocked, sample.known, backend="native")
+        == sample.solved
+    )
+
+
+def test_cache_raises_for_invalid_maxsize() -> None:
+    with pytest.raises(ValueError, match="maxsize must be positive"):
+        cn.CanonicalCache(maxsize=0)
+
+
+@pytest.mark.parametrize(
+    "size, blocked, known",
+    [((2, 2), set(), {(0, 0): 3}), ((2, 2), {(2, 0)}, {}), ((0, 2), set(), {})],
+)
+def test_canonicalize_raises_for_invalid_input(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> None:
+    with pytest.raises(ValueError, match="Invalid input"):
+        cn.canonicalize(size, blocked, known)
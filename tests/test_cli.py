@@ -0,0 +1,191 @@
+import json
+import pathlib
+
+import pytest
+
+from str8ts_solver import cli, solver
+from str8ts_solver import text_format as tf
+from str8ts_solver.cli import main
+from str8ts_solver.grid import Grid, Puzzle
+from str8ts_solver.solver import SolveTimeoutError
+
+from . import samples
+
+_SAMPLES = samples.ALL_SAMPLES
+
+
+def _to_line(sample: samples.Sample) -> str:
+    return tf.format_puzzle(
+        Puzzle.from_dicts(sample.size, sample.blocked, sample.known)
+    )
+
+
+def _to_json(sample: samples.Sample) -> str:
+    return json.dumps(
+        {
+            "size": list(sample.size),
+            "blocked": [list(_) for _ in sorted(sample.blocked)],
+            "known": [[*pos, value] for pos, value in sorted(sample.known.items())],
+        }
+    )
+
+
+def _expected_line(sample: samples.Sample) -> str:
+    puzzle = Puzzle.from_dicts(sample.size, sample.blocked, sample.known)
+    grid = None
+    if sample.solved is not None:
+        grid = Grid.from_dict(sample.size, sample.solved)
+    return tf.format_solution(puzzle, grid)
+
+
+def _write_input(tmp_path: pathlib.Path, lines: list[str]) -> str:
+    path = tmp_path / "puzzles.txt"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def _run(capsys, args: list[str]) -> tuple[int, list[str], str]:
+    exit_code = main(args)
+    captured = capsys.readouterr()
+    return exit_code, captured.out.splitlines(), captured.err
+
+
+def test_compact_input(tmp_path: pathlib.Path, capsys) -> None:
+    path = _write_input(tmp_path, [_to_line(_) for _ in _SAMPLES])
+    exit_code, lines, err = _run(capsys, ["-j", "2", "--chunksize", "1", path])
+    assert exit_code == 0
+    assert lines == [_expected_line(_) for _ in _SAMPLES]
+    assert f"{len(_SAMPLES)} puzzles" in err
+
+
+def test_jsonl_input(tmp_path: pathlib.Path, capsys) -> None:
+    path = _write_input(tmp_path, [_to_json(_) for _ in _SAMPLES])
+    exit_code, lines, _ = _run(capsys, ["--format", "jsonl", "-j", "2", path])
+    assert exit_code == 0
+    results = [json.loads(_) for _ in lines]
+    assert [_["item"] for _ in results] == list(range(len(_SAMPLES)))
+    assert [
+        (
+            {(x_pos, y_pos): value for x_pos, y_pos, value in _["solved"]}
+            if _["status"] == "solved"
+            else None
+        )
+        for _ in results
+    ] == [_.solved for _ in _SAMPLES]
+
+
+def test_unordered_output_is_numbered(tmp_path: pathlib.Path, capsys) -> None:
+    path = _write_input(tmp_path, [_to_line(_) for _ in _SAMPLES])
+    _, lines, _ = _run(capsys, ["--unordered", "-j", "2", "--chunksize", "1", path])
+    numbered = dict(_.split(" ", 1) for _ in lines)
+    assert numbered == {str(num): _expected_line(_) for num, _ in enumerate(_SAMPLES)}
+
+
+def test_unique(tmp_path: pathlib.Path, capsys) -> None:
+    path = _write_input(tmp_path, [_to_line(samples.SAMPLE_1), "3x1:..."])
+    _, lines, _ = _run(capsys, ["--unique", "-j", "1", path])
+    assert lines[0] == f"{_expected_line(samples.SAMPLE_1)} unique"
+    assert lines[1].endswith(" multiple")
+
+
+def test_validate(tmp_path: pathlib.Path, capsys) -> None:
+    solved = _expected_line(samples.SAMPLE_1)
+    wrong = solved.replace("1", "0").replace("2", "1").replace("0", "2")
+    path = _write_input(
+        tmp_path,
+        [f"{_to_line(samples.SAMPLE_1)} {_}" for _ in (solved, wrong)]
+        + [_to_line(samples.SAMPLE_1)],
+    )
+    exit_code, lines, _ = _run(capsys, ["--validate", "-j", "1", path])
+    assert exit_code == 1
+    assert lines == ["valid", "invalid", "error: Missing solution"]
+
+
+@pytest.mark.parametrize("line", ["garbage", "3x1:... 3x1:... 3x1:...", "2x1:ac"])
+def test_reports_invalid_lines(tmp_path: pathlib.Path, capsys, line: str) -> None:
+    path = _write_input(tmp_path, [line, _to_line(samples.SAMPLE_3_BY_2)])
+    exit_code, lines, err = _run(capsys, ["-j", "1", path])
+    assert exit_code == 1
+    assert lines == ["error: Invalid input", _expected_line(samples.SAMPLE_3_BY_2)]
+    assert "error: 1" in err
+
+
+@pytest.mark.parametrize(
+    "line", ["[]", '{"size": [3]}', '{"size": [3, 1], "known": 1}']
+)
+def test_reports_invalid_json(tmp_path: pathlib.Path, capsys, line: str) -> None:
+    path = _write_input(tmp_path, [line])
+    _, lines, _ = _run(capsys, ["--format", "jsonl", "-j", "1", path])
+    assert json.loads(lines[0]) == {
+        "item": 0,
+        "status": "error",
+        "error": "Invalid input",
+    }
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        '{"size": ["a", 3]}',
+        '{"size": [3, 3], "known": [[0, 0, "1"]]}',
+        '{"size": [3, 1], "blocked": [[0, 0.5]]}',
+        '{"size": [3, 1], "known": [[0, 0, true]]}',
+    ],
+)
+def test_reports_wrongly_typed_json(tmp_path: pathlib.Path, capsys, line: str) -> None:
+    sample = samples.SAMPLE_3_BY_2
+    path = _write_input(tmp_path, [_to_json(sample), line, _to_json(sample)])
+    exit_code, lines, _ = _run(capsys, ["--format", "jsonl", "-j", "1", path])
+    assert exit_code == 1
+    assert [json.loads(_)["status"] for _ in lines] == ["solved", "error", "solved"]
+    assert json.loads(lines[1])["error"] == "Invalid input"
+
+
+def test_timeout(tmp_path: pathlib.Path, capsys) -> None:
+    path = _write_input(tmp_path, ["12x12:" + "." * 144])
+    _, lines, err = _run(capsys, ["--timeout", "0.001", "-j", "1", path])
+    assert lines == ["unknown: timeout"]
+    assert "unknown: 1" in err
+
+
+@pytest.mark.parametrize("size, rlimit", [(10, 10000), (12, 50000), (16, 50000)])
+def test_rlimit(tmp_path: pathlib.Path, capsys, size: int, rlimit: int) -> None:
+    path = _write_input(tmp_path, [f"{size}x{size}:" + "." * size**2, "3x1:..."])
+    _, lines, _ = _run(capsys, ["--rlimit", str(rlimit), "-j", "1", path])
+    assert lines[0] == "unknown: max. resource limit exceeded"
+    assert lines[1].startswith("3x1:")
+
+
+def _get_options(args: list[str]) -> dict:
+    # pylint: disable-next=protected-access
+    return cli._get_options(cli._parse_args(args))
+
+
+def _process_line(line: str, options: dict) -> tuple[str, str]:
+    # pylint: disable-next=protected-access
+    return cli._process_line(0, line, options)
+
+
+def test_unique_passes_limits(monkeypatch) -> None:
+    def _iter_solutions(*_puzzle, **options):
+        raise SolveTimeoutError(json.dumps(options, sort_keys=True))
+
+    monkeypatch.setattr(solver, "iter_solutions", _iter_solutions)
+    options = _get_options(["--unique", "--timeout", "5", "--rlimit", "100000"])
+    assert _process_line("3x1:...", options) == (
+        "unknown",
+        'unknown: {"encoding": "auto", "rlimit": 100000, "timeout_ms": 5000}',
+    )
+
+
+def test_unique_solves_once(monkeypatch) -> None:
+    def _solve(*_puzzle, **_options):
+        raise AssertionError("solve must not be called with --unique")
+
+    monkeypatch.setattr(solver, "solve", _solve)
+    options = _get_options(["--unique"])
+    status, line = _process_line("3x1:...", options)
+    assert status == "solved"
+    assert line.endswith(" multiple")
+    status, line = _process_line(_to_line(samples.NO_SOLUTION), options)
+    assert (status, line) == ("unsolvable", _expected_line(samples.NO_SOLUTION))
@@ -0,0 +1,78 @@
+import itertools
+
+import pytest
+
+from str8ts_solver.solver import (
+    SolveTimeoutError,
+    count_solutions,
+    has_unique_solution,
+    iter_solutions,
+)
+
+from . import samples
+
+_UNIQUE_SAMPLES = [
+    samples.SAMPLE_1,
+    samples.SAMPLE_2,
+    samples.SAMPLE_3,
+    samples.SAMPLE_3_BY_2,
+    samples.FULLY_BLOCKED_COLUMN,
+    samples.FULLY_BLOCKED,
+]
+
+
+@pytest.mark.parametrize("encoding", ["int", "bitvec", "onehot"])
+@pytest.mark.parametrize("sample", _UNIQUE_SAMPLES)
+def test_iter_solutions_for_unique_puzzle(
+    sample: samples.Sample, encoding: str
+) -> None:
+    assert list(
+        iter_solutions(sample.size, sample.blocked, sample.known, encoding=encoding)
+    ) == [sample.solved]
+    assert has_unique_solution(
+        sample.size, sample.blocked, sample.known, encoding=encoding
+    )
+
+
+def test_count_solutions_without_solution() -> None:
+    sample = samples.NO_SOLUTION
+    assert count_solutions(sample.size, sample.blocked, sample.known) == 0
+    assert not has_unique_solution(sample.size, sample.blocked, sample.known)
+
+
+@pytest.mark.parametrize(
+    ("limit", "expected"), [(None, 6), (10, 6), (6, 6), (2, 2), (0, 0)]
+)
+def test_count_solutions_respects_limit(limit: int | None, expected: int) -> None:
+    assert count_solutions((3, 1), set(), {}, limit=limit) == expected
+
+
+def test_iter_solutions_yields_distinct_solutions() -> None:
+    solutions = iter_solutions((3, 1), set(), {})
+    assert sorted((_[(0, 0)], _[(1, 0)], _[(2, 0)]) for _ in solutions) == list(
+        itertools.permutations(range(1, 4))
+    )
+    assert not has_unique_solution((3, 1), set(), {})
+
+
+def test_iter_solutions_raises_for_wrong_input() -> None:
+    with pytest.raises(ValueError, match="Invalid input"):
+        next(iter_solutions((3, 4), set(), {(0, 0): 0}))
+
+
+def test_count_solutions_of_contradictory_clues() -> None:
+    assert count_solutions((3, 1), set(), {(0, 0): 2, (2, 0): 2}, limit=None) == 0
+
+
+@pytest.mark.parametrize("limits", [{"timeout_ms": 1}, {"rlimit": 1000}])
+def test_has_unique_solution_raises_on_limits(limits: dict[str, int]) -> None:
+    with pytest.raises(SolveTimeoutError):
+        has_unique_solution((12, 12), set(), {}, **limits)
+
+
+@pytest.mark.parametrize("encoding", ["int", "bitvec", "onehot"])
+@pytest.mark.parametrize("rlimit", [1000, 10000])
+def test_iter_solutions_reports_exceeded_rlimit(encoding: str, rlimit: int) -> None:
+    solutions = iter_solutions((10, 10), set(), {}, encoding=encoding, rlimit=rlimit)
+    with pytest.raises(SolveTimeoutError, match="max. resource limit exceeded"):
+        next(solutions)
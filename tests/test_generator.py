@@ -0,0 +1,61 @@
+import pytest
+
+from str8ts_solver.generator import GeneratedPuzzle, generate, generate_many
+from str8ts_solver.solver import has_unique_solution, solve
+
+
+def _check_generated(puzzle: GeneratedPuzzle) -> None:
+    assert solve(puzzle.size, puzzle.blocked, puzzle.known) == puzzle.solved
+    assert has_unique_solution(puzzle.size, puzzle.blocked, puzzle.known)
+
+
+@pytest.mark.parametrize("size", [(4, 4), (6, 6), (5, 3)])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_generate_gives_unique_puzzle(size: tuple[int, int], seed: int) -> None:
+    _check_generated(generate(size, seed))
+
+
+@pytest.mark.parametrize(
+    ("symmetry", "image"),
+    [
+        ("rotational", lambda x, y: (5 - x, 5 - y)),
+        ("mirror", lambda x, y: (5 - x, y)),
+        ("diagonal", lambda x, y: (y, x)),
+    ],
+)
+def test_generate_keeps_symmetry(symmetry: str, image) -> None:
+    puzzle = generate((6, 6), 3, symmetry=symmetry, blocked_ratio=0.3)
+    assert {image(*_) for _ in puzzle.blocked} == puzzle.blocked
+    _check_generated(puzzle)
+
+
+def test_generate_is_deterministic() -> None:
+    assert generate((5, 5), 7) == generate((5, 5), 7)
+
+
+def test_generate_respects_min_clues() -> None:
+    puzzle = generate((5, 5), 2, blocked_clue_ratio=0, min_clues=10)
+    assert len(puzzle.known) >= 10
+    _check_generated(puzzle)
+
+
+def test_generate_many() -> None:
+    puzzles = list(generate_many((4, 4), 3, seed=5, workers=2))
+    assert len(puzzles) == 3
+    for _ in puzzles:
+        _check_generated(_)
+    assert puzzles == list(generate_many((4, 4), 3, seed=5, workers=1))
+
+
+@pytest.mark.parametrize(
+    ("size", "symmetry", "message"),
+    [
+        ((4, 4), "unknown", "Unknown symmetry"),
+        ((4, 5), "diagonal", "requires a square grid"),
+    ],
+)
+def test_generate_raises_for_wrong_symmetry(
+    size: tuple[int, int], symmetry: str, message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        generate(size, symmetry=symmetry)
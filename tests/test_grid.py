@@ -0,0 +1,111 @@
+import pytest
+
+from str8ts_solver import _check_solution as cs
+from str8ts_solver.grid import Grid, Puzzle
+from str8ts_solver.output_utils import puzzle_to_string
+from str8ts_solver.solver import solve_puzzle
+
+from . import samples
+
+_SAMPLES = samples.ALL_SAMPLES
+
+_SOLVABLE_SAMPLES = [_ for _ in _SAMPLES if _.solved is not None]
+
+
+def _to_puzzle(sample: samples.Sample) -> Puzzle:
+    return Puzzle.from_dicts(sample.size, sample.blocked, sample.known)
+
+
+@pytest.mark.parametrize("sample", _SAMPLES)
+def test_puzzle_round_trip(sample: samples.Sample) -> None:
+    assert _to_puzzle(sample).to_dicts() == (sample.size, sample.blocked, sample.known)
+
+
+@pytest.mark.parametrize("sample", _SOLVABLE_SAMPLES)
+def test_grid_round_trip(sample: samples.Sample) -> None:
+    assert sample.solved is not None
+    assert Grid.from_dict(sample.size, sample.solved).to_dict() == sample.solved
+
+
+def test_puzzle_accessors() -> None:
+    puzzle = _to_puzzle(samples.SAMPLE_1)
+    assert puzzle.size == (9, 9)
+    assert puzzle.is_blocked((7, 0)) and puzzle.clue((7, 0)) == 3
+    assert not puzzle.is_blocked((4, 0)) and puzzle.clue((4, 0)) == 5
+    assert puzzle.clue((3, 1)) == 0
+    assert puzzle.blocked_clues_mask(puzzle.row_indices(0)) == 1 << 3
+    assert puzzle.blocked_clues_mask(puzzle.col_indices(4)) == 1 << 8
+    assert puzzle == _to_puzzle(samples.SAMPLE_1)
+    assert puzzle != _to_puzzle(samples.SAMPLE_2)
+
+
+def test_grid_masks() -> None:
+    grid = Grid.from_dict((3, 2), {(0, 1): 3, (1, 0): 2, (1, 1): 1, (2, 1): 2})
+    assert grid.value((1, 0)) == 2
+    assert grid.row_mask(0) == 1 << 2
+    assert grid.row_mask(1) == (1 << 1) | (1 << 2) | (1 << 3)
+    assert grid.col_mask(1) == (1 << 1) | (1 << 2)
+
+
+@pytest.mark.parametrize(
+    ("size", "blocked", "known"),
+    [
+        ((-1, 5), set(), {}),
+        ((3, 4), {(100, 1)}, {}),
+        ((3, 4), set(), {(3, 0): 1}),
+        ((3, 4), set(), {(0, 0): 1000}),
+        ((3, 4), set(), {(0, 0): 0}),
+    ],
+)
+def test_puzzle_raises_for_wrong_input(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> None:
+    with pytest.raises(ValueError, match="Invalid input"):
+        Puzzle.from_dicts(size, blocked, known)
+
+
+def test_grid_raises_for_wrong_buffer() -> None:
+    with pytest.raises(ValueError, match="Invalid input"):
+        Grid(3, 3, bytes(8))
+
+
+@pytest.mark.parametrize("sample", _SOLVABLE_SAMPLES)
+def test_is_grid_valid(sample: samples.Sample) -> None:
+    assert sample.solved is not None
+    puzzle = _to_puzzle(sample)
+    assert cs.is_grid_valid(puzzle, Grid.from_dict(sample.size, sample.solved))
+    for pos, value in sample.solved.items():
+        for new_value in (0, value % max(sample.size) + 1, max(sample.size) + 1):
+            if new_value != value:
+                changed = sample.solved | {pos: new_value}
+                assert cs.is_grid_valid(
+                    puzzle, Grid.from_dict(sample.size, changed)
+                ) == cs.is_solution_valid(
+                    sample.size, sample.blocked, sample.known, changed
+                )
+
+
+def test_is_grid_valid_rejects_values_in_blocked_cells() -> None:
+    sample = samples.SAMPLE_3_BY_2
+    assert sample.solved is not None
+    grid = Grid.from_dict(sample.size, sample.solved | {(0, 0): 1})
+    assert not cs.is_grid_valid(_to_puzzle(sample), grid)
+
+
+@pytest.mark.parametrize("sample", _SAMPLES)
+def test_puzzle_to_string(sample: samples.Sample) -> None:
+    puzzle = _to_puzzle(sample)
+    assert puzzle_to_string(puzzle) == sample.blank_str
+    if sample.solved is not None:
+        grid = Grid.from_dict(sample.size, sample.solved)
+        assert puzzle_to_string(puzzle, grid) == sample.solved_str
+
+
+@pytest.mark.parametrize("sample", _SAMPLES)
+def test_solve_puzzle(sample: samples.Sample) -> None:
+    expected = None
+    if sample.solved is not None:
+        expected = Grid.from_dict(sample.size, sample.solved)
+    assert solve_puzzle(_to_puzzle(sample), backend="native") == expected
@@ -0,0 +1,36 @@
+from str8ts_solver import _layout_index as li
+
+from . import samples
+
+
+def _get_index() -> li.LayoutIndex:
+    return li.get_layout_index((3, 2), {(1, 0), (2, 1)})
+
+
+def test_layout_index_lines() -> None:
+    index = _get_index()
+    assert index.cells == ((0, 0), (0, 1), (1, 1), (2, 0))
+    assert index.rows == (((0, 0), (2, 0)), ((0, 1), (1, 1)))
+    assert index.cols == (((0, 0), (0, 1)), ((1, 1),), ((2, 0),))
+    assert index.peers((2, 1)) == ((0, 1), (1, 1), (2, 0))
+
+
+def test_layout_index_compartments() -> None:
+    index = _get_index()
+    assert index.horizontal == (((0, 1), (1, 1)),)
+    assert index.vertical == (((0, 0), (0, 1)),)
+    assert index.compartments == (((0, 1), (1, 1)), ((0, 0), (0, 1)))
+    assert index.compartments_of == {
+        (0, 0): (1,),
+        (0, 1): (0, 1),
+        (1, 1): (0,),
+        (2, 0): (),
+    }
+
+
+def test_layout_index_is_memoized() -> None:
+    sample = samples.SAMPLE_1
+    index = li.get_layout_index(sample.size, sample.blocked)
+    assert li.get_layout_index(sample.size, set(sample.blocked)) is index
+    assert li.get_layout_index(sample.size, frozenset(sample.blocked)) is index
+    assert li.get_layout_index(sample.size, set()) is not index
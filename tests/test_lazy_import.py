@@ -0,0 +1,53 @@
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
+import str8ts_solver
+
+
+def _imported_modules(code: str) -> set[str]:
+    res = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return {
+        _.rsplit("|", 1)[-1].strip()
+        for _ in res.stderr.splitlines()
+        if _.startswith("import time:")
+    }
+
+
+def _imports_z3(code: str) -> bool:
+    return any(_ == "z3" or _.startswith("z3.") for _ in _imported_modules(code))
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import str8ts_solver",
+        "from str8ts_solver import to_string, is_solution_valid, Puzzle",
+        "import str8ts_solver.output_utils, str8ts_solver._check_solution",
+        "import str8ts_solver.solver, str8ts_solver.text_format, str8ts_solver.cli",
+        "from str8ts_solver import solve; solve((2, 1), set(), {}, backend='native')",
+    ],
+)
+def test_does_not_import_z3(code: str) -> None:
+    assert not _imports_z3(code)
+
+
+def test_imports_z3_on_first_solve() -> None:
+    assert _imports_z3("from str8ts_solver import solve; solve((2, 1), set(), {})")
+
+
+@pytest.mark.parametrize("name", str8ts_solver.__all__)
+def test_reexports(name: str) -> None:
+    assert name in dir(str8ts_solver)
+    assert getattr(str8ts_solver, name).__name__ == name
+
+
+def test_raises_for_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="no attribute 'other'"):
+        getattr(str8ts_solver, "other")
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from str8ts_solver import _check_solution as cs
+from str8ts_solver.partial_validation import PartialGridValidator
+
+from . import samples
+
+
+def _new_validator(
+    sample: samples.Sample = samples.SAMPLE_1,
+) -> PartialGridValidator:
+    return PartialGridValidator(sample.size, sample.blocked, sample.known)
+
+
+def test_clues_and_solution_are_valid() -> None:
+    sample = samples.SAMPLE_1
+    assert sample.solved is not None
+    validator = _new_validator(sample)
+    assert validator.is_valid()
+    for pos, value in sample.solved.items():
+        if pos not in sample.known:
+            validator.place(pos, value)
+    assert validator.is_valid()
+    assert not validator.conflicts()
+    assert validator.values == sample.solved
+
+
+def test_duplicates_in_line() -> None:
+    validator = PartialGridValidator((3, 3), set(), {(0, 0): 1})
+    validator.place((2, 0), 1)
+    validator.place((2, 2), 1)
+    assert validator.conflicts() == {(0, 0), (2, 0), (2, 2)}
+    validator.place((2, 0), 3)
+    assert validator.is_valid()
+
+
+def test_clash_with_blocked_clue() -> None:
+    validator = PartialGridValidator((2, 2), {(0, 0)}, {(0, 0): 1})
+    validator.place((1, 0), 1)
+    assert validator.conflicts() == {(1, 0)}
+    validator.erase((1, 0))
+    assert validator.is_valid()
+
+
+def test_compartment_can_not_be_straight() -> None:
+    validator = PartialGridValidator((4, 4), {(1, 0)}, {})
+    validator.place((2, 0), 1)
+    validator.place((3, 0), 3)
+    assert validator.conflicts() == {(2, 0), (3, 0)}
+    validator.place((3, 0), 2)
+    assert validator.is_valid()
+
+
+def test_duplicates_in_compartment_are_counted() -> None:
+    validator = PartialGridValidator((5, 1), {(4, 0)}, {})
+    validator.place((0, 0), 1)
+    validator.place((1, 0), 1)
+    validator.erase((1, 0))
+    validator.place((2, 0), 5)
+    assert validator.conflicts() == {(0, 0), (2, 0)}
+    validator.erase((0, 0))
+    assert validator.is_valid()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_full_grids_agree_with_is_solution_valid(seed: int) -> None:
+    sample = samples.SAMPLE_2
+    assert sample.solved is not None
+    rng = random.Random(seed)  # nosec B311
+    validator = _new_validator(sample)
+    solved = dict(sample.solved)
+    for pos in rng.sample(sorted(solved.keys() - sample.known.keys()), 2):
+        solved[pos] = rng.randint(1, 9)
+    for pos, value in solved.items():
+        if pos not in sample.known:
+            validator.place(pos, value)
+    assert validator.is_valid() == cs.is_solution_valid(
+        sample.size, sample.blocked, sample.known, solved
+    )
+
+
+@pytest.mark.parametrize(
+    "pos, value, message",
+    [
+        ((0, 0), 1, "Position is not an open cell"),
+        ((9, 0), 1, "Position is not an open cell"),
+        ((2, 0), 10, "Invalid value"),
+        ((4, 0), 2, "Can not change a clue"),
+    ],
+)
+def test_place_raises(pos: tuple[int, int], value: int, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        _new_validator().place(pos, value)
+
+
+def test_invalid_clue_raises() -> None:
+    with pytest.raises(ValueError, match="Invalid value"):
+        PartialGridValidator((2, 2), set(), {(0, 0): 3})
@@ -0,0 +1,57 @@
+import pytest
+
+from str8ts_solver import _propagation as pr
+
+from . import samples
+
+
+def _reduce(sample: samples.Sample) -> dict[tuple[int, int], int]:
+    layout = pr.make_layout(sample.size, sample.blocked)
+    domains = pr.initial_domains(layout, sample.size, sample.blocked, sample.known)
+    pr.propagate(layout, domains)
+    return dict(zip(layout.cells, domains, strict=True))
+
+
+@pytest.mark.parametrize(
+    "sample",
+    [
+        samples.SAMPLE_1,
+        samples.SAMPLE_2,
+        samples.SAMPLE_3,
+        samples.SAMPLE_3_BY_2,
+        samples.FULLY_BLOCKED_COLUMN,
+        samples.FULLY_BLOCKED,
+    ],
+)
+def test_propagate_keeps_solution(sample: samples.Sample) -> None:
+    assert sample.solved is not None
+    domains = _reduce(sample)
+    assert domains.keys() == sample.solved.keys()
+    assert all(domains[_] & (1 << sample.solved[_]) for _ in domains)
+
+
+def test_propagate_solves_gentle_puzzle() -> None:
+    domains = _reduce(samples.SAMPLE_1)
+    assert all(_.bit_count() == 1 for _ in domains.values())
+
+
+def test_propagate_detects_contradiction() -> None:
+    with pytest.raises(pr.Contradiction):
+        _reduce(samples.NO_SOLUTION)
+
+
+def test_propagate_places_hidden_single() -> None:
+    layout = pr.make_layout((4, 1), set())
+    domains = [0b01110, 0b01110, 0b01110, 0b11110]
+    pr.propagate(layout, domains)
+    assert domains[3] == 0b10000
+
+
+def test_propagate_detects_two_hidden_singles_in_one_cell() -> None:
+    layout = pr.make_layout((4, 1), set())
+    with pytest.raises(pr.Contradiction):
+        pr.propagate(layout, [0b00110, 0b00110, 0b11110, 0b00110])
+
+
+def test_gen_values() -> None:
+    assert list(pr.gen_values(0b1010110)) == [1, 2, 4, 6]
@@ -0,0 +1,58 @@
+import pytest
+
+from str8ts_solver import rating as rt
+
+from . import samples
+
+
+def test_rate_logic_only_puzzle() -> None:
+    sample = samples.SAMPLE_3_BY_2
+    assert rt.rate(sample.size, sample.blocked, sample.known) == rt.Rating(
+        score=5, techniques={"naked single": 3, "hidden single": 1}, depth=0
+    )
+
+
+def test_rate_counts_guesses() -> None:
+    rating = rt.rate((3, 1), set(), {})
+    assert rating.depth == 2
+    assert rating.score == 2 * rt.GUESS_WEIGHT + sum(
+        rt.WEIGHTS[_] * count for _, count in rating.techniques.items()
+    )
+
+
+def test_rate_orders_samples() -> None:
+    scores = [
+        rt.rate(_.size, _.blocked, _.known).score
+        for _ in (samples.FULLY_BLOCKED, samples.SAMPLE_3_BY_2, samples.SAMPLE_1)
+    ]
+    assert scores == sorted(scores)
+    assert scores[0] == 0
+
+
+def test_rate_is_deterministic() -> None:
+    sample = samples.SAMPLE_2
+    assert rt.rate(sample.size, sample.blocked, sample.known) == rt.rate(
+        sample.size, sample.blocked, sample.known
+    )
+
+
+def test_rate_raises_for_unsolvable_puzzle() -> None:
+    sample = samples.NO_SOLUTION
+    with pytest.raises(ValueError, match="Puzzle has no solution"):
+        rt.rate(sample.size, sample.blocked, sample.known)
+
+
+def test_rate_raises_for_out_of_range_clue() -> None:
+    with pytest.raises(ValueError, match="Invalid input"):
+        rt.rate((3, 3), set(), {(0, 0): 50})
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_rate_many(ordered: bool) -> None:
+    puzzles: list = [(_.size, _.blocked, _.known) for _ in samples.ALL_SAMPLES]
+    puzzles.append(((3, 4), set(), {(0, 0): 1000}))
+    results = sorted(rt.rate_many(puzzles, workers=2, chunksize=3, ordered=ordered))
+    assert [_.item_num for _ in results] == list(range(len(puzzles)))
+    assert [_.rating for _ in results[:3]] == [rt.rate(*_) for _ in puzzles[:3]]
+    assert results[3] == rt.BatchRating(3, None, "Puzzle has no solution")
+    assert results[-1] == rt.BatchRating(len(puzzles) - 1, None, "Invalid input")
@@ -0,0 +1,98 @@
+import pytest
+
+from str8ts_solver.session import Session
+
+from . import samples
+
+
+def _new_session(sample: samples.Sample = samples.SAMPLE_3_BY_2) -> Session:
+    return Session(sample.size, sample.blocked, sample.known)
+
+
+@pytest.mark.parametrize("encoding", ["int", "bitvec", "onehot"])
+def test_session_place_and_erase(encoding: str) -> None:
+    sample = samples.SAMPLE_3_BY_2
+    session = Session(sample.size, sample.blocked, sample.known, encoding=encoding)
+    assert session.is_solvable()
+    assert session.solution() == sample.solved
+    session.place((1, 0), 3)
+    assert not session.is_solvable()
+    assert session.solution() is None
+    assert session.conflicts()
+    session.place((1, 0), 2)
+    assert session.is_solvable()
+    assert not session.conflicts()
+    session.erase((1, 0))
+    assert not session.entries
+    assert session.is_solvable()
+
+
+def test_session_conflicts_are_entries_and_clues() -> None:
+    sample = samples.SAMPLE_1
+    session = _new_session(sample)
+    session.place((2, 0), 1)
+    session.place((3, 0), 1)
+    assert not session.is_solvable()
+    conflicts = session.conflicts()
+    assert conflicts
+    assert conflicts.items() <= (sample.known | session.entries).items()
+
+
+def test_session_conflicts_contain_clues() -> None:
+    session = _new_session()
+    session.place((2, 1), 1)
+    assert session.conflicts() == {(1, 1): 1, (2, 1): 1}
+
+
+def test_session_conflicts_with_blocked_clue() -> None:
+    session = _new_session()
+    session.place((0, 1), 1)
+    assert session.conflicts() == {(0, 1): 1}
+
+
+def test_session_follows_solution() -> None:
+    sample = samples.SAMPLE_2
+    assert sample.solved is not None
+    session = _new_session(sample)
+    for pos, value in sample.solved.items():
+        if pos not in sample.known:
+            session.place(pos, value)
+            assert session.is_solvable()
+    assert session.solution() == sample.solved
+
+
+def test_unsolvable_session() -> None:
+    session = _new_session(samples.NO_SOLUTION)
+    assert not session.is_solvable()
+    assert not session.conflicts()
+
+
+@pytest.mark.parametrize(
+    "pos, value, message",
+    [
+        ((0, 0), 1, "Position is not an open cell"),
+        ((3, 0), 1, "Position is not an open cell"),
+        ((1, 1), 2, "Can not change a clue"),
+        ((1, 0), 4, "Invalid value"),
+        ((1, 0), 0, "Invalid value"),
+    ],
+)
+def test_place_raises(pos: tuple[int, int], value: int, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        _new_session().place(pos, value)
+
+
+def test_erase_raises_for_clue() -> None:
+    with pytest.raises(ValueError, match="Can not change a clue"):
+        _new_session().erase((1, 1))
+
+
+@pytest.mark.parametrize(
+    "blocked, known",
+    [(set(), {(2, 0): 1}), (set(), {(0, 0): 50}), ({(0, 0)}, {(0, 0): 3})],
+)
+def test_session_raises_for_invalid_input(
+    blocked: set[tuple[int, int]], known: dict[tuple[int, int], int]
+) -> None:
+    with pytest.raises(ValueError, match="Invalid input"):
+        Session((2, 2), blocked, known)
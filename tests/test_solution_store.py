@@ -0,0 +1,143 @@
+import concurrent.futures
+import pathlib
+
+import pytest
+
+from str8ts_solver import _check_solution as cs
+from str8ts_solver import canonical as cn
+from str8ts_solver import solver as sl
+from str8ts_solver.solution_store import SolutionStore
+
+from . import samples
+
+_SAMPLES = samples.ALL_SAMPLES
+
+_Puzzle = tuple[tuple[int, int], set[tuple[int, int]], dict[tuple[int, int], int]]
+
+
+def _puzzles(sample_list: list[samples.Sample]) -> list[_Puzzle]:
+    return [(_.size, _.blocked, _.known) for _ in sample_list]
+
+
+def _fail(*_args, **_kwargs):
+    raise AssertionError("solver should not be called")
+
+
+def _fill(path: pathlib.Path) -> int:
+    with SolutionStore(str(path)) as store:
+        return sum(1 for _ in store.solve_many(_puzzles(_SAMPLES)))
+
+
+def test_store_survives_reopening(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = str(tmp_path / "solutions.db")
+    with SolutionStore(path) as store:
+        for sample in _SAMPLES:
+            assert store.solve(sample.size, sample.blocked, sample.known) == (
+                sample.solved
+            )
+        assert len(store) == len(_SAMPLES)
+    monkeypatch.setattr(sl, "solve", _fail)
+    monkeypatch.setattr(sl, "solve_many", _fail)
+    with SolutionStore(path) as store:
+        for sample in _SAMPLES:
+            assert store.solve(sample.size, sample.blocked, sample.known) == (
+                sample.solved
+            )
+        assert [_.solved for _ in store.solve_many(_puzzles(_SAMPLES))] == [
+            _.solved for _ in _SAMPLES
+        ]
+
+
+def _flipped_copy(sample: samples.Sample) -> _Puzzle:
+    transform = cn.Transform(flip_x=True, reverse=True)
+    return (
+        transform.size(sample.size),
+        {transform.position(sample.size, _) for _ in sample.blocked},
+        {
+            transform.position(sample.size, pos): transform.value(sample.size, value)
+            for pos, value in sample.known.items()
+        },
+    )
+
+
+def _check_results(results: list[sl.BatchResult], copy: _Puzzle) -> None:
+    assert [_.solved for _ in results[: len(_SAMPLES)]] == [_.solved for _ in _SAMPLES]
+    assert results[3].status == "unsat"
+    assert results[-2] == sl.BatchResult(len(_SAMPLES), None, "Invalid input", "error")
+    assert results[-1].solved is not None
+    assert cs.is_solution_valid(*copy, results[-1].solved)
+
+
+def test_solve_many(tmp_path: pathlib.Path) -> None:
+    copy = _flipped_copy(samples.SAMPLE_3_BY_2)
+    puzzles = [*_puzzles(_SAMPLES), ((2, 2), set(), {(0, 0): 3}), copy]
+    with SolutionStore(str(tmp_path / "solutions.db")) as store:
+        for _ in range(2):
+            results = list(store.solve_many(puzzles, batch_size=3, backend="native"))
+            assert [_.item_num for _ in results] == list(range(len(puzzles)))
+            _check_results(results, copy)
+        assert len(store) == len(_SAMPLES)
+
+
+def test_repeated_solve_many_matches_first(tmp_path: pathlib.Path) -> None:
+    puzzles = [
+        *_puzzles(_SAMPLES),
+        ((3, 1), set(), {(0, 0): 2, (2, 0): 2}),
+        ((1, 3), set(), {(0, 0): 2, (0, 2): 2}),
+    ]
+    expected = list(sl.solve_many(puzzles, workers=1))
+    assert expected[-2].reason == "duplicate_in_row"
+    with SolutionStore(str(tmp_path / "solutions.db")) as store:
+        for _ in range(2):
+            assert list(store.solve_many(puzzles)) == expected
+
+
+def test_store_evicts_least_recently_used(tmp_path: pathlib.Path) -> None:
+    first, second, third = samples.SAMPLE_1, samples.SAMPLE_2, samples.SAMPLE_3
+    digests = [cn.canonicalize(_.size, _.blocked, _.known).digest for _ in _SAMPLES]
+    with SolutionStore(
+        str(tmp_path / "solutions.db"), max_entries=2, touch_interval=0.0
+    ) as store:
+        for sample in (first, second, first, third):
+            store.solve(sample.size, sample.blocked, sample.known)
+        assert len(store) == 2
+        assert store.get_many(digests).keys() == {digests[0], digests[2]}
+
+
+def test_store_touches_entries_once_per_interval(tmp_path: pathlib.Path) -> None:
+    with SolutionStore(str(tmp_path / "solutions.db"), max_entries=2) as store:
+        store.put_many([("first", None)])
+        store.put_many([("second", None)])
+        assert store.get_many(["first", "missing"]) == {"first": None}
+        store.put_many([("third", None)])
+        assert store.get_many(["first", "second", "third"]).keys() == {
+            "second",
+            "third",
+        }
+
+
+def test_store_evicts_in_batches(tmp_path: pathlib.Path) -> None:
+    with SolutionStore(str(tmp_path / "solutions.db"), max_entries=1000) as store:
+        for num in range(1009):
+            store.put_many([(f"digest_{num}", bytes([num % 256]))])
+        assert len(store) == 1009
+        store.put_many([("last", None)])
+        assert len(store) == 1000
+        assert "last" in store.get_many(["last", "digest_0"])
+        assert "digest_0" not in store.get_many(["digest_0"])
+
+
+def test_store_is_shared_by_processes(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "solutions.db"
+    with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
+        counts = list(executor.map(_fill, [path] * 4))
+    assert counts == [len(_SAMPLES)] * 4
+    with SolutionStore(str(path)) as store:
+        assert len(store) == len(_SAMPLES)
+
+
+def test_store_raises_for_invalid_max_entries(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError, match="max_entries must be positive"):
+        SolutionStore(str(tmp_path / "solutions.db"), max_entries=0)
@@ -1,6 +1,8 @@
+import typing
+
 import pytest
 
-from str8ts_solver.solver import solve
+from str8ts_solver.solver import SolveTimeoutError, solve
 
 from . import samples
 
@@ -16,6 +18,15 @@ def _extract_test_case(
     return sample.size, sample.blocked, sample.known, sample.solved
 
 
+_OPTIONS = [
+    {"backend": "z3", "encoding": "int"},
+    {"backend": "z3", "encoding": "bitvec"},
+    {"backend": "z3", "encoding": "onehot"},
+    {"backend": "native"},
+]
+
+
+@pytest.mark.parametrize("options", _OPTIONS)
 @pytest.mark.parametrize(
     ("size", "blocked", "known", "expected"),
     [
@@ -33,10 +44,12 @@ def test_solve(
     blocked: set[tuple[int, int]],
     known: dict[tuple[int, int], int],
     expected: dict[tuple[int, int], int] | None,
+    options: dict[str, typing.Any],
 ) -> None:
-    assert solve(size, blocked, known) == expected
+    assert solve(size, blocked, known, **options) == expected
 
 
+@pytest.mark.parametrize("options", _OPTIONS)
 @pytest.mark.parametrize(
     ("size", "blocked", "known"),
     [
@@ -51,6 +64,34 @@ def test_solve_raises_for_wrong_input(
     size: tuple[int, int],
     blocked: set[tuple[int, int]],
     known: dict[tuple[int, int], int],
+    options: dict[str, typing.Any],
 ) -> None:
     with pytest.raises(ValueError, match="Invalid input"):
-        solve(size, blocked, known)
+        solve(size, blocked, known, **options)
+
+
+def test_solve_raises_for_unknown_backend() -> None:
+    sample = samples.SAMPLE_1
+    with pytest.raises(ValueError, match="Unknown backend"):
+        solve(sample.size, sample.blocked, sample.known, backend="unknown")
+
+
+def test_solve_raises_for_unknown_encoding() -> None:
+    sample = samples.SAMPLE_1
+    with pytest.raises(ValueError, match="Unknown encoding"):
+        solve(sample.size, sample.blocked, sample.known, encoding="unknown")
+
+
+def test_solve_raises_on_timeout() -> None:
+    with pytest.raises(SolveTimeoutError):
+        solve((12, 12), set(), {}, timeout_ms=1)
+
+
+def test_native_solve_raises_on_timeout() -> None:
+    with pytest.raises(SolveTimeoutError, match="timeout"):
+        solve((16, 16), set(), {}, backend="native", timeout_ms=1)
+
+
+def test_native_solve_rejects_rlimit() -> None:
+    with pytest.raises(ValueError, match="rlimit requires the z3 backend"):
+        solve((3, 1), set(), {}, backend="native", rlimit=1000)
@@ -0,0 +1,127 @@
+import pytest
+
+from str8ts_solver.solver import SolverCache, SolveResult, solve_detailed
+
+from . import samples
+
+
+@pytest.mark.parametrize("encoding", ["int", "bitvec", "onehot"])
+@pytest.mark.parametrize("sample", samples.ALL_SAMPLES)
+def test_solve_detailed(sample: samples.Sample, encoding: str) -> None:
+    result = solve_detailed(
+        sample.size, sample.blocked, sample.known, encoding=encoding
+    )
+    assert result.solved == sample.solved
+    assert result.status == ("unsat" if sample.solved is None else "sat")
+    assert result.reason is None
+    assert {"create_solver", "check"} <= set(result.timings)
+    assert all(_ >= 0 for _ in result.timings.values())
+    assert result.statistics["max memory"] == result.memory > 0
+    assert min(result.conflicts, result.decisions, result.propagations) >= 0
+
+
+def test_solve_detailed_reports_phases() -> None:
+    sample = samples.SAMPLE_1
+    result = solve_detailed(sample.size, sample.blocked, sample.known)
+    assert set(result.timings) == {
+        "precheck",
+        "create_solver",
+        "check",
+        "read_solution",
+        "is_solution_valid",
+    }
+    assert result.num_constraints > 0
+    assert result.num_variables > 0
+
+
+@pytest.mark.parametrize(
+    "size, expected", [((9, 9), "int"), ((10, 10), "onehot"), ((16, 16), "onehot")]
+)
+def test_auto_encoding_depends_on_size(size: tuple[int, int], expected: str) -> None:
+    result = solve_detailed(size, set(), {})
+    assert result.status == "sat"
+    assert (
+        result.num_variables
+        == solve_detailed(size, set(), {}, encoding=expected).num_variables
+    )
+
+
+def test_solve_detailed_with_cache() -> None:
+    cache = SolverCache()
+    for sample in samples.ALL_SAMPLES:
+        result = solve_detailed(sample.size, sample.blocked, sample.known, cache=cache)
+        assert result.solved == sample.solved
+
+
+@pytest.mark.parametrize("encoding", ["int", "onehot"])
+def test_statistics_are_per_solve_with_cache(encoding: str) -> None:
+    sample = samples.SAMPLE_2
+    cache = SolverCache()
+    _, first, second = (
+        solve_detailed(
+            sample.size, sample.blocked, sample.known, encoding=encoding, cache=cache
+        )
+        for _ in range(3)
+    )
+    assert first.propagations > 0
+    assert (second.conflicts, second.decisions, second.propagations) == (
+        first.conflicts,
+        first.decisions,
+        first.propagations,
+    )
+
+
+def test_solve_detailed_with_native_backend() -> None:
+    sample = samples.SAMPLE_1
+    result = solve_detailed(sample.size, sample.blocked, sample.known, backend="native")
+    assert result.solved == sample.solved
+    assert set(result.timings) == {"precheck", "search", "is_solution_valid"}
+    assert not result.statistics
+
+
+def test_solve_detailed_reports_unknown() -> None:
+    result = solve_detailed((12, 12), set(), {}, timeout_ms=1)
+    assert result.status == "unknown"
+    assert result.solved is None
+    assert result.reason == "timeout"
+
+
+def test_solve_detailed_with_rlimit() -> None:
+    sample = samples.SAMPLE_1
+    cache = SolverCache()
+    for rlimit, status in [(1000, "unknown"), (10**7, "sat"), (None, "sat")]:
+        result = solve_detailed(
+            sample.size, sample.blocked, sample.known, cache=cache, rlimit=rlimit
+        )
+        assert result.status == status
+
+
+@pytest.mark.parametrize(
+    "size, blocked, known, reason",
+    [
+        ((3, 3), set(), {(0, 0): 1, (2, 0): 1}, "duplicate_in_row"),
+        ((3, 3), set(), {(0, 0): 1, (0, 2): 1}, "duplicate_in_column"),
+        ((3, 3), {(1, 0)}, {(1, 0): 1, (0, 0): 1}, "blocked_clue_in_row"),
+        ((2, 3), {(0, 1)}, {(0, 1): 2, (1, 1): 2}, "blocked_clue_in_row"),
+        ((2, 2), {(0, 0)}, {(0, 0): 2, (0, 1): 2}, "blocked_clue_in_column"),
+        ((4, 1), {(3, 0)}, {(0, 0): 1, (2, 0): 4}, "compartment_span_in_row"),
+        ((1, 4), {(0, 0)}, {(0, 1): 1, (0, 3): 4}, "compartment_span_in_column"),
+    ],
+)
+@pytest.mark.parametrize("backend", ["z3", "native"])
+def test_solve_detailed_rejects_contradictions(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+    reason: str,
+    backend: str,
+) -> None:
+    result = solve_detailed(size, blocked, known, backend=backend)
+    assert (result.status, result.reason, result.solved) == ("unsat", reason, None)
+    assert set(result.timings) == {"precheck"}
+
+
+def test_solve_result_repr() -> None:
+    result = SolveResult("unsat", {})
+    assert not hasattr(result, "__dict__")
+    assert repr(result) == "SolveResult(status='unsat', solved=None, timings={})"
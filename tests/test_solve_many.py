@@ -0,0 +1,72 @@
+import pytest
+
+from str8ts_solver.solver import BatchResult, solve_many
+
+from . import samples
+
+_SAMPLES = [
+    samples.SAMPLE_1,
+    samples.SAMPLE_2,
+    samples.NO_SOLUTION,
+    samples.SAMPLE_3_BY_2,
+    samples.FULLY_BLOCKED_COLUMN,
+    samples.FULLY_BLOCKED,
+]
+
+
+def _get_puzzles() -> list:
+    puzzles: list = [(_.size, _.blocked, _.known) for _ in _SAMPLES]
+    puzzles.insert(2, ((3, 4), set(), {(0, 0): 1000}))
+    return puzzles
+
+
+def _get_expected() -> list[BatchResult]:
+    expected = [
+        BatchResult(num, _.solved, None, "unsat" if _.solved is None else "sat")
+        for num, _ in enumerate(_SAMPLES)
+    ]
+    expected.insert(2, BatchResult(2, None, "Invalid input", "error"))
+    return [_._replace(item_num=num) for num, _ in enumerate(expected)]
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+@pytest.mark.parametrize("backend", ["z3", "native"])
+def test_solve_many_keeps_input_order(chunksize: int, backend: str) -> None:
+    results = solve_many(
+        _get_puzzles(), workers=2, chunksize=chunksize, backend=backend
+    )
+    assert list(results) == _get_expected()
+
+
+def test_solve_many_in_completion_order() -> None:
+    results = solve_many(_get_puzzles(), workers=2, chunksize=1, ordered=False)
+    assert sorted(results) == _get_expected()
+
+
+def test_solve_many_with_no_puzzles() -> None:
+    assert not list(solve_many([], workers=1))
+
+
+@pytest.mark.parametrize(
+    "size, rlimit",
+    [((10, 10), 1000), ((10, 10), 10000), ((12, 12), 50000), ((16, 16), 50000)],
+)
+def test_solve_many_reports_exceeded_limits(size: tuple[int, int], rlimit: int) -> None:
+    sample = samples.SAMPLE_3_BY_2
+    puzzles = [(size, set(), {}), (sample.size, sample.blocked, sample.known)]
+    results = list(solve_many(puzzles, workers=2, chunksize=1, rlimit=rlimit))
+    assert results == [
+        BatchResult(0, None, None, "unknown", "max. resource limit exceeded"),
+        BatchResult(1, sample.solved, None, "sat"),
+    ]
+
+
+def test_solve_many_reports_reason_apart_from_error() -> None:
+    puzzles: list = [
+        ((3, 1), set(), {(0, 0): 2, (2, 0): 2}),
+        ((3, 1), set(), {(0, 0): 9}),
+    ]
+    assert list(solve_many(puzzles, workers=1)) == [
+        BatchResult(0, None, None, "unsat", "duplicate_in_row"),
+        BatchResult(1, None, "Invalid input", "error"),
+    ]
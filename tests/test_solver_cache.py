@@ -0,0 +1,85 @@
+import pytest
+
+from str8ts_solver.solver import SolverCache, solve, solve_detailed
+
+from . import samples
+
+_SAMPLES = samples.ALL_SAMPLES
+
+
+@pytest.mark.parametrize("encoding", ["int", "bitvec", "onehot"])
+def test_solve_with_cache(encoding: str) -> None:
+    cache = SolverCache()
+    for _ in range(2):
+        for sample in _SAMPLES:
+            assert (
+                solve(
+                    sample.size,
+                    sample.blocked,
+                    sample.known,
+                    encoding=encoding,
+                    cache=cache,
+                )
+                == sample.solved
+            )
+    assert len(cache) == len(_SAMPLES)
+    assert (cache.hits, cache.misses, cache.evictions) == (
+        len(_SAMPLES),
+        len(_SAMPLES),
+        0,
+    )
+
+
+def test_cache_is_keyed_by_layout() -> None:
+    cache = SolverCache()
+    sample = samples.SAMPLE_3_BY_2
+    assert solve(sample.size, sample.blocked, {}, cache=cache) is not None
+    assert solve(sample.size, sample.blocked, sample.known, cache=cache) == (
+        sample.solved
+    )
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("encoding", ["int", "bitvec", "onehot"])
+def test_cache_keeps_domain_reduction(encoding: str) -> None:
+    sample = samples.SAMPLE_2
+    cache = SolverCache()
+    result = solve_detailed(
+        sample.size, sample.blocked, sample.known, encoding=encoding, cache=cache
+    )
+    assert result.solved == sample.solved
+    assert result.conflicts is not None and result.conflicts < 50
+
+
+@pytest.mark.parametrize("encoding", ["int", "bitvec", "onehot"])
+def test_cache_reports_contradiction(encoding: str) -> None:
+    sample = samples.NO_SOLUTION
+    cache = SolverCache()
+    for _ in range(2):
+        assert (
+            solve(
+                sample.size,
+                sample.blocked,
+                sample.known,
+                encoding=encoding,
+                cache=cache,
+            )
+            is None
+        )
+    assert solve(sample.size, sample.blocked, {}, encoding=encoding, cache=cache)
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = SolverCache(maxsize=2)
+    first, second, third = samples.SAMPLE_1, samples.SAMPLE_2, samples.SAMPLE_3
+    for sample in (first, second, first, third, first, second):
+        solve(sample.size, sample.blocked, sample.known, cache=cache)
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 4, 2)
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_raises_for_wrong_maxsize() -> None:
+    with pytest.raises(ValueError, match="maxsize"):
+        SolverCache(maxsize=0)
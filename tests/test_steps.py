@@ -0,0 +1,152 @@
+import pytest
+
+from str8ts_solver import steps as st
+
+from . import samples
+
+
+def _set_domains(engine: st.StepEngine, domains: dict[tuple[int, int], int]) -> None:
+    for pos, domain in domains.items():
+        engine.domains[engine.layout.cell_index[pos]] = domain
+
+
+@pytest.mark.parametrize(
+    "sample",
+    [
+        samples.SAMPLE_1,
+        samples.SAMPLE_2,
+        samples.SAMPLE_3,
+        samples.SAMPLE_3_BY_2,
+        samples.FULLY_BLOCKED_COLUMN,
+        samples.FULLY_BLOCKED,
+    ],
+)
+def test_steps_are_consistent_with_solution(sample: samples.Sample) -> None:
+    assert sample.solved is not None
+    engine = st.StepEngine(sample.size, sample.blocked, sample.known)
+    for step in engine.gen_steps():
+        if step.placement is not None:
+            assert sample.solved[step.placement[0]] == step.placement[1]
+        assert all(sample.solved[pos] != value for pos, value in step.eliminations)
+    assert engine.is_solved
+    assert engine.solved == sample.solved
+    assert engine.next_step() is None
+
+
+@pytest.mark.parametrize(
+    "sample",
+    [samples.SAMPLE_1, samples.SAMPLE_2, samples.SAMPLE_3, samples.SAMPLE_3_BY_2],
+)
+def test_gen_techniques_matches_gen_steps(sample: samples.Sample) -> None:
+    engine = st.StepEngine(sample.size, sample.blocked, sample.known)
+    techniques = list(engine.copy().gen_techniques())
+    assert techniques == [_.technique for _ in engine.gen_steps()]
+    assert techniques
+
+
+def test_naked_single() -> None:
+    engine = st.StepEngine((3, 3), set(), {})
+    _set_domains(engine, {(0, 0): 0b10})
+    assert engine.next_step() == st.Step(
+        technique="naked single",
+        cells=((0, 0),),
+        values=(1,),
+        placement=((0, 0), 1),
+        eliminations=(((1, 0), 1), ((2, 0), 1), ((0, 1), 1), ((0, 2), 1)),
+    )
+
+
+def test_required_digits() -> None:
+    engine = st.StepEngine((5, 1), {(2, 0)}, {})
+    _set_domains(engine, {(0, 0): 0b110000, (1, 0): 0b110000})
+    assert engine.next_step() == st.Step(
+        technique="required digits",
+        cells=((0, 0), (1, 0)),
+        values=(4, 5),
+        placement=None,
+        eliminations=(((3, 0), 4), ((3, 0), 5), ((4, 0), 4), ((4, 0), 5)),
+    )
+
+
+def test_naked_pair() -> None:
+    engine = st.StepEngine((4, 4), set(), {})
+    _set_domains(engine, {(0, 0): 0b110, (1, 0): 0b110})
+    assert engine.next_step() == st.Step(
+        technique="naked pair",
+        cells=((0, 0), (1, 0)),
+        values=(1, 2),
+        placement=None,
+        eliminations=(((2, 0), 1), ((2, 0), 2), ((3, 0), 1), ((3, 0), 2)),
+    )
+
+
+def test_hidden_pair() -> None:
+    engine = st.StepEngine((5, 5), set(), {})
+    _set_domains(engine, {(0, 0): 0b1110, (1, 0): 0b1110, (2, 0): 0b1110})
+    step = engine.next_step()
+    assert step == st.Step(
+        technique="hidden pair",
+        cells=((3, 0), (4, 0)),
+        values=(4, 5),
+        placement=None,
+        eliminations=tuple(((col, 0), _) for col in (3, 4) for _ in (1, 2, 3)),
+    )
+    engine.apply(step)
+    assert engine.candidates((3, 0)) == [4, 5]
+
+
+def test_place() -> None:
+    engine = st.StepEngine((4, 4), set(), {})
+    engine.place((0, 0), 1)
+    assert engine.solved == {(0, 0): 1}
+    assert engine.candidates((1, 0)) == [2, 3, 4]
+    assert engine.candidates((0, 1)) == [2, 3, 4]
+    with pytest.raises(ValueError, match="Value is not a candidate"):
+        engine.place((1, 0), 1)
+
+
+@pytest.mark.parametrize(
+    "size, blocked, known",
+    [
+        (
+            samples.NO_SOLUTION.size,
+            samples.NO_SOLUTION.blocked,
+            samples.NO_SOLUTION.known,
+        ),
+        ((2, 2), set(), {(0, 0): 1, (1, 0): 1}),
+    ],
+)
+def test_unsolvable_puzzle_raises(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> None:
+    with pytest.raises(ValueError, match="Puzzle has no solution"):
+        list(st.StepEngine(size, blocked, known).gen_steps())
+
+
+@pytest.mark.parametrize(
+    "size, blocked, known",
+    [
+        ((2, 2), set(), {(0, 0): 3}),
+        ((3, 3), set(), {(0, 0): 50}),
+        ((3, 3), {(0, 0)}, {(0, 0): 50}),
+        ((3, 3), {(3, 0)}, {}),
+    ],
+)
+def test_invalid_input_raises(
+    size: tuple[int, int],
+    blocked: set[tuple[int, int]],
+    known: dict[tuple[int, int], int],
+) -> None:
+    with pytest.raises(ValueError, match="Invalid input"):
+        st.StepEngine(size, blocked, known)
+
+
+def test_copy_is_independent() -> None:
+    engine = st.StepEngine((4, 4), set(), {})
+    branch = engine.copy()
+    branch.place((0, 0), 1)
+    assert not engine.solved
+    assert engine.candidates((1, 0)) == [1, 2, 3, 4]
+    assert branch.candidates((1, 0)) == [2, 3, 4]
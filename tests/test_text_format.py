@@ -0,0 +1,96 @@
+import io
+
+import pytest
+
+from str8ts_solver import text_format as tf
+from str8ts_solver.grid import Grid, Puzzle
+from str8ts_solver.solver import solve_puzzle
+
+from . import samples
+
+_SAMPLES = samples.ALL_SAMPLES
+
+
+def _to_puzzle(sample: samples.Sample) -> Puzzle:
+    return Puzzle.from_dicts(sample.size, sample.blocked, sample.known)
+
+
+@pytest.mark.parametrize("sample", _SAMPLES)
+def test_puzzle_round_trip(sample: samples.Sample) -> None:
+    puzzle = _to_puzzle(sample)
+    line = tf.format_puzzle(puzzle)
+    assert len(line) == len(f"{puzzle.width}x{puzzle.height}:") + len(puzzle.cells)
+    assert tf.parse_puzzle(line) == puzzle
+
+
+@pytest.mark.parametrize("sample", _SAMPLES)
+def test_solution_round_trip(sample: samples.Sample) -> None:
+    puzzle = _to_puzzle(sample)
+    grid = None
+    if sample.solved is not None:
+        grid = Grid.from_dict(sample.size, sample.solved)
+    assert tf.parse_solution(tf.format_solution(puzzle, grid)) == (sample.size, grid)
+
+
+def test_format_puzzle() -> None:
+    puzzle = Puzzle.from_dicts((3, 2), {(0, 0), (2, 1)}, {(2, 1): 2, (1, 1): 3})
+    assert tf.format_puzzle(puzzle) == "3x2:#...3b"
+
+
+def test_format_solution() -> None:
+    puzzle = Puzzle.from_dicts((3, 2), {(0, 0), (2, 1)}, {(2, 1): 2})
+    grid = Grid.from_dict((3, 2), {(1, 0): 2, (2, 0): 1, (0, 1): 1, (1, 1): 3})
+    assert tf.format_solution(puzzle, grid) == "3x2:#2113b"
+    assert tf.format_solution(puzzle, None) == "3x2:-"
+
+
+def test_iter_puzzles_streams_lines() -> None:
+    puzzles = [_to_puzzle(_) for _ in _SAMPLES]
+    buffer = io.StringIO()
+    assert tf.write_puzzles(buffer, puzzles) == len(puzzles)
+    buffer.seek(0)
+    assert list(tf.iter_puzzles(buffer)) == puzzles
+
+
+def test_iter_puzzles_skips_blank_lines() -> None:
+    puzzle = _to_puzzle(samples.SAMPLE_1)
+    lines = ["\n", tf.format_puzzle(puzzle) + "\r\n", "   \n"]
+    assert list(tf.iter_puzzles(lines)) == [puzzle]
+
+
+def test_write_solutions() -> None:
+    puzzles = [_to_puzzle(_) for _ in _SAMPLES]
+    buffer = io.StringIO()
+    count = tf.write_solutions(buffer, ((_, solve_puzzle(_)) for _ in puzzles))
+    assert count == len(puzzles)
+    lines = buffer.getvalue().splitlines()
+    assert [tf.parse_solution(_)[1] for _ in lines] == [
+        None if _.solved is None else Grid.from_dict(_.size, _.solved) for _ in _SAMPLES
+    ]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "",
+        "3x2",
+        "3x:......",
+        "x2:......",
+        "-3x2:......",
+        "3y2:......",
+        "3x2:.....",
+        "3x2:.......",
+        "3x2:.....?",
+        "3x2:.....4",
+        "3x2:.....d",
+        "3x2:.....é",
+    ],
+)
+def test_parse_puzzle_raises_for_wrong_input(line: str) -> None:
+    with pytest.raises(ValueError, match="Invalid input"):
+        tf.parse_puzzle(line)
+
+
+def test_format_puzzle_raises_for_unsupported_clue() -> None:
+    with pytest.raises(ValueError, match="Invalid input"):
+        tf.format_puzzle(Puzzle(30, 1, bytes([27] + [0] * 29)))